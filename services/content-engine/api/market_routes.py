@@ -0,0 +1,88 @@
+# services/content-engine/api/market_routes.py
+"""Market history API routes — serve intraday series from the in-memory store."""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from core.market_store import INTERVALS, MarketStore
+from middleware.auth import verify_api_key
+from models.responses import APIResponse
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/market", tags=["market"])
+
+
+def _store(request: Request) -> MarketStore:
+    pipeline = getattr(request.app.state, "pipeline", None)
+    if pipeline is None:
+        raise HTTPException(status_code=503, detail="Pipeline not initialized")
+    return pipeline.market_store
+
+
+@router.get("/symbols", dependencies=[Depends(verify_api_key)])
+async def list_symbols(request: Request):
+    """Symbols with stored history and their latest sample."""
+    symbols = _store(request).symbols()
+    return APIResponse(data=symbols, message=f"{len(symbols)} symbols")
+
+
+@router.get("/stats", dependencies=[Depends(verify_api_key)])
+async def store_stats(request: Request):
+    """Store size and memory footprint."""
+    return APIResponse(data=_store(request).stats(), message="Market store stats")
+
+
+@router.get("/anomalies", dependencies=[Depends(verify_api_key)])
+async def recent_anomalies(request: Request):
+    """Anomaly detector settings and recently flagged moves."""
+    pipeline = getattr(request.app.state, "pipeline", None)
+    if pipeline is None:
+        raise HTTPException(status_code=503, detail="Pipeline not initialized")
+    return APIResponse(data=pipeline.anomalies.stats(), message="Market anomalies")
+
+
+@router.get("/{symbol}/latest", dependencies=[Depends(verify_api_key)])
+async def latest_quote(request: Request, symbol: str):
+    """Most recent stored sample for a symbol."""
+    series = _store(request).get(symbol)
+    if series is None or not len(series):
+        raise HTTPException(status_code=404, detail=f"No history for {symbol}")
+    return APIResponse(data={"symbol": symbol, "name": series.name, **series.latest()})
+
+
+@router.get("/{symbol}/history", dependencies=[Depends(verify_api_key)])
+async def symbol_history(
+    request: Request,
+    symbol: str,
+    interval: str = Query("raw", description="raw | " + " | ".join(INTERVALS)),
+    since: Optional[float] = Query(None, description="Unix seconds (inclusive)"),
+    until: Optional[float] = Query(None, description="Unix seconds (inclusive)"),
+    limit: int = Query(500, ge=1, le=5000),
+):
+    """Raw samples or OHLC bars for a symbol, newest ``limit`` points."""
+    if interval != "raw" and interval not in INTERVALS:
+        raise HTTPException(status_code=400, detail=f"Unknown interval '{interval}'")
+    series = _store(request).get(symbol)
+    if series is None:
+        raise HTTPException(status_code=404, detail=f"No history for {symbol}")
+
+    if interval == "raw":
+        points = series.rows(since, until)
+    else:
+        points = series.ohlc(interval, since, until)
+    points = points[-limit:]
+
+    return APIResponse(
+        data={
+            "symbol": symbol,
+            "name": series.name,
+            "currency": series.currency,
+            "interval": interval,
+            "points": points,
+        },
+        message=f"{len(points)} points",
+    )
@@ -4,11 +4,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from dataclasses import asdict
+from typing import Any, Dict, List, Tuple
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import BaseModel, HttpUrl
 
-from middleware.auth import verify_api_key
+from middleware.auth import OptionalAPIKey, verify_api_key
+from models.market import TradingViewConfig
 from models.responses import APIResponse, ScrapingStatusResponse
 from scraping.rss_scraper import DEFAULT_RSS_SOURCES, RSSScraper
 from scraping.newsapi_scraper import NewsAPIScraper
@@ -19,47 +22,149 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/scraping", tags=["scraping"])
 
 
-@router.get("/sources", response_model=ScrapingStatusResponse)
-async def list_sources():
-    """List all configured scraping sources and their statuses."""
-    settings = get_settings()
+def _shared_http(request: Request):
+    """The pipeline's pooled HTTP client, if the engine is fully started."""
+    pipeline = getattr(request.app.state, "pipeline", None)
+    return pipeline.http if pipeline else None
+
+
+def _pipeline(request: Request):
+    pipeline = getattr(request.app.state, "pipeline", None)
+    if pipeline is None:
+        raise HTTPException(status_code=503, detail="Pipeline not initialized")
+    return pipeline
+
+
+def _registry_page(
+    pipeline, limit: int, offset: int, detailed: bool
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """One page of registry feeds plus the RSS totals: ``(sources, total, active)``."""
+    schedule = pipeline.poll_schedule
+    health = pipeline.source_health
+    registry = pipeline.registry
     sources = []
 
-    for src in DEFAULT_RSS_SOURCES:
-        sources.append({
-            "name": src["name"],
-            "url": src["url"],
+    # Only the requested page is read; totals come from COUNT queries and the
+    # (few) open breakers
+    feeds = registry.all(limit=limit, offset=offset)
+    rss_total = registry.count()
+    rss_active = registry.count(enabled_only=True) - sum(
+        1 for url in health.open_urls() if (feed := registry.get(url)) and feed["enabled"]
+    )
+    for feed in feeds:
+        entry = {
+            **feed,
             "type": "rss",
-            "active": True,
-        })
+            "active": feed["enabled"] and not health.is_open(feed["url"]),
+        }
+        if detailed:
+            entry["health"] = health.describe(feed["url"])
+            if feed["shard"] != registry.shard_index:
+                entry["polled_by"] = f"shard {feed['shard']}"
+            else:
+                if schedule:
+                    entry["schedule"] = schedule.describe(feed["url"])
+                if pipeline.websub and (push := pipeline.websub.describe(feed["url"])):
+                    entry["websub"] = push
+        sources.append(entry)
+    return sources, rss_total, rss_active
+
+
+class FeedRequest(BaseModel):
+    name: str
+    url: HttpUrl
+    enabled: bool = True
+
+
+@router.get("/sources", response_model=ScrapingStatusResponse)
+async def list_sources(
+    request: Request,
+    limit: int = Query(500, ge=1, le=5000),
+    offset: int = Query(0, ge=0),
+    auth: OptionalAPIKey = Depends(),
+):
+    """List scraping sources and their statuses (RSS feeds paginated from the registry).
 
-    sources.append({
+    Before the pipeline is up, the configured default feeds are listed.
+    Breaker, poll-schedule and WebSub details are only shown to
+    authenticated callers.
+    """
+    settings = get_settings()
+    pipeline = getattr(request.app.state, "pipeline", None)
+    if pipeline is None:
+        sources = [
+            {"name": src["name"], "url": src["url"], "type": "rss", "active": True}
+            for src in DEFAULT_RSS_SOURCES[offset:offset + limit]
+        ]
+        rss_total = rss_active = len(DEFAULT_RSS_SOURCES)
+    else:
+        sources, rss_total, rss_active = _registry_page(pipeline, limit, offset, auth.authenticated)
+    others = []
+
+    others.append({
         "name": "NewsAPI",
         "url": "https://newsapi.org/v2",
         "type": "newsapi",
         "active": bool(settings.news_api_key),
     })
 
-    sources.append({
-        "name": "TradingView",
-        "url": "https://in.tradingview.com/markets/indices",
-        "type": "tradingview",
-        "active": True,
-    })
+    for region, url in TradingViewScraper.region_pages(
+        TradingViewConfig.from_settings(settings).regions
+    ).items():
+        others.append({
+            "name": f"TradingView ({region})",
+            "url": url,
+            "type": "tradingview",
+            "active": True,
+        })
 
     return ScrapingStatusResponse(
-        total_sources=len(sources),
-        active_sources=sum(1 for s in sources if s["active"]),
-        sources=sources,
+        total_sources=rss_total + len(others),
+        active_sources=rss_active + sum(1 for s in others if s["active"]),
+        sources=sources + others,
     )
 
 
+@router.post("/sources", dependencies=[Depends(verify_api_key)])
+async def add_source(request: Request, req: FeedRequest):
+    """Register (or update) an RSS feed; picked up by the next run of its shard."""
+    feed = _pipeline(request).registry.add(req.name, str(req.url), req.enabled)
+    return APIResponse(data=feed, message=f"Feed registered on shard {feed['shard']}")
+
+
+@router.delete("/sources", dependencies=[Depends(verify_api_key)])
+async def remove_source(request: Request, url: str = Query(...)):
+    """Remove an RSS feed from the registry."""
+    if not _pipeline(request).registry.remove(url):
+        raise HTTPException(status_code=404, detail="Feed not found")
+    return APIResponse(data={"url": url}, message="Feed removed")
+
+
+@router.get("/stats", dependencies=[Depends(verify_api_key)])
+async def scraping_stats(request: Request):
+    """Scraper-layer metrics of the running pipeline (HTTP cache hit rate, …)."""
+    pipeline = getattr(request.app.state, "pipeline", None)
+    if pipeline is None:
+        raise HTTPException(status_code=503, detail="Pipeline not initialized")
+    return APIResponse(data=pipeline.scraping_stats(), message="Scraping stats")
+
+
 @router.post("/rss", dependencies=[Depends(verify_api_key)])
 async def trigger_rss_scrape(
+    request: Request,
     max_per_source: int = Query(5, ge=1, le=50),
 ):
     """Trigger an RSS scrape and return raw articles (without AI processing)."""
-    scraper = RSSScraper()
+    settings = get_settings()
+    pipeline = getattr(request.app.state, "pipeline", None)
+    scraper = RSSScraper(
+        concurrency=settings.rss_concurrency,
+        per_host_limit=settings.rss_per_host_limit,
+        http=_shared_http(request),
+        registry=pipeline.registry if pipeline else None,
+        parser=settings.rss_parser,
+        max_bytes=settings.rss_max_kb * 1024,
+    )
     articles = await scraper.fetch(max_per_source=max_per_source)
     return APIResponse(
         data={
@@ -74,6 +179,7 @@ async def trigger_rss_scrape(
                 }
                 for a in articles
             ],
+            "sources": [asdict(r) for r in scraper.last_report],
         },
         message=f"Scraped {len(articles)} articles from RSS feeds",
     )
@@ -81,11 +187,19 @@ async def trigger_rss_scrape(
 
 @router.post("/newsapi", dependencies=[Depends(verify_api_key)])
 async def trigger_newsapi_scrape(
+    request: Request,
     max_articles: int = Query(20, ge=1, le=100),
 ):
-    """Trigger a NewsAPI scrape and return raw articles."""
-    settings = get_settings()
-    scraper = NewsAPIScraper(api_key=settings.news_api_key)
+    """Trigger a NewsAPI scrape and return raw articles.
+
+    Uses the pipeline's scraper so repeated calls share its response cache
+    and daily quota.
+    """
+    pipeline = getattr(request.app.state, "pipeline", None)
+    if pipeline is not None:
+        scraper = pipeline.newsapi
+    else:
+        scraper = NewsAPIScraper(api_key=get_settings().news_api_key)
     articles = await scraper.fetch(max_articles=max_articles)
     return APIResponse(
         data={
@@ -109,12 +223,13 @@ async def trigger_market_scrape(
     limit: int = Query(50, ge=1, le=500),
 ):
     """Trigger a TradingView market data scrape."""
-    scraper = TradingViewScraper(limit=limit)
+    scraper = TradingViewScraper(limit=limit, config=TradingViewConfig.from_settings(get_settings()))
     quotes = await scraper.fetch_and_format()
     return APIResponse(
         data={
             "count": len(quotes),
             "sample": quotes[:5],
+            "regions": [asdict(r) for r in scraper.last_report],
         },
         message=f"Scraped {len(quotes)} market indices",
     )
@@ -0,0 +1,111 @@
+# services/content-engine/api/websub_routes.py
+"""WebSub callback routes — hub verification and pushed feed content.
+
+The callback routes are called by the hubs, not by admin-backend, so they
+take no API key.  Each subscription has its own unguessable token in the
+path, and content deliveries must carry a valid ``X-Hub-Signature``.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import PlainTextResponse
+
+from middleware.auth import verify_api_key
+from models.responses import APIResponse
+from scraping.websub import WebSubSubscriber
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/websub", tags=["websub"])
+
+
+def _pipeline(request: Request):
+    pipeline = getattr(request.app.state, "pipeline", None)
+    if pipeline is None:
+        raise HTTPException(status_code=503, detail="Pipeline not initialized")
+    return pipeline
+
+
+def _websub(request: Request) -> WebSubSubscriber:
+    websub = _pipeline(request).websub
+    if websub is None:
+        raise HTTPException(status_code=404, detail="WebSub is disabled")
+    return websub
+
+
+def _declared_charset(content_type: str) -> Optional[str]:
+    """``charset`` parameter of a Content-Type header, if any."""
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            return value.strip().strip('"') or None
+    return None
+
+
+async def _read_capped(request: Request, limit: int) -> bytes:
+    """The request body, or 413 once it exceeds ``limit`` bytes.
+
+    A declared ``Content-Length`` over the limit is refused before reading;
+    otherwise the body is read chunk by chunk and dropped at the limit.
+    """
+    declared = request.headers.get("Content-Length", "")
+    if declared.isdigit() and int(declared) > limit:
+        raise HTTPException(status_code=413, detail=f"Body exceeds {limit // 1024} KiB")
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            raise HTTPException(status_code=413, detail=f"Body exceeds {limit // 1024} KiB")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@router.get("/subscriptions", dependencies=[Depends(verify_api_key)])
+async def list_subscriptions(request: Request):
+    """Feeds with a discovered hub and their subscription state."""
+    websub = _websub(request)
+    subs = []
+    for feed in _pipeline(request).registry.for_shard():
+        sub = websub.describe(feed["url"])
+        if sub:
+            subs.append({"feed_url": feed["url"], "name": feed["name"], **sub})
+    return APIResponse(data={"stats": websub.stats(), "subscriptions": subs}, message=f"{len(subs)} feeds with a hub")
+
+
+@router.get("/callback/{token}", response_class=PlainTextResponse)
+async def verify_intent(
+    request: Request,
+    token: str,
+    mode: str = Query(..., alias="hub.mode"),
+    topic: str = Query(..., alias="hub.topic"),
+    challenge: str = Query("", alias="hub.challenge"),
+    lease_seconds: Optional[int] = Query(None, alias="hub.lease_seconds"),
+):
+    """Hub verification of (un)subscribe intent — echo the challenge if we asked for it."""
+    answer = _websub(request).verify(token, mode, topic, challenge, lease_seconds)
+    if answer is None:
+        raise HTTPException(status_code=404, detail="Unknown subscription")
+    return answer
+
+
+@router.post("/callback/{token}", status_code=202)
+async def content_distribution(request: Request, token: str):
+    """Pushed feed content → a background ``push`` pipeline run.
+
+    Answers 2xx quickly even when the signature is wrong (as WebSub
+    requires); such bodies are dropped.  Bodies larger than a polled feed
+    may be (``RSS_MAX_KB``) get 413 before any signature is computed.
+    """
+    websub = _websub(request)
+    if not websub.knows(token):
+        raise HTTPException(status_code=410, detail="Unknown subscription")
+    body = await _read_capped(request, _pipeline(request).rss.max_bytes)
+    feed_url = websub.authenticate(token, body, request.headers.get("X-Hub-Signature"))
+    charset = _declared_charset(request.headers.get("Content-Type", ""))
+    if feed_url and not _pipeline(request).accept_push(feed_url, body, charset):
+        logger.info("WebSub delivery for %s ignored (not an enabled feed of this shard)", feed_url)
+    return Response(status_code=202)
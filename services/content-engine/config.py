@@ -47,12 +47,74 @@ class Settings(BaseSettings):
 
     # ── News Sources ──────────────────────────────────────────
     news_api_key: str = Field("", alias="NEWS_API_KEY")
+    newsapi_article_budget: int = Field(20, alias="NEWSAPI_ARTICLE_BUDGET")
+    newsapi_cache_ttl_s: int = Field(900, alias="NEWSAPI_CACHE_TTL_S")
+    newsapi_daily_limit: int = Field(100, alias="NEWSAPI_DAILY_LIMIT")
+    newsapi_quota_reserve: int = Field(5, alias="NEWSAPI_QUOTA_RESERVE")
+
+    # ── Scraping ──────────────────────────────────────────────
+    rss_concurrency: int = Field(8, alias="RSS_CONCURRENCY")
+    rss_per_host_limit: int = Field(2, alias="RSS_PER_HOST_LIMIT")
+    rss_adaptive_polling: bool = Field(True, alias="RSS_ADAPTIVE_POLLING")
+    rss_poll_min_minutes: int = Field(5, alias="RSS_POLL_MIN_MINUTES")
+    rss_poll_max_minutes: int = Field(240, alias="RSS_POLL_MAX_MINUTES")
+    # "feedparser" or "stream" (lxml pull parser, falls back to feedparser on malformed XML)
+    rss_parser: str = Field("feedparser", alias="RSS_PARSER")
+    # Feed bodies are read up to this size; longer ones are truncated
+    rss_max_kb: int = Field(2048, alias="RSS_MAX_KB")
+    # Feed registry sharding — run one engine per shard (SHARD_INDEX 0..SHARD_COUNT-1)
+    shard_index: int = Field(0, alias="SHARD_INDEX")
+    shard_count: int = Field(1, alias="SHARD_COUNT")
+    # Per-feed circuit breaker / adaptive timeouts
+    source_failure_threshold: int = Field(3, alias="SOURCE_FAILURE_THRESHOLD")
+    source_cooldown_minutes: int = Field(5, alias="SOURCE_COOLDOWN_MINUTES")
+    source_max_cooldown_minutes: int = Field(360, alias="SOURCE_MAX_COOLDOWN_MINUTES")
+    source_timeout_floor_s: float = Field(5.0, alias="SOURCE_TIMEOUT_FLOOR_S")
+    source_timeout_cap_s: float = Field(30.0, alias="SOURCE_TIMEOUT_CAP_S")
+    # WebSub push — public base URL hubs call back (empty disables push)
+    websub_callback_base_url: str = Field("", alias="WEBSUB_CALLBACK_BASE_URL")
+    websub_lease_seconds: int = Field(86400, alias="WEBSUB_LEASE_SECONDS")
+    fulltext_enabled: bool = Field(False, alias="FULLTEXT_ENABLED")
+    fulltext_concurrency: int = Field(6, alias="FULLTEXT_CONCURRENCY")
+    fulltext_per_host_limit: int = Field(2, alias="FULLTEXT_PER_HOST_LIMIT")
+    fulltext_max_kb: int = Field(1024, alias="FULLTEXT_MAX_KB")
+    fulltext_below_words: int = Field(150, alias="FULLTEXT_BELOW_WORDS")
+    parse_workers: int = Field(2, alias="PARSE_WORKERS")
+
+    # Comma-separated TradingView regions (all, major, americas, europe, asia; aliases like us/eu/in)
+    tradingview_regions: str = Field("all", alias="TRADINGVIEW_REGIONS")
+    tradingview_retry_count: int = Field(2, alias="TRADINGVIEW_RETRY_COUNT")
+    tradingview_retry_delay_s: float = Field(5.0, alias="TRADINGVIEW_RETRY_DELAY_S")
+
+    # ── Shared HTTP pool (scrapers) ───────────────────────────
+    http_pool_limit: int = Field(100, alias="HTTP_POOL_LIMIT")
+    http_pool_per_host: int = Field(10, alias="HTTP_POOL_PER_HOST")
+    http_dns_ttl_s: int = Field(300, alias="HTTP_DNS_TTL_S")
+    http_compress: bool = Field(True, alias="HTTP_COMPRESS")
 
     # ── Scheduler intervals ───────────────────────────────────
     enable_scheduler: bool = Field(True, alias="ENABLE_SCHEDULER")
     news_interval_minutes: int = Field(30, alias="NEWS_INTERVAL_MINUTES")
     market_interval_minutes: int = Field(15, alias="MARKET_INTERVAL_MINUTES")
+    market_delta_epsilon: float = Field(1e-4, alias="MARKET_DELTA_EPSILON")
+    market_full_resync_minutes: int = Field(360, alias="MARKET_FULL_RESYNC_MINUTES")
+    market_history_points: int = Field(2880, alias="MARKET_HISTORY_POINTS")
+    market_anomaly_window: int = Field(96, alias="MARKET_ANOMALY_WINDOW")
+    market_anomaly_min_samples: int = Field(20, alias="MARKET_ANOMALY_MIN_SAMPLES")
+    market_anomaly_z: float = Field(3.0, alias="MARKET_ANOMALY_Z")
+    market_anomaly_cooldown_minutes: int = Field(60, alias="MARKET_ANOMALY_COOLDOWN_MINUTES")
+    market_anomaly_min_std: float = Field(0.1, alias="MARKET_ANOMALY_MIN_STD")
+    market_anomaly_max_per_tick: int = Field(3, alias="MARKET_ANOMALY_MAX_PER_TICK")
+    market_anomaly_max_per_day: int = Field(20, alias="MARKET_ANOMALY_MAX_PER_DAY")
+    breaking_news_enabled: bool = Field(True, alias="BREAKING_NEWS_ENABLED")
+    breaking_news_articles: int = Field(10, alias="BREAKING_NEWS_ARTICLES")
     max_articles_per_run: int = Field(50, alias="MAX_ARTICLES_PER_RUN")
+    dedup_retention_days: int = Field(14, alias="DEDUP_RETENTION_DAYS")
+    dedup_bloom_error_rate: float = Field(0.001, alias="DEDUP_BLOOM_ERROR_RATE")
+    # Near-duplicate filter (MinHash + LSH over article text)
+    dedup_near_enabled: bool = Field(True, alias="DEDUP_NEAR_ENABLED")
+    dedup_near_threshold: float = Field(0.8, alias="DEDUP_NEAR_THRESHOLD")
+    dedup_near_capacity: int = Field(50_000, alias="DEDUP_NEAR_CAPACITY")
     default_timezone: str = Field("UTC", alias="DEFAULT_TIMEZONE")
 
     # ── Redis ─────────────────────────────────────────────────
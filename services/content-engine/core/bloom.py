@@ -0,0 +1,144 @@
+# services/content-engine/core/bloom.py
+"""Scalable Bloom filter over 64-bit fingerprints.
+
+A ``BloomFilter`` is sized from a capacity and a target false-positive rate
+(``m = -n·ln p / ln²2`` bits, ``k = m/n·ln 2`` probes).  Keys are already
+uniform 64-bit hashes (``FingerprintStore`` fingerprints), so the probe
+positions come from double hashing the two 32-bit halves; no further
+hashing is needed.
+
+``ScalableBloomFilter`` (Almeida et al., 2007) adds a new filter, ``GROWTH``
+times larger with a ``TIGHTENING`` times lower error rate, whenever the
+current one is full.  The first filter gets ``error_rate·(1 − TIGHTENING)``,
+so the compound false-positive rate stays below ``error_rate`` however many
+items are added.
+
+Membership answers are "definitely not present" or "maybe present";
+callers confirm a maybe against the exact store.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from typing import Any, Dict, List
+
+MAGIC = b"CEBF\x00\x00\x00\x01"
+# Each lookup checks every filter, so the chain is kept short
+GROWTH = 4
+TIGHTENING = 0.5
+
+_HEADER = struct.Struct("<QdQQI")  # capacity, error_rate, count, bits, probes
+
+
+class BloomFilter:
+    """Fixed-capacity Bloom filter; keys are ints in ``[0, 2**64)``."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.m = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.k = max(1, round(self.m / self.capacity * math.log(2)))
+        self.count = 0
+        self.bits = bytearray((self.m + 7) // 8)
+
+    def __contains__(self, fp: int) -> bool:
+        bits, m = self.bits, self.m
+        h1, h2 = fp & 0xFFFFFFFF, (fp >> 32) | 1
+        for i in range(self.k):
+            pos = (h1 + i * h2) % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def add(self, fp: int) -> None:
+        bits, m = self.bits, self.m
+        h1, h2 = fp & 0xFFFFFFFF, (fp >> 32) | 1
+        for i in range(self.k):
+            pos = (h1 + i * h2) % m
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def fill_ratio(self) -> float:
+        return int.from_bytes(self.bits, "little").bit_count() / self.m
+
+    def false_positive_rate(self) -> float:
+        """Estimated from the fill ratio: ``fill ** k``."""
+        return self.fill_ratio() ** self.k
+
+
+class ScalableBloomFilter:
+    """Chain of ``BloomFilter``s that grows with the number of items."""
+
+    def __init__(self, initial_capacity: int = 10_000, error_rate: float = 0.001) -> None:
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.filters: List[BloomFilter] = []
+
+    def __contains__(self, fp: int) -> bool:
+        for f in reversed(self.filters):
+            if fp in f:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return sum(f.count for f in self.filters)
+
+    def add(self, fp: int) -> None:
+        """Add ``fp`` (callers add new keys only; a repeat is counted twice)."""
+        if not self.filters or self.filters[-1].full:
+            n = len(self.filters)
+            self.filters.append(
+                BloomFilter(self.initial_capacity * GROWTH**n, self.error_rate * (1 - TIGHTENING) * TIGHTENING**n)
+            )
+        self.filters[-1].add(fp)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(f.bits) for f in self.filters)
+
+    def stats(self) -> Dict[str, Any]:
+        miss = 1.0
+        for f in self.filters:
+            miss *= 1 - f.false_positive_rate()
+        return {
+            "items": len(self),
+            "filters": len(self.filters),
+            "capacity": sum(f.capacity for f in self.filters),
+            "fill_ratio": round(self.filters[-1].fill_ratio(), 4) if self.filters else 0.0,
+            "estimated_fp_rate": round(1 - miss, 6),
+            "memory_kb": round(self.nbytes / 1024, 1),
+        }
+
+    def to_bytes(self) -> bytes:
+        parts = [MAGIC, struct.pack("<QdI", self.initial_capacity, self.error_rate, len(self.filters))]
+        for f in self.filters:
+            parts.append(_HEADER.pack(f.capacity, f.error_rate, f.count, f.m, f.k))
+            parts.append(bytes(f.bits))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "ScalableBloomFilter":
+        if raw[: len(MAGIC)] != MAGIC:
+            raise ValueError("not a Bloom filter file")
+        offset = len(MAGIC)
+        initial, error_rate, n = struct.unpack_from("<QdI", raw, offset)
+        offset += struct.calcsize("<QdI")
+        sbf = cls(initial, error_rate)
+        for _ in range(n):
+            capacity, rate, count, m, k = _HEADER.unpack_from(raw, offset)
+            offset += _HEADER.size
+            f = BloomFilter(capacity, rate)
+            if (f.m, f.k) != (m, k):
+                raise ValueError("Bloom filter geometry mismatch")
+            f.count = count
+            f.bits = bytearray(raw[offset:offset + len(f.bits)])
+            if len(f.bits) != (m + 7) // 8:
+                raise ValueError("truncated Bloom filter")
+            offset += len(f.bits)
+            sbf.filters.append(f)
+        return sbf
@@ -1,8 +1,21 @@
 # services/content-engine/core/deduplication.py
 """Content deduplication — prevent duplicate articles from entering the DB.
 
-Uses MD5 of lowercased title as the primary key; keeps an in-memory set
-that is populated at startup from the admin-backend or a local cache file.
+Articles are checked first by canonical URL (``utils.url_canon``: tracking
+parameters, AMP variants, scheme and host aliases folded), then by the
+first 64 bits of the MD5 of the lowercased title.  Both kinds of key live
+in ``FingerprintStore`` files (memory-mapped sorted file + append log, 8
+bytes per key), one per UTC day, so startup does not parse a cache and
+shutdown only appends the keys seen since.  Days older than the retention
+window are deleted whole.  Each day has a Bloom filter in front (~2 bytes
+per key), so a new key is usually ruled out without touching the exact
+store.  A legacy ``seen_hashes.json`` is imported once.
+
+Articles with a new title are then checked against a MinHash / LSH index
+of recent article text (``core.near_duplicates``), which catches the same
+wire story under a reworded headline.  The headline itself is only
+shingled for teasers shorter than ``NEAR_MIN_WORDS``.  That index is
+in-memory only and refills as articles pass through.
 """
 
 from __future__ import annotations
@@ -11,63 +24,121 @@ import hashlib
 import json
 import logging
 from pathlib import Path
-from typing import List, Set
+from typing import Any, Dict, List, Optional
 
 from scraping.base import ScrapingResult
+from utils.url_canon import url_fingerprint
+
+from .fingerprint_store import FingerprintGenerations
+from .near_duplicates import NearDuplicateIndex
 
 logger = logging.getLogger(__name__)
 
-CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "seen_hashes.json"
+CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "seen_hashes.bin"
+URL_CACHE_PATH = CACHE_PATH.with_name("seen_urls.bin")
+# Content at least this long is compared without its (often rewritten) title
+NEAR_MIN_WORDS = 30
 
 
 class Deduplicator:
-    """In-memory + file-backed deduplication layer."""
-
-    def __init__(self) -> None:
-        self._seen: Set[str] = set()
-        self._load_cache()
+    """File-backed URL + title fingerprints + in-memory near-duplicate index."""
+
+    def __init__(
+        self,
+        path: Path = CACHE_PATH,
+        url_path: Path = URL_CACHE_PATH,
+        retention_days: int = 14,
+        bloom_error_rate: Optional[float] = 0.001,
+        near: Optional[NearDuplicateIndex] = None,
+    ) -> None:
+        self.path = path
+        self.near = near
+        self._urls = FingerprintGenerations(url_path, retention_days=retention_days, bloom_error_rate=bloom_error_rate)
+        self._seen = FingerprintGenerations(path, retention_days=retention_days, bloom_error_rate=bloom_error_rate)
+        self._url = 0
+        self._exact = 0
+        self._near = 0
+        self._migrate_json(path.with_suffix(".json"))
 
     # ── public ───────────────────────────────────────────────────────
 
+    def is_url_duplicate(self, url: str) -> bool:
+        fp = url_fingerprint(url)
+        return fp is not None and fp in self._urls
+
     def is_duplicate(self, title: str) -> bool:
-        return self._hash(title) in self._seen
+        return self._fingerprint(title) in self._seen
 
     def mark_seen(self, title: str) -> None:
-        self._seen.add(self._hash(title))
+        self._seen.add(self._fingerprint(title))
+
+    def is_near_duplicate(self, art: ScrapingResult) -> bool:
+        """True if a similar article was seen; otherwise ``art`` is indexed."""
+        if self.near is None:
+            return False
+        text = art.content
+        if len(text.split()) < NEAR_MIN_WORDS:
+            text = f"{art.title} {text}"
+        similarity = self.near.check_and_add(text)
+        if similarity:
+            logger.debug("Near duplicate (%.2f): %s", similarity, art.title)
+        return bool(similarity)
 
     def filter(self, articles: List[ScrapingResult]) -> List[ScrapingResult]:
-        """Remove duplicates and mark new items as seen."""
+        """Remove URL, title and near duplicates and mark new items as seen."""
         unique: List[ScrapingResult] = []
         for art in articles:
-            if not self.is_duplicate(art.title):
-                self.mark_seen(art.title)
-                unique.append(art)
+            url_fp = url_fingerprint(art.source_url)
+            if url_fp is not None and not self._urls.add(url_fp):
+                self._url += 1
+                continue
+            if not self._seen.add(self._fingerprint(art.title)):  # one lookup: check + mark
+                self._exact += 1
+                continue
+            if self.is_near_duplicate(art):
+                self._near += 1
+                continue
+            unique.append(art)
         removed = len(articles) - len(unique)
         if removed:
-            logger.info("Deduplication removed %d / %d articles", removed, len(articles))
+            logger.debug("Deduplication removed %d / %d articles", removed, len(articles))
         return unique
 
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "seen_urls": self._urls.stats(),
+            "seen_titles": self._seen.stats(),
+            "url_duplicates": self._url,
+            "exact_duplicates": self._exact,
+            "near_duplicates": self._near,
+            "near_index": self.near.stats() if self.near is not None else None,
+        }
+
     def save_cache(self) -> None:
-        try:
-            CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-            # Keep only last 50 000 hashes to avoid unbounded growth
-            hashes = list(self._seen)[-50_000:]
-            CACHE_PATH.write_text(json.dumps(hashes), encoding="utf-8")
-            logger.debug("Saved %d hashes to cache", len(hashes))
-        except Exception as exc:
-            logger.warning("Could not save dedup cache: %s", exc)
+        self._urls.save()
+        self._seen.save()
 
     # ── internal ─────────────────────────────────────────────────────
 
-    def _load_cache(self) -> None:
-        if CACHE_PATH.exists():
-            try:
-                data = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
-                self._seen = set(data)
-                logger.info("Loaded %d hashes from dedup cache", len(self._seen))
-            except Exception as exc:
-                logger.warning("Could not load dedup cache: %s", exc)
+    def _migrate_json(self, legacy: Path) -> None:
+        """Import a JSON list of MD5 hex digests (the old cache format) once.
+
+        The legacy file is left in place (it is tracked in git); a
+        ``.json.imported`` marker records that it has been read.
+        """
+        done = legacy.with_suffix(".json.imported")
+        if not legacy.exists() or done.exists():
+            return
+        try:
+            hashes = json.loads(legacy.read_text(encoding="utf-8"))
+            for digest in hashes:
+                self._seen.add(int(digest[:16], 16))
+            self._seen.save()
+            done.write_text(f"{len(hashes)}\n", encoding="utf-8")
+            logger.info("Imported %d hashes from %s", len(hashes), legacy.name)
+        except Exception as exc:
+            logger.warning("Could not import dedup cache %s: %s", legacy.name, exc)
 
     @staticmethod
-    def _hash(title: str) -> str:
-        return hashlib.md5(title.lower().strip().encode()).hexdigest()
+    def _fingerprint(title: str) -> int:
+        return int.from_bytes(hashlib.md5(title.lower().strip().encode()).digest()[:8], "big")
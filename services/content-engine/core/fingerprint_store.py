@@ -0,0 +1,422 @@
+# services/content-engine/core/fingerprint_store.py
+"""Compact on-disk set of 64-bit fingerprints (the dedup seen-set).
+
+Two files per store:
+  <name>.bin  8-byte magic + sorted uint64 fingerprints (native byte order).
+              Memory-mapped, never read in: a lookup is a binary search on a
+              ``memoryview.cast("Q")``, so opening is instant and only the
+              pages a search touches become resident.
+  <name>.log  fingerprints added since the last compaction, appended as raw
+              uint64s.  Read into a set at startup.
+  <name>.bloom  optional ``ScalableBloomFilter`` over both, written at each
+              compaction.  Lookups it rules out ("definitely new") never
+              touch the set or the map, and it costs ~2 bytes per entry.
+
+``save()`` appends the fingerprints added since the last save to the log.
+Once the log holds ``compact_after`` entries, ``compact()`` merges it into
+a new ``.bin`` (written beside it and swapped in) and empties the log.  A
+crash between the two steps only leaves fingerprints in both files, and the
+next compaction drops them.
+
+``FingerprintGenerations`` keeps one store per UTC day
+(``<name>.YYYYMMDD.bin``).  New fingerprints go to today's store; a day's
+log is compacted once the day is over, so only today's additions are held
+in memory.  Days older than the retention window are dropped by deleting
+their files, O(1) per day whatever its size.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Set
+
+from .bloom import ScalableBloomFilter
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CEFP\x00\x00\x00\x01"
+ITEM = array("Q").itemsize
+# Log entries merged into the mapped file on save()
+COMPACT_AFTER = 50_000
+# Capacity of a store's first Bloom filter (later ones are 4× larger); a new
+# day's first filter is sized from the previous day instead
+BLOOM_INITIAL = 10_000
+BLOOM_HEADROOM = 1.5
+
+_COVERS = struct.Struct("<Q")  # .bloom prefix: mapped entries it was saved with
+
+
+class FingerprintStore:
+    """Set of ints in ``[0, 2**64)`` backed by a mapped sorted file + an append log."""
+
+    def __init__(
+        self,
+        path: Path,
+        compact_after: int = COMPACT_AFTER,
+        bloom_error_rate: Optional[float] = None,
+        bloom_initial: int = BLOOM_INITIAL,
+    ) -> None:
+        self.path = path
+        self.log_path = path.with_suffix(".log")
+        self.bloom_path = path.with_suffix(".bloom")
+        self.compact_after = compact_after
+        self.bloom_error_rate = bloom_error_rate
+        self.bloom_initial = bloom_initial
+        self.bloom: Optional[ScalableBloomFilter] = None
+        self._map: Optional[mmap.mmap] = None
+        self._base: Sequence[int] = ()
+        self._recent: Set[int] = set()
+        self._unflushed: List[int] = []
+        self._definitely_new = 0
+        self._false_positives = 0
+        self._open_base()
+        self._load_log()
+        if bloom_error_rate:
+            self._load_bloom()
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def __contains__(self, fp: int) -> bool:
+        if self.bloom is not None and fp not in self.bloom:
+            self._definitely_new += 1
+            return False
+        if fp in self._recent:
+            return True
+        base = self._base
+        i = bisect_left(base, fp)
+        if i < len(base) and base[i] == fp:
+            return True
+        if self.bloom is not None:
+            self._false_positives += 1
+        return False
+
+    def __len__(self) -> int:
+        return len(self._base) + len(self._recent)
+
+    def add(self, fp: int) -> bool:
+        """Add ``fp``; False if it was already present."""
+        if fp in self:
+            return False
+        self.add_new(fp)
+        return True
+
+    def add_new(self, fp: int) -> None:
+        """Add ``fp`` without a membership check (the caller already looked it up)."""
+        self._recent.add(fp)
+        self._unflushed.append(fp)
+        if self.bloom is not None:
+            self.bloom.add(fp)
+
+    def save(self) -> None:
+        """Append new fingerprints to the log; compact once the log is long."""
+        if self._unflushed:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.log_path, "ab") as f:
+                    f.write(array("Q", self._unflushed).tobytes())
+                self._unflushed = []
+            except Exception as exc:
+                logger.warning("Could not append to %s: %s", self.log_path.name, exc)
+                return
+        if len(self._recent) >= self.compact_after:
+            self.compact()
+
+    def compact(self) -> None:
+        """Merge the log into a new sorted ``.bin`` and empty the log."""
+        tmp = self.path.with_suffix(".bin.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(MAGIC)
+                total = _write_merged(f, self._base, sorted(self._recent))
+            self._close_base()
+            os.replace(tmp, self.path)
+            self._open_base()
+            open(self.log_path, "wb").close()
+            self._save_bloom()
+        except Exception as exc:
+            logger.warning("Could not compact %s: %s", self.path.name, exc)
+            if self._map is None:
+                self._open_base()
+            return
+        # unflushed entries are in the new file now, so the log may stay empty
+        self._recent = set()
+        self._unflushed = []
+        logger.info("Compacted %s: %d fingerprints", self.path.name, total)
+
+    def close(self) -> None:
+        self.save()
+        self._close_base()
+
+    def delete(self) -> None:
+        """Unmap and remove both files (unsaved additions are discarded)."""
+        self._close_base()
+        self._recent = set()
+        self._unflushed = []
+        for path in (self.path, self.log_path, self.bloom_path):
+            try:
+                path.unlink(missing_ok=True)
+            except Exception as exc:
+                logger.warning("Could not delete %s: %s", path.name, exc)
+
+    @property
+    def has_log(self) -> bool:
+        return bool(self._recent)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self),
+            "mapped": len(self._base),
+            "log": len(self._recent),
+            "file_kb": round((len(self._base) * ITEM + len(MAGIC)) / 1024, 1),
+            "bloom": self.bloom.stats() if self.bloom is not None else None,
+            "definitely_new": self._definitely_new,
+            "false_positives": self._false_positives,
+        }
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _open_base(self) -> None:
+        self._base = ()
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    raise ValueError("not a fingerprint file")
+                size = os.fstat(f.fileno()).st_size
+                if (size - len(MAGIC)) % ITEM:
+                    raise ValueError(f"truncated ({size} bytes)")
+                if size == len(MAGIC):
+                    return
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._base = memoryview(self._map)[len(MAGIC):].cast("Q")
+        except Exception as exc:
+            logger.warning("Could not open %s: %s", self.path.name, exc)
+
+    def _load_bloom(self) -> None:
+        """Saved filter if it covers the mapped file, else one rebuilt from the entries."""
+        if self.bloom_path.exists():
+            try:
+                raw = self.bloom_path.read_bytes()
+                (covers,) = _COVERS.unpack_from(raw)
+                bloom = ScalableBloomFilter.from_bytes(raw[_COVERS.size:])
+                if covers == len(self._base) and bloom.error_rate == self.bloom_error_rate:
+                    for fp in self._recent:
+                        bloom.add(fp)
+                    self.bloom = bloom
+                    return
+            except Exception as exc:
+                logger.warning("Could not load %s: %s", self.bloom_path.name, exc)
+        bloom = ScalableBloomFilter(max(self.bloom_initial, len(self)), self.bloom_error_rate)
+        for fp in self._base:
+            bloom.add(fp)
+        for fp in self._recent:
+            bloom.add(fp)
+        self.bloom = bloom
+        if len(self._base):
+            logger.info("Rebuilt Bloom filter of %s (%d fingerprints)", self.path.name, len(self))
+
+    def _save_bloom(self) -> None:
+        if self.bloom is None:
+            return
+        tmp = self.bloom_path.with_suffix(".bloom.tmp")
+        tmp.write_bytes(_COVERS.pack(len(self._base)) + self.bloom.to_bytes())
+        os.replace(tmp, self.bloom_path)
+
+    def _close_base(self) -> None:
+        if isinstance(self._base, memoryview):
+            self._base.release()
+        self._base = ()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _load_log(self) -> None:
+        if not self.log_path.exists():
+            return
+        try:
+            raw = self.log_path.read_bytes()
+            log = array("Q")
+            log.frombytes(raw[: len(raw) - len(raw) % ITEM])  # drop a torn last write
+            self._recent = set(log)
+            logger.info("Loaded %d + %d fingerprints from %s", len(self._base), len(self._recent), self.path.name)
+        except Exception as exc:
+            logger.warning("Could not load %s: %s", self.log_path.name, exc)
+
+
+class FingerprintGenerations:
+    """One ``FingerprintStore`` per UTC day; the last ``retention_days`` days are kept."""
+
+    def __init__(self, path: Path, retention_days: int = 14, bloom_error_rate: Optional[float] = None) -> None:
+        self.path = path
+        self.retention_days = max(1, retention_days)
+        self.bloom_error_rate = bloom_error_rate
+        self._gens: Dict[date, FingerprintStore] = {}  # oldest first
+        self._expired = 0
+        self._absent = 0  # lookups of fingerprints not in any generation
+        self._load()
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def __contains__(self, fp: int) -> bool:
+        if any(fp in gen for gen in reversed(self._gens.values())):
+            return True
+        self._absent += 1
+        return False
+
+    def __len__(self) -> int:
+        return sum(len(gen) for gen in self._gens.values())
+
+    def add(self, fp: int, today: Optional[date] = None) -> bool:
+        """Add ``fp`` to today's generation; False if any generation has it.
+
+        Each generation is looked up once; today's is not checked again on insert.
+        """
+        if fp in self:
+            return False
+        self._current(today or _utc_today()).add_new(fp)
+        return True
+
+    def save(self, today: Optional[date] = None) -> None:
+        """Expire old days, seal (compact) finished ones, flush today's log."""
+        today = today or _utc_today()
+        self.expire(today)
+        for day, gen in self._gens.items():
+            if day < today and gen.has_log:
+                gen.compact()
+            else:
+                gen.save()
+
+    def expire(self, today: Optional[date] = None) -> int:
+        """Delete generations older than the retention window; returns how many."""
+        cutoff = (today or _utc_today()) - timedelta(days=self.retention_days - 1)
+        old = [day for day in self._gens if day < cutoff]
+        for day in old:
+            gen = self._gens.pop(day)
+            count = len(gen)
+            gen.delete()
+            self._expired += count
+            logger.info("Expired dedup generation %s (%d fingerprints)", day, count)
+        return len(old)
+
+    def stats(self) -> Dict[str, Any]:
+        gens = [gen.stats() for gen in self._gens.values()]
+        return {
+            "entries": len(self),
+            "retention_days": self.retention_days,
+            "generations": {day.isoformat(): len(gen) for day, gen in self._gens.items()},
+            "in_memory": sum(g["log"] for g in gens),
+            "file_kb": round(sum(g["file_kb"] for g in gens), 1),
+            "expired": self._expired,
+            "bloom": self._bloom_stats(gens) if self.bloom_error_rate else None,
+        }
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _bloom_stats(self, gens: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Filters of all days combined, per lookup (a new title checks every day's filter)."""
+        blooms = [g["bloom"] for g in gens if g["bloom"]]
+        miss = 1.0
+        for b in blooms:
+            miss *= 1 - b["estimated_fp_rate"]
+        false_positives = sum(g["false_positives"] for g in gens)
+        return {
+            "memory_kb": round(sum(b["memory_kb"] for b in blooms), 1),
+            "fill_ratio": blooms[-1]["fill_ratio"] if blooms else 0.0,
+            "estimated_fp_rate": round(1 - miss, 6),
+            # exact-store confirmations that found nothing, per new fingerprint
+            "observed_fp_rate": round(false_positives / self._absent, 6) if self._absent else 0.0,
+            "new_lookups": self._absent,
+            "false_positives": false_positives,
+        }
+
+    def _current(self, today: date) -> FingerprintStore:
+        gen = self._gens.get(today)
+        if gen is None:
+            previous = len(next(reversed(self._gens.values()))) if self._gens else 0
+            gen = self._gens[today] = FingerprintStore(
+                self._day_path(today),
+                bloom_error_rate=self.bloom_error_rate,
+                bloom_initial=max(BLOOM_INITIAL, int(previous * BLOOM_HEADROOM)),
+            )
+        return gen
+
+    def _day_path(self, day: date) -> Path:
+        return self.path.with_name(f"{self.path.stem}.{day:%Y%m%d}{self.path.suffix}")
+
+    def _load(self) -> None:
+        self._adopt_undated()
+        # a day's .bin only exists once its log has been compacted
+        pattern = re.compile(rf"{re.escape(self.path.stem)}\.(\d{{8}})\.(?:bin|log)")
+        days = set()
+        for file in self.path.parent.glob(f"{self.path.stem}.*"):
+            match = pattern.fullmatch(file.name)
+            if match:
+                days.add(datetime.strptime(match.group(1), "%Y%m%d").date())
+        for day in sorted(days):
+            self._gens[day] = FingerprintStore(self._day_path(day), bloom_error_rate=self.bloom_error_rate)
+        if days:
+            logger.info("Loaded %d dedup generations (%d fingerprints)", len(days), len(self))
+
+    def _adopt_undated(self) -> None:
+        """A single-file store (no date in its name) becomes the generation of its last write."""
+        if not self.path.exists():
+            return
+        day = datetime.utcfromtimestamp(self.path.stat().st_mtime).date()
+        target = self._day_path(day)
+        if target.exists():
+            return
+        log = self.path.with_suffix(".log")
+        try:
+            if log.exists():
+                log.rename(target.with_suffix(".log"))
+            self.path.rename(target)
+        except Exception as exc:
+            logger.warning("Could not adopt %s: %s", self.path.name, exc)
+
+
+def _utc_today() -> date:
+    return datetime.utcnow().date()
+
+
+def _write_merged(f: BinaryIO, base: Sequence[int], new: List[int]) -> int:
+    """Write sorted ``base`` with sorted ``new`` merged in; returns the count.
+
+    Runs of ``base`` between insertion points are written straight from the
+    map, so the cost is one copy of the file plus ``len(new) × log n``.
+    """
+    total = 0
+    prev = 0
+    run = array("Q")  # new fingerprints that sort between two base entries
+    for fp in new:
+        pos = bisect_left(base, fp, prev)
+        if pos > prev:
+            total += _flush(f, run)
+            f.write(base[prev:pos])
+            total += pos - prev
+        prev = pos
+        if pos < len(base) and base[pos] == fp:
+            continue  # logged before a crash, already compacted
+        run.append(fp)
+    total += _flush(f, run)
+    if len(base) > prev:
+        f.write(base[prev:])
+        total += len(base) - prev
+    return total
+
+
+def _flush(f: BinaryIO, run: array) -> int:
+    n = len(run)
+    if n:
+        run.tofile(f)
+        del run[:]
+    return n
@@ -0,0 +1,166 @@
+# services/content-engine/core/market_anomaly.py
+"""Vectorised anomaly detection over market snapshots.
+
+After each market run, the newest ``change_percent`` of every symbol is
+z-scored against that symbol's rolling window in the ``MarketStore``.  All
+symbols are handled in one NumPy pass over a ``(symbols × window)`` matrix.
+Symbols with less history are NaN-padded on the left.  A symbol is flagged
+when ``|z| >= z_threshold``.  Windows without any variance (a closed
+market) are skipped, and the spread is floored at ``min_std`` percentage
+points, so a small move after a quiet spell does not score as huge.
+
+Every returned anomaly starts a breaking-news run (one NewsAPI search), so
+returns are limited: a cooldown keeps one sustained move from re-triggering
+on every tick, and at most ``max_per_tick`` / ``max_per_day`` anomalies
+(largest ``|z|`` first) are returned.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+from core.market_store import MarketStore
+
+logger = logging.getLogger(__name__)
+
+# Optional numeric import
+try:
+    import numpy as np  # type: ignore
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# A window with less spread than this has no variance at all (market closed)
+FLAT_STD = 1e-9
+
+
+@dataclass
+class MarketAnomaly:
+    symbol: str
+    name: str
+    change_percent: float
+    mean: float
+    std: float
+    z_score: float
+    detected_at: float
+
+
+class AnomalyDetector:
+    """Rolling z-score detector with a per-symbol cooldown and trigger caps."""
+
+    def __init__(
+        self,
+        window: int = 96,
+        min_samples: int = 20,
+        z_threshold: float = 3.0,
+        cooldown_minutes: float = 60,
+        min_std: float = 0.1,
+        max_per_tick: int = 3,
+        max_per_day: int = 20,
+    ) -> None:
+        self.window = window
+        self.min_samples = min_samples
+        self.z_threshold = z_threshold
+        self.cooldown_s = cooldown_minutes * 60
+        self.min_std = min_std
+        self.max_per_tick = max_per_tick
+        self.max_per_day = max_per_day
+        self._last_flag: Dict[str, float] = {}
+        self._day = ""
+        self.flagged_today = 0
+        self.capped = 0  # flagged but not returned (per-tick / per-day cap)
+        self.recent: List[MarketAnomaly] = []
+        self.checks = 0
+        if not NUMPY_AVAILABLE:
+            logger.warning("numpy not installed — market anomaly detection disabled")
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def detect(self, store: MarketStore, symbols: Iterable[str]) -> List[MarketAnomaly]:
+        """Flag unusual moves among ``symbols`` (those in the latest snapshot)."""
+        if not NUMPY_AVAILABLE:
+            return []
+
+        series = [
+            s for s in (store.get(sym) for sym in symbols)
+            if s is not None and len(s) > self.min_samples
+        ]
+        if not series:
+            return []
+        self.checks += 1
+
+        width = self.window + 1  # history window + the current sample
+        matrix = np.full((len(series), width), np.nan)
+        for row, s in enumerate(series):
+            values = s.tail("change_percent", width)
+            matrix[row, width - len(values):] = values
+
+        history, current = matrix[:, :-1], matrix[:, -1]
+        counts = np.count_nonzero(~np.isnan(history), axis=1)
+        usable = (counts >= self.min_samples) & ~np.isnan(current)
+        if not usable.any():
+            return []
+
+        mean = np.full(len(series), np.nan)
+        std = np.full(len(series), np.nan)
+        mean[usable] = np.nanmean(history[usable], axis=1)
+        std[usable] = np.nanstd(history[usable], axis=1)
+        usable &= std > FLAT_STD
+        z = (current - mean) / np.maximum(std, self.min_std)
+        flagged = np.flatnonzero(usable & (np.abs(z) >= self.z_threshold))
+
+        now = time.time()
+        fresh = [
+            idx for idx in flagged[np.argsort(-np.abs(z[flagged]))]
+            if now - self._last_flag.get(series[idx].symbol, 0.0) >= self.cooldown_s
+        ]
+        today = datetime.utcnow().date().isoformat()
+        if today != self._day:
+            self._day, self.flagged_today = today, 0
+        budget = max(0, min(self.max_per_tick, self.max_per_day - self.flagged_today))
+        if len(fresh) > budget:
+            self.capped += len(fresh) - budget
+            logger.info("Market anomalies: %d flagged, %d over the trigger cap", len(fresh), len(fresh) - budget)
+        anomalies: List[MarketAnomaly] = []
+        for idx in fresh[:budget]:
+            s = series[idx]
+            self._last_flag[s.symbol] = now
+            anomalies.append(MarketAnomaly(
+                symbol=s.symbol,
+                name=s.name or s.symbol,
+                change_percent=float(current[idx]),
+                mean=round(float(mean[idx]), 4),
+                std=round(float(std[idx]), 4),
+                z_score=round(float(z[idx]), 2),
+                detected_at=now,
+            ))
+
+        if anomalies:
+            logger.warning(
+                "Market anomalies: %s",
+                ", ".join(f"{a.symbol} z={a.z_score}" for a in anomalies),
+            )
+            self.recent = (self.recent + anomalies)[-50:]
+            self.flagged_today += len(anomalies)
+        return anomalies
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": NUMPY_AVAILABLE,
+            "window": self.window,
+            "min_samples": self.min_samples,
+            "z_threshold": self.z_threshold,
+            "cooldown_minutes": self.cooldown_s / 60,
+            "min_std": self.min_std,
+            "max_per_tick": self.max_per_tick,
+            "max_per_day": self.max_per_day,
+            "flagged_today": self.flagged_today,
+            "capped": self.capped,
+            "checks": self.checks,
+            "recent": [asdict(a) for a in self.recent[-10:]],
+        }
@@ -0,0 +1,113 @@
+# services/content-engine/core/market_delta.py
+"""Delta-only market delivery — send only quotes that actually moved.
+
+Keeps the last *delivered* quote per symbol (in memory and on disk).  Each
+market run delivers only quotes whose ``last`` / ``change`` / ``high`` /
+``low`` moved by more than a relative epsilon, plus symbols never seen
+before.  Every ``full_resync_minutes`` the whole list is sent again, so any
+drift on the admin-backend side gets corrected.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PATH = Path(__file__).resolve().parent.parent / "data" / "market_snapshot.json"
+
+DELTA_FIELDS = ("last", "change", "high", "low")
+
+
+class MarketDeltaTracker:
+    """Selects changed quotes and remembers what admin-backend already has."""
+
+    def __init__(
+        self,
+        epsilon: float = 1e-4,
+        full_resync_minutes: int = 360,
+        path: Path = SNAPSHOT_PATH,
+    ) -> None:
+        self.epsilon = epsilon
+        self.full_resync = timedelta(minutes=full_resync_minutes)
+        self.path = path
+        self._delivered: Dict[str, Dict[str, Any]] = {}
+        self._last_full_at: Optional[datetime] = None
+        self._last_selection: Dict[str, Any] = {}
+        self._load()
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def select(self, items: List[dict]) -> Tuple[List[dict], bool]:
+        """Return ``(items_to_deliver, is_full_resync)``."""
+        now = datetime.utcnow()
+        full = self._last_full_at is None or now - self._last_full_at >= self.full_resync
+        changed = items if full else [q for q in items if self._changed(q)]
+        self._last_selection = {
+            "at": now.isoformat(),
+            "scraped": len(items),
+            "selected": len(changed),
+            "full_resync": full,
+        }
+        return changed, full
+
+    def commit(self, delivered: List[dict], full: bool) -> None:
+        """Record quotes admin-backend accepted (call only after a successful delivery)."""
+        for q in delivered:
+            symbol = q.get("symbol")
+            if symbol:
+                self._delivered[symbol] = {f: q.get(f) for f in DELTA_FIELDS}
+        if full:
+            self._last_full_at = datetime.utcnow()
+        self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "symbols": len(self._delivered),
+            "epsilon": self.epsilon,
+            "full_resync_minutes": self.full_resync.total_seconds() / 60,
+            "last_full_at": self._last_full_at.isoformat() if self._last_full_at else None,
+            "last_selection": self._last_selection,
+        }
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _changed(self, quote: dict) -> bool:
+        prev = self._delivered.get(quote.get("symbol", ""))
+        if prev is None:
+            return True
+        for f in DELTA_FIELDS:
+            new, old = quote.get(f), prev.get(f)
+            if new is None or old is None:
+                if new != old:
+                    return True
+                continue
+            if abs(new - old) > self.epsilon * max(abs(old), 1.0):
+                return True
+        return False
+
+    def _load(self) -> None:
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self._delivered = data.get("quotes", {})
+                if data.get("last_full_at"):
+                    self._last_full_at = datetime.fromisoformat(data["last_full_at"])
+                logger.info("Loaded market snapshot with %d symbols", len(self._delivered))
+            except Exception as exc:
+                logger.warning("Could not load market snapshot: %s", exc)
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "last_full_at": self._last_full_at.isoformat() if self._last_full_at else None,
+                "quotes": self._delivered,
+            }
+            self.path.write_text(json.dumps(payload), encoding="utf-8")
+        except Exception as exc:
+            logger.warning("Could not save market snapshot: %s", exc)
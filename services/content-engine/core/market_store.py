@@ -0,0 +1,226 @@
+# services/content-engine/core/market_store.py
+"""In-memory columnar market time-series store.
+
+Every ``run_market`` appends the scraped quotes here, so the engine can serve
+intraday charts itself instead of asking admin-backend's database.
+
+Each symbol owns a fixed-size ring buffer with one ``array('d')`` per column
+(timestamp, last, change, change %, high, low).  Appends are O(1) and never
+reallocate.  Range queries bisect on the timestamp column.  OHLC bars
+(1m / 15m / 1h / 1d) are built on the fly from the raw samples.  Missing
+values are stored as NaN.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("ts", "last", "change", "change_percent", "high", "low")
+
+INTERVALS: Dict[str, int] = {
+    "1m": 60,
+    "15m": 15 * 60,
+    "1h": 60 * 60,
+    "1d": 24 * 60 * 60,
+}
+
+_NAN = float("nan")
+
+
+class MarketSeries:
+    """Fixed-capacity ring buffer of quotes for one symbol."""
+
+    def __init__(self, symbol: str, capacity: int) -> None:
+        self.symbol = symbol
+        self.name = ""
+        self.currency: Optional[str] = None
+        self.capacity = capacity
+        self._cols: Dict[str, array] = {c: array("d", [_NAN]) * capacity for c in COLUMNS}
+        self._start = 0  # physical index of the oldest sample
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, ts: float, quote: Dict[str, Any]) -> bool:
+        """Add one sample.  Samples not newer than the latest one are ignored."""
+        if self._size and ts <= self._cols["ts"][self._phys(self._size - 1)]:
+            return False
+        if self._size < self.capacity:
+            i = self._phys(self._size)
+            self._size += 1
+        else:
+            i = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._cols["ts"][i] = ts
+        for c in COLUMNS[1:]:
+            v = quote.get(c)
+            self._cols[c][i] = _NAN if v is None else float(v)
+        return True
+
+    def column(self, name: str, since: float | None = None, until: float | None = None) -> List[float]:
+        """Chronological slice of one column, limited to ``since <= ts <= until``."""
+        lo, hi = self._bounds(since, until)
+        return self._slice(self._cols[name], lo, hi)
+
+    def tail(self, name: str, n: int) -> List[float]:
+        """The newest ``n`` values of one column, oldest first."""
+        return self._slice(self._cols[name], max(0, self._size - n), self._size)
+
+    def rows(self, since: float | None = None, until: float | None = None) -> List[Dict[str, Any]]:
+        """Raw samples as dicts (NaN → ``None``)."""
+        lo, hi = self._bounds(since, until)
+        cols = {c: self._slice(self._cols[c], lo, hi) for c in COLUMNS}
+        return [
+            {c: _none(cols[c][k]) for c in COLUMNS}
+            for k in range(hi - lo)
+        ]
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        if not self._size:
+            return None
+        i = self._phys(self._size - 1)
+        return {c: _none(self._cols[c][i]) for c in COLUMNS}
+
+    def ohlc(self, interval: str, since: float | None = None, until: float | None = None) -> List[Dict[str, Any]]:
+        """Downsample ``last`` into OHLC bars aligned to UTC interval boundaries.
+
+        Daily bars are widened by the session ``high``/``low`` reported by
+        the source.  Intraday bars only use the sampled prices, because the
+        session extremes say nothing about a 15-minute window.
+        """
+        step = INTERVALS[interval]
+        lo, hi = self._bounds(since, until)
+        ts = self._slice(self._cols["ts"], lo, hi)
+        last = self._slice(self._cols["last"], lo, hi)
+        change = self._slice(self._cols["change"], lo, hi)
+        session_hl = interval == "1d"
+        if session_hl:
+            high = self._slice(self._cols["high"], lo, hi)
+            low = self._slice(self._cols["low"], lo, hi)
+
+        bars: List[Dict[str, Any]] = []
+        bar: Optional[Dict[str, Any]] = None
+        for k, t in enumerate(ts):
+            price = last[k]
+            if price != price:  # NaN
+                continue
+            bucket = int(t // step) * step
+            if bar is None or bar["ts"] != bucket:
+                bar = {"ts": bucket, "open": price, "high": price, "low": price,
+                       "close": price, "change": None, "samples": 0}
+                bars.append(bar)
+            bar["high"] = max(bar["high"], price)
+            bar["low"] = min(bar["low"], price)
+            if session_hl:
+                if high[k] == high[k]:
+                    bar["high"] = max(bar["high"], high[k])
+                if low[k] == low[k]:
+                    bar["low"] = min(bar["low"], low[k])
+            bar["close"] = price
+            bar["change"] = _none(change[k])
+            bar["samples"] += 1
+        return bars
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _phys(self, logical: int) -> int:
+        return (self._start + logical) % self.capacity
+
+    def _bounds(self, since: float | None, until: float | None) -> tuple[int, int]:
+        """Logical ``[lo, hi)`` range of samples inside the time window."""
+        ts = self._ordered_ts()
+        lo = bisect_left(ts, since) if since is not None else 0
+        hi = bisect_right(ts, until) if until is not None else self._size
+        return lo, max(lo, hi)
+
+    def _ordered_ts(self) -> _RingView:
+        return _RingView(self._cols["ts"], self._start, self._size, self.capacity)
+
+    def _slice(self, col: array, lo: int, hi: int) -> List[float]:
+        n = hi - lo
+        if n <= 0:
+            return []
+        a = self._phys(lo)
+        if a + n <= self.capacity:
+            return col[a:a + n].tolist()
+        return col[a:].tolist() + col[:a + n - self.capacity].tolist()
+
+
+class _RingView:
+    """Read-only sequence view over a ring buffer column (for ``bisect``)."""
+
+    __slots__ = ("_col", "_start", "_size", "_cap")
+
+    def __init__(self, col: array, start: int, size: int, cap: int) -> None:
+        self._col, self._start, self._size, self._cap = col, start, size, cap
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, i: int) -> float:
+        return self._col[(self._start + i) % self._cap]
+
+
+class MarketStore:
+    """Per-symbol ``MarketSeries`` registry fed by ``PipelineOrchestrator.run_market``."""
+
+    def __init__(self, capacity: int = 2880) -> None:
+        self.capacity = capacity
+        self._series: Dict[str, MarketSeries] = {}
+        self.samples_recorded = 0
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def record(self, quotes: Iterable[Dict[str, Any]], ts: float | None = None) -> int:
+        """Append one snapshot of formatted quotes; returns the number stored."""
+        ts = time.time() if ts is None else ts
+        stored = 0
+        for q in quotes:
+            symbol = q.get("symbol")
+            if not symbol:
+                continue
+            series = self._series.get(symbol)
+            if series is None:
+                series = self._series[symbol] = MarketSeries(symbol, self.capacity)
+            series.name = q.get("name") or series.name
+            series.currency = q.get("currency") or series.currency
+            stored += series.append(ts, q)
+        self.samples_recorded += stored
+        return stored
+
+    def get(self, symbol: str) -> Optional[MarketSeries]:
+        return self._series.get(symbol)
+
+    def symbols(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "symbol": s.symbol,
+                "name": s.name,
+                "currency": s.currency,
+                "points": len(s),
+                "latest": s.latest(),
+            }
+            for s in self._series.values()
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        points = sum(len(s) for s in self._series.values())
+        return {
+            "symbols": len(self._series),
+            "points": points,
+            "capacity_per_symbol": self.capacity,
+            "samples_recorded": self.samples_recorded,
+            "memory_bytes": len(self._series) * self.capacity * len(COLUMNS) * 8,
+        }
+
+
+def _none(v: float) -> Optional[float]:
+    return None if math.isnan(v) else v
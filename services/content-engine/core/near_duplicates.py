@@ -0,0 +1,217 @@
+# services/content-engine/core/near_duplicates.py
+"""Near-duplicate detection — MinHash signatures + an LSH banding index.
+
+The exact title hash misses the same wire story under a slightly different
+headline (AP vs. NPR vs. The Guardian).  Here each article becomes a set of
+word shingles (``shingle_words``-grams of title + lead text), and a
+``NUM_PERM``-value MinHash signature estimates the Jaccard similarity of
+two such sets.
+
+Signatures are split into ``bands`` of ``rows`` values.  Two articles are
+candidates if any band matches exactly; the layout is chosen so that the
+banding S-curve rises well below ``threshold``.  Each candidate is then
+verified against its stored signature.  Band keys are tagged with their
+band number and kept in one sorted NumPy array; a query is a single
+vectorised binary search, ``bands × log n`` whatever the index size.
+Recent inserts sit in a dict until the next rebuild (every
+``REBUILD_EVERY`` adds).  Signatures are
+kept in a ring of ``capacity`` rows; the oldest articles drop out first.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Optional numeric import
+try:
+    import numpy as np  # type: ignore
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+NUM_PERM = 64
+# Only the lead of long articles is shingled (wire copies share it)
+MAX_WORDS = 400
+REBUILD_EVERY = 4096
+INITIAL_ROWS = 1024
+
+_PRIME = 4294967311  # smallest prime above 2**32
+_FNV_PRIME = 1099511628211
+_MIX = 0x9E3779B97F4A7C15  # odd 64-bit constant, spreads word hashes into shingles
+_BAND_BITS = 7  # top bits of a key hold its band (NUM_PERM ≤ 128)
+_WORD = re.compile(r"\w+")
+
+
+def band_layout(threshold: float, num_perm: int = NUM_PERM) -> Tuple[int, int]:
+    """``(bands, rows)`` with the most rows whose S-curve knee stays below ``threshold``.
+
+    The knee ``(1 / bands) ** (1 / rows)`` is kept at least 0.05 under the
+    threshold so that pairs just above it are almost always candidates.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold - 0.05:
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicateIndex:
+    """In-memory MinHash LSH index over the most recent ``capacity`` articles."""
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        capacity: int = 50_000,
+        shingle_words: int = 3,
+        seed: int = 1,
+    ) -> None:
+        self.threshold = threshold
+        self.capacity = max(1, capacity)
+        self.shingle_words = max(1, shingle_words)
+        self.bands, self.rows = band_layout(threshold)
+        self._count = 0  # articles ever added (ring position)
+        self._built_at = 0
+        self._sorted_at = 0  # last full re-sort
+        self._checked = 0
+        self._matched = 0
+        self._candidates = 0
+        if not NUMPY_AVAILABLE:
+            logger.warning("numpy not installed — near-duplicate detection disabled")
+            return
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**31, NUM_PERM, dtype=np.uint64)
+        self._b = rng.integers(0, 2**31, NUM_PERM, dtype=np.uint64)
+        self._sigs = np.zeros((min(self.capacity, INITIAL_ROWS), NUM_PERM), dtype=np.uint32)
+        self._band_tags = np.arange(self.bands, dtype=np.uint64) << np.uint64(64 - _BAND_BITS)
+        self._sorted_keys = np.zeros(0, dtype=np.uint64)
+        self._sorted_slots = np.zeros(0, dtype=np.int32)
+        self._pending: Dict[int, int] = {}
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def signature(self, text: str) -> Optional["np.ndarray"]:
+        """MinHash signature of ``text`` (None if numpy is missing or no words)."""
+        if not NUMPY_AVAILABLE:
+            return None
+        words = _WORD.findall(text.lower())[:MAX_WORDS]
+        if not words:
+            return None
+        hashes = np.fromiter((zlib.crc32(w.encode()) for w in words), dtype=np.uint64, count=len(words))
+        k = min(self.shingle_words, len(words))
+        n = len(words) - k + 1
+        x = hashes[:n].copy()
+        for i in range(1, k):
+            x = x * np.uint64(_MIX) + hashes[i:i + n]
+        x = np.unique((x >> np.uint64(32)) ^ (x & np.uint64(0xFFFFFFFF)))
+        hashed = (self._a[:, None] * x[None, :] + self._b[:, None]) % _PRIME
+        return (hashed.min(axis=1) & 0xFFFFFFFF).astype(np.uint32)
+
+    def query(self, sig: "np.ndarray") -> float:
+        """Highest estimated Jaccard similarity to an indexed article (0.0 if none is close)."""
+        keys = self._keys(sig)
+        lo = np.searchsorted(self._sorted_keys, keys, side="left")
+        hi = np.searchsorted(self._sorted_keys, keys, side="right")
+        found: List[int] = []
+        for start, stop in zip(lo[hi > lo].tolist(), hi[hi > lo].tolist()):
+            found.extend(self._sorted_slots[start:stop].tolist())
+        for key in keys.tolist():
+            if key in self._pending:
+                found.append(self._pending[key])
+        if not found:
+            return 0.0
+        slots = np.unique(np.asarray(found, dtype=np.int64))
+        self._candidates += len(slots)
+        return float((self._sigs[slots] == sig).mean(axis=1).max())
+
+    def add(self, sig: "np.ndarray") -> None:
+        slot = self._count % self.capacity
+        if slot >= len(self._sigs):
+            grown = np.zeros((min(self.capacity, 2 * len(self._sigs)), NUM_PERM), dtype=np.uint32)
+            grown[: len(self._sigs)] = self._sigs
+            self._sigs = grown
+        self._sigs[slot] = sig
+        for key in self._keys(sig).tolist():
+            self._pending[key] = slot
+        self._count += 1
+        if self._count - self._built_at >= REBUILD_EVERY:
+            self._rebuild()
+
+    def check_and_add(self, text: str) -> float:
+        """Similarity to the closest indexed article if it is a near duplicate, else index ``text`` and return 0.0."""
+        sig = self.signature(text)
+        if sig is None:
+            return 0.0
+        self._checked += 1
+        similarity = self.query(sig)
+        if similarity >= self.threshold:
+            self._matched += 1
+            return similarity
+        self.add(sig)
+        return 0.0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": NUMPY_AVAILABLE,
+            "threshold": self.threshold,
+            "bands": self.bands,
+            "rows": self.rows,
+            "indexed": len(self),
+            "capacity": self.capacity,
+            "checked": self._checked,
+            "near_duplicates": self._matched,
+            "avg_candidates": round(self._candidates / self._checked, 2) if self._checked else 0.0,
+            "memory_kb": round(self._memory_bytes() / 1024, 1) if NUMPY_AVAILABLE else 0,
+        }
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _keys(self, sigs: "np.ndarray") -> "np.ndarray":
+        """Band-tagged keys, ``(bands,)`` for one signature or ``(n * bands,)`` for a matrix."""
+        keys = _band_keys(sigs.reshape(-1, self.bands, self.rows))
+        return ((keys >> np.uint64(_BAND_BITS)) | self._band_tags).ravel()
+
+    def _rebuild(self) -> None:
+        """Merge pending keys into the sorted array.
+
+        Merging is a linear insert; once per ``capacity`` adds everything is
+        re-sorted instead, dropping keys of ring slots overwritten since.
+        """
+        if self._count - self._sorted_at >= self.capacity:
+            keys = self._keys(self._sigs[: len(self)])
+            order = np.argsort(keys)
+            self._sorted_keys = keys[order]
+            self._sorted_slots = (order // self.bands).astype(np.int32)
+            self._sorted_at = self._count
+        else:
+            slots = np.arange(self._built_at, self._count) % self.capacity
+            keys = self._keys(self._sigs[slots])
+            order = np.argsort(keys)
+            at = np.searchsorted(self._sorted_keys, keys[order])
+            self._sorted_keys = np.insert(self._sorted_keys, at, keys[order])
+            self._sorted_slots = np.insert(self._sorted_slots, at, slots[order // self.bands].astype(np.int32))
+        self._pending = {}
+        self._built_at = self._count
+
+    def _memory_bytes(self) -> int:
+        pending = len(self._pending) * 100  # rough dict entry cost
+        return self._sigs.nbytes + self._sorted_keys.nbytes + self._sorted_slots.nbytes + pending
+
+
+def _band_keys(sigs: "np.ndarray") -> "np.ndarray":
+    """FNV-style 64-bit key per band: ``(n, bands, rows)`` → ``(n, bands)``."""
+    keys = np.full(sigs.shape[:2], 14695981039346656037, dtype=np.uint64)
+    for r in range(sigs.shape[2]):
+        keys = (keys ^ sigs[:, :, r].astype(np.uint64)) * np.uint64(_FNV_PRIME)
+    return keys
@@ -1,35 +1,61 @@
 # services/content-engine/core/pipeline.py
 """Pipeline orchestrator — the heart of the Content Engine.
 
-Coordinates: scraping → deduplication → AI processing → delivery.
+Coordinates: scraping → deduplication → (full text) → AI processing → delivery.
+Scraping is streamed, so dedup and AI work overlap with slow feeds.
 
 Ported from ``scraper-ai/pipeline.py`` (NewsTRNTPipeline) with:
   - no direct DB writes (uses DeliveryService instead)
   - full pipeline-run tracking with ``PipelineRun`` model
   - stage-level timing and error capture
-  - market-data pipeline support
+  - market-data pipeline support (delta-only delivery between snapshots,
+    in-memory history for /market charts, anomaly-triggered breaking news)
+  - WebSub push runs for hub-enabled feeds (callback → dedup → AI → delivery)
   - re-processing support for existing articles
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from contextlib import aclosing
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, AsyncIterator, Coroutine, Dict, List, Optional, Set
 
 from ai.classifier import TopicClassifier
 from ai.seo_optimizer import SEOOptimizer
 from ai.sentiment import SentimentAnalyzer
 from ai.summarizer import Summarizer
 from config import get_settings
+from core import deduplication
 from core.deduplication import Deduplicator
 from core.delivery import DeliveryService
+from core.market_anomaly import AnomalyDetector
+from core.market_delta import MarketDeltaTracker
+from core.market_store import MarketStore
+from core.near_duplicates import NearDuplicateIndex
+from models.market import TradingViewConfig
 from models.pipeline import PipelineRun, PipelineStage, PipelineStatus, StageResult
-from scraping.base import ScrapingResult
-from scraping.newsapi_scraper import NewsAPIScraper
-from scraping.rss_scraper import RSSScraper
+from scraping.base import (
+    ScrapingResult,
+    configure_parse_pool,
+    merge_streams,
+    shutdown_parse_pool,
+)
+from scraping.fulltext import FullTextExtractor
+from scraping.http_cache import CACHE_PATH as VALIDATORS_PATH, ConditionalCache, ResponseCache
+from scraping.poll_schedule import SCHEDULE_PATH, PollSchedule
+from scraping.source_health import HEALTH_PATH, SourceHealth
+from scraping.source_registry import SourceRegistry
+from scraping.watermark import WATERMARK_PATH, FeedWatermarks
+from scraping.websub import WEBSUB_PATH, WebSubSubscriber
+from scraping.newsapi_scraper import NewsAPIScraper, RequestQuota
+from scraping.rss_scraper import DEFAULT_RSS_SOURCES, RSSScraper
 from scraping.tradingview_scraper import TradingViewScraper
+from utils.http_client import HttpClient
 from utils.text_processing import reading_time
 
 logger = logging.getLogger(__name__)
@@ -41,10 +67,97 @@ class PipelineOrchestrator:
     def __init__(self) -> None:
         settings = get_settings()
 
-        # Scrapers
-        self.rss = RSSScraper()
-        self.newsapi = NewsAPIScraper(api_key=settings.news_api_key)
-        self.tradingview = TradingViewScraper()
+        # Feed registry — this engine polls only its own shard of it
+        self.shard_index = settings.shard_index
+        self.shard_count = settings.shard_count
+        self.registry = SourceRegistry(
+            shard_index=self.shard_index,
+            shard_count=self.shard_count,
+            seed=DEFAULT_RSS_SOURCES,
+        )
+
+        # Scrapers share one pooled HTTP client, conditional-GET validator
+        # cache and parse pool
+        configure_parse_pool(settings.parse_workers)
+        self.http = HttpClient(
+            limit=settings.http_pool_limit,
+            limit_per_host=settings.http_pool_per_host,
+            ttl_dns_cache=settings.http_dns_ttl_s,
+            compress=settings.http_compress,
+        )
+        self.http_cache = ConditionalCache(path=self._shard_path(VALIDATORS_PATH))
+        self.watermarks = FeedWatermarks(path=self._shard_path(WATERMARK_PATH))
+        self.poll_schedule = (
+            PollSchedule(
+                min_minutes=settings.rss_poll_min_minutes,
+                max_minutes=settings.rss_poll_max_minutes,
+                default_minutes=settings.news_interval_minutes,
+                path=self._shard_path(SCHEDULE_PATH),
+            )
+            if settings.rss_adaptive_polling
+            else None
+        )
+        self.source_health = SourceHealth(
+            failure_threshold=settings.source_failure_threshold,
+            cooldown_minutes=settings.source_cooldown_minutes,
+            max_cooldown_minutes=settings.source_max_cooldown_minutes,
+            timeout_floor_s=settings.source_timeout_floor_s,
+            timeout_cap_s=settings.source_timeout_cap_s,
+            path=self._shard_path(HEALTH_PATH),
+        )
+        # WebSub needs a callback URL the hubs can reach; without one every
+        # feed is polled
+        self.websub = (
+            WebSubSubscriber(
+                callback_base_url=settings.websub_callback_base_url,
+                http=self.http,
+                lease_seconds=settings.websub_lease_seconds,
+                path=self._shard_path(WEBSUB_PATH),
+            )
+            if settings.websub_callback_base_url
+            else None
+        )
+        self.rss = RSSScraper(
+            concurrency=settings.rss_concurrency,
+            per_host_limit=settings.rss_per_host_limit,
+            cache=self.http_cache,
+            watermarks=self.watermarks,
+            http=self.http,
+            schedule=self.poll_schedule,
+            keep_short=settings.fulltext_enabled,
+            health=self.source_health,
+            registry=self.registry,
+            websub=self.websub,
+            parser=settings.rss_parser,
+            max_bytes=settings.rss_max_kb * 1024,
+        )
+        self.fulltext = (
+            FullTextExtractor(
+                self.http,
+                concurrency=settings.fulltext_concurrency,
+                per_host_limit=settings.fulltext_per_host_limit,
+                max_bytes=settings.fulltext_max_kb * 1024,
+                below_words=settings.fulltext_below_words,
+            )
+            if settings.fulltext_enabled
+            else None
+        )
+        self.newsapi = NewsAPIScraper(
+            api_key=settings.news_api_key,
+            cache=self.http_cache,
+            http=self.http,
+            response_cache=ResponseCache(ttl_s=settings.newsapi_cache_ttl_s),
+            quota=RequestQuota(
+                daily_limit=settings.newsapi_daily_limit,
+                reserve=settings.newsapi_quota_reserve,
+            ),
+        )
+        self.newsapi_budget = settings.newsapi_article_budget
+        # With adaptive RSS polling the news job ticks faster than
+        # NEWS_INTERVAL_MINUTES; NewsAPI keeps the configured cadence.
+        self.newsapi_interval = timedelta(minutes=settings.news_interval_minutes)
+        self._newsapi_last: Optional[datetime] = None
+        self.tradingview = TradingViewScraper(config=TradingViewConfig.from_settings(settings))
 
         # AI
         self.summarizer = Summarizer()
@@ -53,14 +166,65 @@ class PipelineOrchestrator:
         self.sentiment = SentimentAnalyzer()
 
         # Support
-        self.dedup = Deduplicator()
+        self.market_store = MarketStore(capacity=settings.market_history_points)
+        self.market_delta = MarketDeltaTracker(
+            epsilon=settings.market_delta_epsilon,
+            full_resync_minutes=settings.market_full_resync_minutes,
+        )
+        self.anomalies = AnomalyDetector(
+            window=settings.market_anomaly_window,
+            min_samples=settings.market_anomaly_min_samples,
+            z_threshold=settings.market_anomaly_z,
+            cooldown_minutes=settings.market_anomaly_cooldown_minutes,
+            min_std=settings.market_anomaly_min_std,
+            max_per_tick=settings.market_anomaly_max_per_tick,
+            max_per_day=settings.market_anomaly_max_per_day,
+        )
+        self.breaking_news_enabled = settings.breaking_news_enabled
+        self.breaking_news_articles = settings.breaking_news_articles
+        near = (
+            NearDuplicateIndex(threshold=settings.dedup_near_threshold, capacity=settings.dedup_near_capacity)
+            if settings.dedup_near_enabled
+            else None
+        )
+        self.dedup = Deduplicator(
+            path=self._shard_path(deduplication.CACHE_PATH),
+            url_path=self._shard_path(deduplication.URL_CACHE_PATH),
+            retention_days=settings.dedup_retention_days,
+            bloom_error_rate=settings.dedup_bloom_error_rate or None,
+            near=near,
+        )
         self.delivery = DeliveryService()
 
         # History
         self._history: List[PipelineRun] = []
+        self._background: Set[asyncio.Task] = set()
+
+    @property
+    def is_primary(self) -> bool:
+        """Shard 0 also runs the unsharded work (NewsAPI, market data)."""
+        return self.shard_index == 0
+
+    def _shard_path(self, path: Path) -> Path:
+        """Per-shard variant of a state file (unchanged when not sharded)."""
+        if self.shard_count == 1:
+            return path
+        return path.with_name(f"{path.stem}.shard{self.shard_index}{path.suffix}")
 
     async def close(self) -> None:
+        for task in list(self._background):
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
         self.dedup.save_cache()
+        self.http_cache.save()
+        self.watermarks.save()
+        if self.poll_schedule:
+            self.poll_schedule.save()
+        self.source_health.save()
+        if self.websub:
+            self.websub.save()
+        shutdown_parse_pool()
+        await self.http.close()
         await self.delivery.close()
 
     # ── Public pipelines ─────────────────────────────────────────────
@@ -71,29 +235,63 @@ class PipelineOrchestrator:
         logger.info("Pipeline %s started (full, max=%d)", run.run_id, max_articles)
 
         try:
-            # 1. Scraping
-            stage = self._start_stage(PipelineStage.SCRAPING)
-            raw = await self._scrape_all(max_articles)
-            stage.items_in = 0
-            stage.items_out = len(raw)
-            self._finish_stage(stage)
-            run.articles_scraped = len(raw)
-
-            # 2. Deduplication
-            stage = self._start_stage(PipelineStage.DEDUPLICATION)
-            stage.items_in = len(raw)
-            unique = self.dedup.filter(raw)
-            stage.items_out = len(unique)
-            run.articles_deduplicated = len(raw) - len(unique)
-            self._finish_stage(stage)
-
-            # 3. AI Processing
-            stage = self._start_stage(PipelineStage.AI_PROCESSING)
-            stage.items_in = len(unique)
-            processed = await self._ai_process_batch(unique, stage)
-            stage.items_out = len(processed)
+            # 1–3. Scraping → deduplication → AI processing, streamed:
+            # AI work starts on the first feed's items while slower feeds
+            # are still downloading.
+            scrape = self._start_stage(PipelineStage.SCRAPING)
+            dedup = self._start_stage(PipelineStage.DEDUPLICATION)
+            fulltext = self._start_stage(PipelineStage.FULLTEXT)
+            ai = self._start_stage(PipelineStage.AI_PROCESSING)
+
+            queue: asyncio.Queue[Optional[ScrapingResult]] = asyncio.Queue()
+            consumer = asyncio.create_task(self._ai_consume(queue, ai))
+            enrich: List[asyncio.Task] = []
+            scraped = self._scrape_stream(scheduled=triggered_by == "scheduler")
+            try:
+                async with aclosing(scraped):
+                    async for art in scraped:
+                        if dedup.items_out >= max_articles:
+                            # ``art`` and the rest are not consumed: their
+                            # feeds stay unread and are fetched again next run
+                            break
+                        scrape.items_out += 1
+                        dedup.items_in += 1
+                        if self.dedup.filter([art]):
+                            dedup.items_out += 1
+                            if self.fulltext:
+                                enrich.append(asyncio.create_task(self._fulltext_then_queue(art, queue, fulltext)))
+                            else:
+                                queue.put_nowait(art)
+            except BaseException:
+                for task in enrich:
+                    task.cancel()
+                consumer.cancel()
+                raise
+            scrape.metadata["sources"] = [asdict(r) for r in self.rss.last_report]
+            self._finish_stage(scrape)
+            if self.websub:
+                # subscribe to hubs found in this run, renew expiring leases
+                self._spawn(self.websub.sync(f["url"] for f in self.registry.for_shard()))
+            self._finish_stage(dedup)
+            self.dedup.save_cache()  # appends new fingerprints, expires old days
+            run.articles_scraped = scrape.items_out
+            run.articles_deduplicated = dedup.items_in - dedup.items_out
+            if run.articles_deduplicated:
+                logger.info(
+                    "Deduplication removed %d / %d articles", run.articles_deduplicated, dedup.items_in
+                )
+
+            if self.fulltext:
+                await asyncio.gather(*enrich)
+                self._finish_stage(fulltext)
+                ai.items_in = fulltext.items_out
+            else:
+                ai.items_in = dedup.items_out
+            queue.put_nowait(None)
+            processed = await consumer
+            ai.items_out = len(processed)
             run.articles_processed = len(processed)
-            self._finish_stage(stage)
+            self._finish_stage(ai)
 
             # 4. Delivery
             stage = self._start_stage(PipelineStage.DELIVERY)
@@ -123,11 +321,22 @@ class PipelineOrchestrator:
             run.articles_scraped = len(items)
             logger.warning("Market pipeline scraped %d items", len(items))
             print(f"Market pipeline scraped {len(items)} items: {items[:3]}...")
-            # deliver to admin-backend
-            logger.warning("Market pipeline sending %d items to delivery service", len(items))
-            result = await self.delivery.deliver_market_data(items)
-            logger.warning("Market pipeline delivery result: %s", result)
-            run.articles_delivered = result.get("stats", {}).get("inserted", 0)
+            self.market_store.record(items)
+            self._check_anomalies(items)
+            # deliver only quotes that moved (or everything on a full resync)
+            changed, full = self.market_delta.select(items)
+            if not changed:
+                logger.info("Market pipeline: no quotes changed since last delivery — skipping")
+            else:
+                logger.warning(
+                    "Market pipeline sending %d/%d items (%s)",
+                    len(changed), len(items), "full resync" if full else "delta",
+                )
+                result = await self.delivery.deliver_market_data(changed)
+                logger.warning("Market pipeline delivery result: %s", result)
+                run.articles_delivered = result.get("stats", {}).get("inserted", 0)
+                if result and result.get("success", True) is not False:
+                    self.market_delta.commit(changed, full)
             run.status = PipelineStatus.SUCCESS
 
         except Exception as exc:
@@ -138,6 +347,120 @@ class PipelineOrchestrator:
         self._close_run(run)
         return run
 
+    async def run_breaking_news(
+        self, query: str, max_articles: int = 10, triggered_by: str = "anomaly"
+    ) -> PipelineRun:
+        """Targeted pipeline: NewsAPI search for ``query`` → dedup → AI → deliver."""
+        run = self._new_run("breaking_news", triggered_by)
+        logger.info("Pipeline %s started (breaking news: %r)", run.run_id, query)
+
+        try:
+            scrape = self._start_stage(PipelineStage.SCRAPING)
+            articles = await self.newsapi.search(query, max_articles=max_articles)
+            scrape.items_out = len(articles)
+            scrape.metadata["query"] = query
+            self._finish_stage(scrape)
+            run.articles_scraped = len(articles)
+
+            dedup = self._start_stage(PipelineStage.DEDUPLICATION)
+            dedup.items_in = len(articles)
+            unique = self.dedup.filter(articles)
+            dedup.items_out = len(unique)
+            self._finish_stage(dedup)
+            self.dedup.save_cache()
+            run.articles_deduplicated = len(articles) - len(unique)
+
+            ai = self._start_stage(PipelineStage.AI_PROCESSING)
+            ai.items_in = len(unique)
+            processed = await self._ai_process_batch(unique, ai)
+            ai.items_out = len(processed)
+            run.articles_processed = len(processed)
+            self._finish_stage(ai)
+
+            if processed:
+                stage = self._start_stage(PipelineStage.DELIVERY)
+                stage.items_in = len(processed)
+                result = await self.delivery.deliver_articles(processed)
+                stage.items_out = result.get("inserted", len(processed))
+                run.articles_delivered = stage.items_out
+                self._finish_stage(stage)
+
+            run.status = PipelineStatus.SUCCESS
+
+        except Exception as exc:
+            logger.error("Breaking-news pipeline %s failed: %s", run.run_id, exc)
+            run.errors.append(str(exc))
+            run.status = PipelineStatus.FAILED
+
+        self._close_run(run)
+        return run
+
+    def accept_push(self, feed_url: str, body: bytes, charset: Optional[str] = None) -> bool:
+        """Queue a ``push`` run for a WebSub delivery; False if the feed is not ours.
+
+        ``charset`` is the one declared in the delivery's Content-Type, if any.
+        """
+        source = self.registry.get(feed_url)
+        if not source or not source["enabled"] or source["shard"] != self.shard_index:
+            return False
+        self._spawn(self.run_push(source, body, charset))
+        return True
+
+    async def run_push(
+        self, source: Dict[str, Any], raw: bytes, charset: Optional[str] = None, triggered_by: str = "websub"
+    ) -> PipelineRun:
+        """WebSub pipeline: pushed feed document → dedup → (full text) → AI → deliver."""
+        run = self._new_run("push", triggered_by)
+        logger.info("Pipeline %s started (push: %s)", run.run_id, source["name"])
+
+        try:
+            scrape = self._start_stage(PipelineStage.SCRAPING)
+            articles = await self.rss.parse_pushed(raw, source, charset)
+            scrape.items_out = len(articles)
+            scrape.metadata["feed_url"] = source["url"]
+            self._finish_stage(scrape)
+            run.articles_scraped = len(articles)
+
+            dedup = self._start_stage(PipelineStage.DEDUPLICATION)
+            dedup.items_in = len(articles)
+            unique = self.dedup.filter(articles)
+            dedup.items_out = len(unique)
+            self._finish_stage(dedup)
+            self.dedup.save_cache()
+            run.articles_deduplicated = len(articles) - len(unique)
+
+            if self.fulltext and unique:
+                fulltext = self._start_stage(PipelineStage.FULLTEXT)
+                queue: asyncio.Queue[Optional[ScrapingResult]] = asyncio.Queue()
+                await asyncio.gather(*(self._fulltext_then_queue(art, queue, fulltext) for art in unique))
+                self._finish_stage(fulltext)
+                unique = [queue.get_nowait() for _ in range(queue.qsize())]
+
+            ai = self._start_stage(PipelineStage.AI_PROCESSING)
+            ai.items_in = len(unique)
+            processed = await self._ai_process_batch(unique, ai)
+            ai.items_out = len(processed)
+            run.articles_processed = len(processed)
+            self._finish_stage(ai)
+
+            if processed:
+                stage = self._start_stage(PipelineStage.DELIVERY)
+                stage.items_in = len(processed)
+                result = await self.delivery.deliver_articles(processed)
+                stage.items_out = result.get("inserted", len(processed))
+                run.articles_delivered = stage.items_out
+                self._finish_stage(stage)
+
+            run.status = PipelineStatus.SUCCESS
+
+        except Exception as exc:
+            logger.error("Push pipeline %s failed: %s", run.run_id, exc)
+            run.errors.append(str(exc))
+            run.status = PipelineStatus.FAILED
+
+        self._close_run(run)
+        return run
+
     async def run_news_only(self, max_articles: int = 50, triggered_by: str = "scheduler") -> PipelineRun:
         """News-only pipeline (no market data)."""
         return await self.run_full(max_articles=max_articles, triggered_by=triggered_by)
@@ -153,23 +476,91 @@ class PipelineOrchestrator:
                 return r
         return None
 
-    # ── Internal: scraping ───────────────────────────────────────────
-
-    async def _scrape_all(self, max_articles: int) -> List[ScrapingResult]:
-        all_articles: List[ScrapingResult] = []
-
-        rss_articles = await self.rss.fetch(max_per_source=5)
-        all_articles.extend(rss_articles)
+    def scraping_stats(self) -> Dict[str, Any]:
+        """Scraper-layer metrics for ``GET /scraping/stats``."""
+        return {
+            "registry": self.registry.stats(),
+            "rss": self.rss.stats(),
+            "dedup": self.dedup.stats(),
+            "http_cache": self.http_cache.stats(),
+            "http_pool": self.http.pool_stats(),
+            "newsapi": self.newsapi.stats(),
+            "tradingview": [asdict(r) for r in self.tradingview.last_report],
+            "fulltext": self.fulltext.stats() if self.fulltext else None,
+            "websub": self.websub.stats() if self.websub else None,
+            "market_delta": self.market_delta.stats(),
+            "market_store": self.market_store.stats(),
+            "market_anomalies": self.anomalies.stats(),
+        }
 
-        newsapi_articles = await self.newsapi.fetch(max_articles=20)
-        all_articles.extend(newsapi_articles)
+    # ── Internal: scraping ───────────────────────────────────────────
 
-        # Sort newest first and limit
-        all_articles.sort(key=lambda a: a.published_at or datetime.min, reverse=True)
-        return all_articles[:max_articles]
+    def _scrape_stream(self, scheduled: bool = True) -> AsyncIterator[ScrapingResult]:
+        """RSS (due feeds only on scheduled runs) merged with NewsAPI when it is due.
+
+        NewsAPI (one shared quota) is only queried by shard 0.
+        """
+        streams = [self.rss.stream(max_per_source=5, force=not scheduled)]
+        now = datetime.utcnow()
+        newsapi_due = (
+            not scheduled
+            or self._newsapi_last is None
+            or now - self._newsapi_last >= self.newsapi_interval
+        )
+        if self.is_primary and newsapi_due:
+            self._newsapi_last = now
+            streams.append(self.newsapi.stream(max_articles=self.newsapi_budget))
+        return merge_streams(*streams)
+
+    def _check_anomalies(self, items: List[dict]) -> None:
+        """Start a breaking-news run for each index that moved unusually."""
+        found = self.anomalies.detect(self.market_store, (q["symbol"] for q in items if q.get("symbol")))
+        if not self.breaking_news_enabled:
+            return
+        for anomaly in found:
+            self._spawn(self.run_breaking_news(
+                anomaly.name,
+                max_articles=self.breaking_news_articles,
+                triggered_by=f"anomaly:{anomaly.symbol}",
+            ))
+
+    def _spawn(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Run ``coro`` outside the caller's schedule, keeping a reference until done."""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _fulltext_then_queue(
+        self, art: ScrapingResult, queue: asyncio.Queue[Optional[ScrapingResult]], stage: StageResult
+    ) -> None:
+        """Swap a teaser for the page's main text, then hand the article to AI."""
+        stage.items_in += 1
+        try:
+            art = await self.fulltext.enrich(art)
+        except Exception as exc:
+            stage.errors.append(f"{art.title[:40]}: {exc}")
+            logger.warning("Full-text extraction error: %s", exc)
+        if art.meta_data.get("short_content") and len(art.content.split()) < self.rss.min_words:
+            return  # still a teaser — same outcome as the RSS word-count filter
+        stage.items_out += 1
+        queue.put_nowait(art)
 
     # ── Internal: AI processing ──────────────────────────────────────
 
+    async def _ai_consume(
+        self, queue: asyncio.Queue[Optional[ScrapingResult]], stage: StageResult
+    ) -> List[Dict[str, Any]]:
+        """Process queued articles until a ``None`` sentinel arrives."""
+        processed: List[Dict[str, Any]] = []
+        while (art := await queue.get()) is not None:
+            try:
+                logger.info("AI processing %d: %s", len(processed) + 1, art.title[:60])
+                processed.append(await self._ai_process_one(art))
+            except Exception as exc:
+                stage.errors.append(f"{art.title[:40]}: {exc}")
+                logger.error("AI processing error: %s", exc)
+        return processed
+
     async def _ai_process_batch(
         self, articles: List[ScrapingResult], stage: StageResult
     ) -> List[Dict[str, Any]]:
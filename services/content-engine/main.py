@@ -29,6 +29,8 @@ from api.ai_processing import router as ai_router
 from api.scheduler_routes import router as scheduler_router, set_scheduler
 from api.pipeline_routes import router as pipeline_router, set_pipeline
 from api.config_routes import router as config_router
+from api.market_routes import router as market_router
+from api.websub_routes import router as websub_router
 
 # ── Core ──────────────────────────────────────────────────────
 from core.pipeline import PipelineOrchestrator
@@ -120,6 +122,8 @@ app.include_router(ai_router,         prefix="/api/v1")
 app.include_router(scheduler_router,  prefix="/api/v1")
 app.include_router(pipeline_router,   prefix="/api/v1")
 app.include_router(config_router,     prefix="/api/v1")
+app.include_router(market_router,     prefix="/api/v1")
+app.include_router(websub_router,     prefix="/api/v1")
 
 
 # ── CLI entry ─────────────────────────────────────────────────
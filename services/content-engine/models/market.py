@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
@@ -53,3 +53,12 @@ class TradingViewConfig(BaseModel):
     indices: list[str] = Field(default_factory=list)
     retry_count: int = 2
     retry_delay_s: float = 5.0
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "TradingViewConfig":
+        """Build from ``Settings`` (``TRADINGVIEW_REGIONS`` is comma-separated)."""
+        return cls(
+            regions=[r.strip() for r in settings.tradingview_regions.split(",") if r.strip()],
+            retry_count=settings.tradingview_retry_count,
+            retry_delay_s=settings.tradingview_retry_delay_s,
+        )
@@ -15,6 +15,7 @@ from pydantic import BaseModel, Field
 class PipelineStage(str, Enum):
     SCRAPING = "scraping"
     DEDUPLICATION = "deduplication"
+    FULLTEXT = "fulltext"
     AI_PROCESSING = "ai_processing"
     DELIVERY = "delivery"
     COMPLETE = "complete"
@@ -47,9 +48,9 @@ class PipelineRun(BaseModel):
     """A single pipeline execution record."""
 
     run_id: str
-    pipeline_type: str = "full"  # full | news_only | market_only | reprocess
+    pipeline_type: str = "full"  # full | news_only | market_only | breaking_news | reprocess
     status: PipelineStatus = PipelineStatus.PENDING
-    triggered_by: str = "scheduler"  # scheduler | manual | webhook | admin
+    triggered_by: str = "scheduler"  # scheduler | manual | webhook | admin | anomaly:<symbol>
     started_at: datetime = Field(default_factory=datetime.utcnow)
     finished_at: Optional[datetime] = None
     stages: list[StageResult] = Field(default_factory=list)
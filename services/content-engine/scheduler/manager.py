@@ -68,8 +68,11 @@ class SchedulerManager:
     # ── Default jobs ─────────────────────────────────────────────────
 
     def _add_default_jobs(self, settings) -> None:
-        # News pipeline
+        # News pipeline — with adaptive RSS polling it ticks at the poll
+        # floor and each run only fetches the feeds that are due
         news_interval = settings.news_interval_minutes
+        if settings.rss_adaptive_polling:
+            news_interval = min(news_interval, settings.rss_poll_min_minutes)
         self._scheduler.add_job(
             self._run_news_pipeline,
             trigger=IntervalTrigger(minutes=news_interval),
@@ -85,7 +88,9 @@ class SchedulerManager:
             enabled=True,
         )
 
-        # Market pipeline
+        # Market pipeline — unsharded, so only shard 0 runs it
+        if settings.shard_index != 0:
+            return
         market_interval = settings.market_interval_minutes
         self._scheduler.add_job(
             self._run_market_pipeline,
@@ -1,7 +1,7 @@
 # services/content-engine/scraping/__init__.py
 """Scraping package — RSS feeds, NewsAPI, TradingView, and base abstractions."""
 
-from .base import BaseScraper, ScrapingResult
+from .base import BaseScraper, ScrapingResult, SourceReport
 from .rss_scraper import RSSScraper
 from .newsapi_scraper import NewsAPIScraper
 from .tradingview_scraper import TradingViewScraper
@@ -9,6 +9,7 @@ from .tradingview_scraper import TradingViewScraper
 __all__ = [
     "BaseScraper",
     "ScrapingResult",
+    "SourceReport",
     "RSSScraper",
     "NewsAPIScraper",
     "TradingViewScraper",
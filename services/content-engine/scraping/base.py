@@ -3,14 +3,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import logging
 import re
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar
 
-from bs4 import BeautifulSoup
+import aiohttp
+
+from utils.http_client import HttpClient
+
+from .html_text import html_to_text
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -37,16 +50,144 @@ class ScrapingResult:
             self.excerpt = self.content[:200] + "..." if len(self.content) > 200 else self.content
 
 
+@dataclass
+class SourceReport:
+    """Per-source outcome of a single scrape run (used to tune fetch limits)."""
+
+    name: str
+    url: str
+    # ok | not_modified | not_due | push | circuit_open | bad_content_type | http_error | timeout | error
+    status: str = "pending"
+    http_status: Optional[int] = None
+    latency_ms: float = 0.0
+    items: int = 0
+    skipped: int = 0  # entries already covered by the feed watermark
+    bytes: int = 0  # body bytes read (after decompression)
+    truncated: bool = False  # body cut at the scraper's byte cap
+    error: str = ""
+
+
 class BaseScraper(ABC):
     """All scrapers extend this base class."""
 
     name: str = "base"
+    # Shared pooled client, lent by the pipeline; scrapers without one open
+    # a short-lived session per call.
+    http: Optional[HttpClient] = None
 
     @abstractmethod
     async def fetch(self, **kwargs: Any) -> List[ScrapingResult]:
         """Fetch articles and return a list of ``ScrapingResult``."""
         ...
 
+    async def stream(self, **kwargs: Any) -> AsyncIterator[ScrapingResult]:
+        """Yield articles as they become available.
+
+        The default waits for ``fetch``; scrapers with several sources or
+        pages override this to yield as each one finishes.
+        """
+        for article in await self.fetch(**kwargs):
+            yield article
+
+    @asynccontextmanager
+    async def _session(self, timeout: aiohttp.ClientTimeout) -> AsyncIterator[aiohttp.ClientSession]:
+        """Borrow the shared pooled session, or open a private one."""
+        if self.http is not None:
+            yield await self.http.session()
+            return
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            yield session
+
+    @staticmethod
+    async def run_cpu(fn: Callable[..., T], *args: Any) -> T:
+        """Run a CPU-bound parse step in the shared process pool (see ``run_in_parse_pool``)."""
+        return await run_in_parse_pool(fn, *args)
+
+
+async def merge_streams(*streams: AsyncIterator[T]) -> AsyncIterator[T]:
+    """Interleave several async iterators, yielding items as soon as any produces one.
+
+    A source is asked for its next item only once the consumer has taken
+    the previous one, so sources see exactly what was consumed.  Closing
+    the merged stream closes every source.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    async def pump(stream: AsyncIterator[T]) -> None:
+        try:
+            async for item in stream:
+                taken = asyncio.get_running_loop().create_future()
+                await queue.put((item, taken))
+                await taken
+        finally:
+            if hasattr(stream, "aclose"):
+                await stream.aclose()
+            await queue.put((done, None))
+
+    tasks = [asyncio.create_task(pump(s)) for s in streams]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item, taken = await queue.get()
+            if item is done:
+                remaining -= 1
+                continue
+            yield item
+            taken.set_result(None)
+        await asyncio.gather(*tasks)  # surface producer errors
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# ── Parse pool ───────────────────────────────────────────────────────
+
+_parse_workers = 0
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def configure_parse_pool(workers: int) -> None:
+    """Set the number of parse worker processes (0 = parse on the event loop)."""
+    global _parse_workers
+    if workers != _parse_workers:
+        shutdown_parse_pool()
+    _parse_workers = max(0, workers)
+
+
+async def run_in_parse_pool(fn: Callable[..., T], *args: Any) -> T:
+    """Run a CPU-bound parse step in the shared process pool.
+
+    ``fn`` and its arguments must be picklable (module-level function,
+    plain data).  Runs inline when the pool is disabled.
+    """
+    pool = _get_parse_pool()
+    if pool is None:
+        return fn(*args)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        logger.warning("Parse pool broke — retrying inline, pool will be recreated")
+        shutdown_parse_pool()
+        return fn(*args)
+
+
+def shutdown_parse_pool() -> None:
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+def _get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    global _parse_pool
+    if _parse_workers and _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=_parse_workers)
+        logger.info("Started parse pool with %d workers", _parse_workers)
+    return _parse_pool
+
 
 # ── Shared helpers ───────────────────────────────────────────────────
 
@@ -59,19 +200,8 @@ def generate_slug(title: str) -> str:
 
 
 def clean_html(raw: str) -> str:
-    """Strip HTML tags and collapse whitespace."""
-    if not raw:
-        return ""
-    text = BeautifulSoup(raw, "html.parser").get_text()
-    text = re.sub(r"\s+", " ", text).strip()
-    for phrase in [
-        "Click here to read more",
-        "Continue reading",
-        "Read the full article",
-        "Subscribe to our newsletter",
-    ]:
-        text = text.replace(phrase, "")
-    return text.strip()
+    """Strip HTML tags, decode entities, collapse whitespace, drop boilerplate."""
+    return html_to_text(raw)[0]
 
 
 def content_hash(title: str) -> str:
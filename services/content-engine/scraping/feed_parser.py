@@ -0,0 +1,218 @@
+# services/content-engine/scraping/feed_parser.py
+"""Streaming RSS / Atom parser — a lighter alternative to ``feedparser``.
+
+``feedparser.parse`` decodes and sanitises the whole document and builds a
+full dict tree for every entry.  ``stream_feed`` feeds the document to an
+lxml pull parser in chunks instead and yields one entry at a time:
+  - only the fields ``parse_feed`` reads are extracted (title, link, id,
+    dates, content / summary, author, media / enclosure links,
+    ``feedburner:origLink``)
+  - entries are ``FeedParserDict`` objects shaped like feedparser's, so the
+    entry helpers, watermarks and image extraction work unchanged
+  - each finished entry element is freed, and once the caller stops
+    iterating (``max_per_source`` reached) the rest of the document is
+    never parsed
+
+Malformed XML raises ``FeedFormatError``; ``parse_feed`` then re-parses the
+feed with feedparser, which is more forgiving (undeclared HTML entities,
+broken markup).
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import feedparser
+from lxml import etree
+
+BACKENDS = ("feedparser", "stream")
+
+CHUNK_CHARS = 64 * 1024
+
+_ATOM = "http://www.w3.org/2005/Atom"
+_MEDIA = "http://search.yahoo.com/mrss/"
+_CONTENT = "http://purl.org/rss/1.0/modules/content/"
+_FEEDBURNER = "http://rssnamespace.org/feedburner/ext/1.0"
+
+_UTF8_HEADERS = {"content-type": "application/xml; charset=utf-8"}
+
+_ENTRY_TAGS = ("item", "entry")
+_PUBLISHED_TAGS = ("pubDate", "published", "issued", "date")  # date: dc:date
+_UPDATED_TAGS = ("updated", "modified")
+
+
+class FeedFormatError(ValueError):
+    """The document is not well-formed XML (use feedparser instead)."""
+
+
+@dataclass
+class FeedDocument:
+    """Entries of a feed plus its channel-level ``links`` (rel / href / type).
+
+    With ``stream_feed`` both fill in lazily: ``links`` holds the channel
+    links seen before the last entry taken from ``entries``.
+    """
+
+    entries: Iterator[Any]
+    links: List[Dict[str, str]] = field(default_factory=list)
+
+
+def feedparser_document(raw: str) -> FeedDocument:
+    # ``raw`` is already decoded.  Given a str, feedparser would still honour
+    # the XML declaration's encoding (mangling e.g. windows-1252 feeds), so
+    # hand it UTF-8 bytes with a header charset, which takes precedence.
+    feed = feedparser.parse(raw.encode("utf-8"), response_headers=_UTF8_HEADERS)
+    return FeedDocument(iter(feed.entries), feed.feed.get("links", []))
+
+
+def stream_feed(raw: str) -> FeedDocument:
+    links: List[Dict[str, str]] = []
+    return FeedDocument(_iter_entries(raw, links), links)
+
+
+# ── internal ─────────────────────────────────────────────────────────
+
+def _iter_entries(raw: str, channel_links: List[Dict[str, str]]) -> Iterator[feedparser.FeedParserDict]:
+    # ``raw`` is already decoded — override whatever the XML declaration says
+    parser = etree.XMLPullParser(
+        events=("end",), encoding="utf-8", resolve_entities=False, no_network=True, huge_tree=True
+    )
+    try:
+        for start in range(0, len(raw), CHUNK_CHARS):
+            parser.feed(raw[start:start + CHUNK_CHARS].encode("utf-8"))
+            for _, elem in parser.read_events():
+                name = _local(elem.tag)
+                if name in _ENTRY_TAGS:
+                    yield _entry(elem)
+                    _release(elem)
+                elif name == "link" and elem.get("href") and _is_channel_child(elem):
+                    channel_links.append(_link(elem))
+        parser.close()
+    except etree.XMLSyntaxError as exc:
+        raise FeedFormatError(str(exc)) from exc
+
+
+def _entry(elem: etree._Element) -> feedparser.FeedParserDict:
+    entry = feedparser.FeedParserDict()
+    links: List[Dict[str, str]] = []
+    media_content: List[Dict[str, str]] = []
+    media_thumbnail: List[Dict[str, str]] = []
+    permalink_guid = False
+
+    children = list(elem)
+    for child in children:
+        if not isinstance(child.tag, str):
+            continue
+        ns, name = _split(child.tag)
+        if ns == _MEDIA:
+            if name == "group":
+                children.extend(child)
+            elif name == "content":
+                media_content.append(dict(child.attrib))
+            elif name == "thumbnail":
+                media_thumbnail.append(dict(child.attrib))
+            continue
+        text = (child.text or "").strip()
+        if ns == _FEEDBURNER:
+            if name == "origLink" and text:
+                entry.setdefault("feedburner_origlink", text)
+            continue
+        if name == "title":
+            entry.setdefault("title", text)
+        elif name == "link":
+            if child.get("href"):
+                link = _link(child)
+                links.append(link)
+                if link["rel"] == "alternate" and "link" not in entry:
+                    entry["link"] = link["href"]
+            elif text:
+                entry.setdefault("link", text)
+        elif name in ("guid", "id"):
+            entry.setdefault("id", text)
+            permalink_guid = name == "guid" and child.get("isPermaLink", "true") != "false"
+        elif name in _PUBLISHED_TAGS:
+            _set_date(entry, "published", text)
+        elif name in _UPDATED_TAGS:
+            _set_date(entry, "updated", text)
+        elif name == "description" or (name == "summary" and ns == _ATOM):
+            entry.setdefault("summary", _inner(child))
+        elif (name == "encoded" and ns == _CONTENT) or (name == "content" and ns == _ATOM):
+            content = feedparser.FeedParserDict(value=_inner(child), type=child.get("type", "text/html"))
+            entry.setdefault("content", [content])
+        elif name in ("author", "creator"):
+            author = child.findtext(f"{{{ns}}}name") if ns == _ATOM else text
+            if author:
+                entry.setdefault("author", author.strip())
+        elif name == "enclosure" and child.get("url"):
+            links.append({"rel": "enclosure", "type": child.get("type", ""), "href": child.get("url", "")})
+
+    if "link" not in entry and permalink_guid and entry.get("id", "").startswith("http"):
+        entry["link"] = entry["id"]
+    if links:
+        entry["links"] = links
+    if media_content:
+        entry["media_content"] = media_content
+    if media_thumbnail:
+        entry["media_thumbnail"] = media_thumbnail
+    return entry
+
+
+def _inner(elem: etree._Element) -> str:
+    """Text of a content element; inline XHTML (Atom ``type="xhtml"``) is serialised."""
+    if len(elem) == 0:
+        return (elem.text or "").strip()
+    parts = [elem.text or ""]
+    for child in elem:
+        parts.append(etree.tostring(child, encoding="unicode", with_tail=True))
+    return "".join(parts).strip()
+
+
+def _set_date(entry: feedparser.FeedParserDict, key: str, text: str) -> None:
+    if f"{key}_parsed" in entry or not text:
+        return
+    parsed = _parse_date(text)
+    entry[key] = text
+    entry[f"{key}_parsed"] = parsed
+
+
+def _parse_date(text: str) -> Optional[time.struct_time]:
+    """RFC 822 or ISO 8601 date as a UTC ``struct_time`` (like feedparser)."""
+    try:
+        when = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        try:
+            when = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return when.utctimetuple()
+
+
+def _link(elem: etree._Element) -> Dict[str, str]:
+    return {"rel": elem.get("rel", "alternate"), "type": elem.get("type", ""), "href": elem.get("href", "")}
+
+
+def _is_channel_child(elem: etree._Element) -> bool:
+    parent = elem.getparent()
+    return parent is not None and _local(parent.tag) in ("channel", "feed")
+
+
+def _release(elem: etree._Element) -> None:
+    """Free a finished entry and anything before it (keeps memory flat)."""
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+def _split(tag: str) -> Tuple[str, str]:
+    if tag[0] == "{":
+        ns, _, name = tag[1:].partition("}")
+        return ns, name
+    return "", tag
+
+
+def _local(tag: Any) -> str:
+    return _split(tag)[1] if isinstance(tag, str) else ""
@@ -0,0 +1,206 @@
+# services/content-engine/scraping/fulltext.py
+"""Optional full-text stage — replace RSS teasers with the article body.
+
+``FullTextExtractor`` downloads article pages through the shared HTTP pool.
+A per-host semaphore (taken first, so a busy host does not hold global
+slots) and a global semaphore keep it polite; a host's semaphore only
+exists while it has downloads in flight or waiting.  Each body is read up
+to ``max_bytes`` only, and non-HTML responses are dropped.
+
+``extract_main_text`` is the boilerplate remover.  It runs on one lxml parse:
+  - chrome (nav / header / footer / aside / forms / scripts …) is stripped
+  - every paragraph scores its parent (and half that to its grandparent)
+    by text length, with link-heavy paragraphs discounted
+  - the best container's paragraphs are joined and cleaned with the same
+    whitespace / boilerplate pattern as ``html_to_text``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
+
+from utils.http_client import HttpClient
+
+from .base import ScrapingResult, run_in_parse_pool
+from .html_text import clean_text
+
+logger = logging.getLogger(__name__)
+
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+# Elements that never hold article text
+_CHROME_TAGS = (
+    "script", "style", "noscript", "template", "svg", "iframe", "form", "button",
+    "nav", "header", "footer", "aside", "figure", "select",
+)
+_TEXT_TAGS = ("p", "h2", "h3", "li", "blockquote", "pre")
+
+# Paragraphs shorter than this (chars) don't vote for a container
+MIN_PARAGRAPH_CHARS = 25
+# Drop paragraphs whose text is mostly link text (share bars, "related" lists)
+MAX_LINK_DENSITY = 0.5
+
+
+def extract_main_text(html: str) -> str:
+    """Main article text of an HTML page ("" if nothing article-like is found)."""
+    if not html:
+        return ""
+    try:
+        doc = lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return ""
+    etree.strip_elements(doc, *_CHROME_TAGS, etree.Comment, with_tail=False)
+
+    scores: Dict[HtmlElement, float] = {}
+    for p in doc.iter("p"):
+        text = p.text_content()
+        if len(text) < MIN_PARAGRAPH_CHARS:
+            continue
+        score = (1 + text.count(",") + len(text) / 100) * (1 - _link_density(p, len(text)))
+        parent = p.getparent()
+        if parent is None:
+            continue
+        scores[parent] = scores.get(parent, 0.0) + score
+        grand = parent.getparent()
+        if grand is not None:
+            scores[grand] = scores.get(grand, 0.0) + score / 2
+
+    if not scores:
+        return ""
+    best = max(scores, key=scores.__getitem__)
+
+    parts: List[str] = []
+    for el in best.iter(*_TEXT_TAGS):
+        text = el.text_content()
+        if text.strip() and _link_density(el, len(text)) <= MAX_LINK_DENSITY:
+            parts.append(text)
+    return clean_text(" ".join(parts))
+
+
+def _link_density(el: HtmlElement, text_len: int) -> float:
+    if not text_len:
+        return 0.0
+    linked = sum(len(a.text_content()) for a in el.iter("a"))
+    return min(1.0, linked / text_len)
+
+
+class FullTextExtractor:
+    """Bounded, per-host polite article fetcher + main-text extractor."""
+
+    def __init__(
+        self,
+        http: HttpClient,
+        concurrency: int = 6,
+        per_host_limit: int = 2,
+        max_bytes: int = 1_048_576,
+        below_words: int = 150,
+    ) -> None:
+        self.http = http
+        self.concurrency = max(1, concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.max_bytes = max_bytes
+        self.below_words = below_words
+        self._global_sem: Optional[asyncio.Semaphore] = None
+        # Per-host semaphores, kept while the host has downloads in flight or waiting
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._host_users: Dict[str, int] = {}
+        self._counters = {
+            "requested": 0, "enriched": 0, "not_longer": 0, "failed": 0,
+            "truncated": 0, "bytes": 0, "fetch_ms": 0.0, "extract_ms": 0.0,
+        }
+
+    def wants(self, article: ScrapingResult) -> bool:
+        return bool(article.source_url) and len(article.content.split()) < self.below_words
+
+    async def enrich(self, article: ScrapingResult) -> ScrapingResult:
+        """Replace ``article.content`` with the page's main text if that is longer."""
+        if not self.wants(article):
+            return article
+        self._counters["requested"] += 1
+        html = await self._download(article.source_url)
+        if html is None:
+            self._counters["failed"] += 1
+            return article
+
+        started = time.perf_counter()
+        text = await run_in_parse_pool(extract_main_text, html)
+        self._counters["extract_ms"] += (time.perf_counter() - started) * 1000
+
+        if len(text.split()) <= len(article.content.split()):
+            self._counters["not_longer"] += 1
+            return article
+        self._counters["enriched"] += 1
+        article.content = text
+        article.meta_data = {**article.meta_data, "fulltext": True}
+        return article
+
+    def stats(self) -> Dict[str, Any]:
+        c = self._counters
+        done = c["requested"] - c["failed"]
+        return {
+            **{k: round(v, 1) if isinstance(v, float) else v for k, v in c.items()},
+            "avg_fetch_ms": round(c["fetch_ms"] / c["requested"], 1) if c["requested"] else 0.0,
+            "avg_extract_ms": round(c["extract_ms"] / done, 2) if done else 0.0,
+            "hosts_in_flight": len(self._host_sems),
+        }
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    async def _download(self, url: str) -> Optional[str]:
+        """GET ``url`` and decode at most ``max_bytes`` of an HTML body."""
+        if self._global_sem is None:
+            self._global_sem = asyncio.Semaphore(self.concurrency)
+
+        async with self._host_slot(urlparse(url).hostname or url), self._global_sem:
+            started = time.perf_counter()
+            try:
+                session = await self.http.session()
+                async with session.get(url, timeout=FETCH_TIMEOUT) as resp:
+                    ctype = resp.headers.get("Content-Type", "")
+                    if resp.status != 200 or "html" not in ctype.lower():
+                        logger.debug("Full text skipped %s (%s, %s)", url, resp.status, ctype)
+                        return None
+                    chunks: List[bytes] = []
+                    size = 0
+                    async for chunk in resp.content.iter_chunked(64 * 1024):
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= self.max_bytes:
+                            self._counters["truncated"] += 1
+                            break
+                    body = b"".join(chunks)[: self.max_bytes]
+                    charset = resp.charset or "utf-8"
+            except Exception as exc:
+                logger.debug("Full text fetch failed for %s: %s", url, exc)
+                return None
+            finally:
+                self._counters["fetch_ms"] += (time.perf_counter() - started) * 1000
+
+        self._counters["bytes"] += len(body)
+        try:
+            return body.decode(charset, errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        """Hold one of ``host``'s slots; its semaphore is dropped when nobody uses it."""
+        sem = self._host_sems.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+        self._host_users[host] = self._host_users.get(host, 0) + 1
+        try:
+            async with sem:
+                yield
+        finally:
+            self._host_users[host] -= 1
+            if not self._host_users[host]:
+                del self._host_sems[host], self._host_users[host]
@@ -0,0 +1,83 @@
+# services/content-engine/scraping/html_text.py
+"""Single-pass HTML → text engine used by ``clean_html``.
+
+Replaces the BeautifulSoup tree build + ``get_text()`` + whitespace regex +
+repeated ``str.replace`` passes with one tokenizer pass:
+
+  - tags and comments are stripped, ``<script>``/``<style>`` dropped with
+    their content, block-level tags become a space
+  - the first ``<img src>`` is captured on the way (saves a second parse
+    in ``RSSScraper`` image extraction)
+  - entities are decoded once, then whitespace collapsing and boilerplate
+    removal share a single compiled pattern
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from typing import List, Tuple
+
+BOILERPLATE_PHRASES = (
+    "Click here to read more",
+    "Continue reading",
+    "Read the full article",
+    "Subscribe to our newsletter",
+)
+
+_BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "td", "th", "tr", "ul",
+})
+
+_TOKEN_RE = re.compile(
+    r"""
+      <!--.*?(?:-->|$)                                  # comment
+    | <(script|style)\b[^>]*>.*?(?:</\1\s*>|$)          # script/style + content
+    | <(/?)([a-zA-Z][\w:-]*)((?:"[^"]*"|'[^']*'|[^'">])*)>  # start / end tag
+    | <![^>]*>                                          # doctype, CDATA marker
+    | <\?[^>]*>                                         # processing instruction
+    """,
+    re.S | re.I | re.X,
+)
+
+_SRC_RE = re.compile(r"""(?:^|\s)src\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.I)
+
+_CLEAN_RE = re.compile(
+    r"\s*(?:" + "|".join(re.escape(p) for p in BOILERPLATE_PHRASES) + r")\s*|\s+"
+)
+
+
+def html_to_text(raw: str) -> Tuple[str, str]:
+    """Return ``(clean_text, first_img_src)`` for an HTML fragment."""
+    if not raw:
+        return "", ""
+
+    parts: List[str] = []
+    image = ""
+    pos = 0
+    for m in _TOKEN_RE.finditer(raw):
+        if m.start() > pos:
+            parts.append(raw[pos:m.start()])
+        pos = m.end()
+
+        name = m.group(3)
+        if not name:
+            continue
+        name = name.lower()
+        if name in _BLOCK_TAGS:
+            parts.append(" ")
+        elif name == "img" and not image and not m.group(2):
+            src = _SRC_RE.search(m.group(4))
+            if src:
+                image = html.unescape(src.group(1) or src.group(2) or src.group(3) or "")
+    parts.append(raw[pos:])
+
+    return clean_text(html.unescape("".join(parts))), image
+
+
+def clean_text(text: str) -> str:
+    """Collapse whitespace and drop boilerplate phrases from already-decoded text."""
+    return _CLEAN_RE.sub(" ", text).strip()
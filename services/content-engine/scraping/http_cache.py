@@ -0,0 +1,149 @@
+# services/content-engine/scraping/http_cache.py
+"""Conditional-GET validator cache (ETag / Last-Modified) and TTL response cache.
+
+Scrapers ask the cache for ``If-None-Match`` / ``If-Modified-Since`` headers
+before each request and store the validators from every 200 response.  A 304
+means the resource is unchanged and the scraper can skip download and
+parsing entirely.  Validators are persisted to a small JSON file so they
+survive restarts.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "http_validators.json"
+
+# Query parameters that must never end up in a cache key on disk
+_SECRET_PARAMS = {"apikey", "api_key", "key", "token"}
+
+
+class ConditionalCache:
+    """Per-URL ETag / Last-Modified store with hit/miss counters."""
+
+    def __init__(self, path: Path = CACHE_PATH) -> None:
+        self.path = path
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self.hits = 0    # 304 Not Modified
+        self.misses = 0  # full 200 response
+        self._dirty = False
+        self._load()
+
+    # ── public ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Cache key for ``url`` + query params (secrets stripped, order-independent)."""
+        if not params:
+            return url
+        clean = sorted((k, str(v)) for k, v in params.items() if k.lower() not in _SECRET_PARAMS)
+        return f"{url}?{urlencode(clean)}" if clean else url
+
+    def request_headers(self, key: str) -> Dict[str, str]:
+        """Conditional request headers for a previously-seen resource."""
+        entry = self._validators.get(key)
+        if not entry:
+            return {}
+        headers: Dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record_not_modified(self) -> None:
+        self.hits += 1
+
+    def record_response(self, key: str, headers: Mapping[str, str]) -> None:
+        """Store validators from a 200 response (or forget stale ones)."""
+        self.misses += 1
+        etag = headers.get("ETag", "")
+        last_modified = headers.get("Last-Modified", "")
+        if etag or last_modified:
+            self._validators[key] = {"etag": etag, "last_modified": last_modified}
+            self._dirty = True
+        elif self._validators.pop(key, None) is not None:
+            self._dirty = True
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._validators),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._validators), encoding="utf-8")
+            self._dirty = False
+            logger.debug("Saved %d HTTP validators", len(self._validators))
+        except Exception as exc:
+            logger.warning("Could not save HTTP validator cache: %s", exc)
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        if self.path.exists():
+            try:
+                self._validators = json.loads(self.path.read_text(encoding="utf-8"))
+                logger.info("Loaded %d HTTP validators", len(self._validators))
+            except Exception as exc:
+                logger.warning("Could not load HTTP validator cache: %s", exc)
+
+
+class ResponseCache:
+    """In-memory TTL cache of decoded response bodies keyed by ``ConditionalCache.key``.
+
+    Repeated identical requests inside the TTL never touch the network (or an
+    API quota).  Expired bodies are still handed back on a 304, so a
+    conditional revalidation costs no re-download.
+    """
+
+    def __init__(self, ttl_s: float = 900, max_entries: int = 256) -> None:
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Fresh body for ``key`` or ``None`` (counts a hit/miss)."""
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def get_stale(self, key: str) -> Optional[Any]:
+        """Body for ``key`` regardless of age (used after a 304)."""
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def put(self, key: str, body: Any) -> None:
+        if len(self._entries) >= self.max_entries and key not in self._entries:
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest]
+        self._entries[key] = (time.monotonic() + self.ttl_s, body)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "ttl_s": self.ttl_s,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
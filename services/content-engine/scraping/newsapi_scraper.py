@@ -1,22 +1,97 @@
 # services/content-engine/scraping/newsapi_scraper.py
 """NewsAPI.org scraper — top headlines & everything search.
 
-Ported from ``scraper-ai/scraping/fetch_news.py`` (NewsAPI portion).
+Ported from ``scraper-ai/scraping/fetch_news.py`` (NewsAPI portion) with:
+  - paginated fetching (pages after the first requested concurrently)
+  - TTL response cache keyed by query parameters
+  - local daily quota counter that stops short of the key's limit
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import math
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import aiohttp
 
+from utils.http_client import HttpClient
+
 from .base import BaseScraper, ScrapingResult, clean_html
+from .http_cache import ConditionalCache, ResponseCache
 
 logger = logging.getLogger(__name__)
 
 NEWSAPI_BASE = "https://newsapi.org/v2"
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+MAX_PAGE_SIZE = 100  # NewsAPI hard limit
+QUOTA_PATH = Path(__file__).resolve().parent.parent / "data" / "newsapi_quota.json"
+
+
+class RequestQuota:
+    """File-backed per-UTC-day request counter for the NewsAPI key."""
+
+    def __init__(self, daily_limit: int = 100, reserve: int = 5, path: Path = QUOTA_PATH) -> None:
+        self.daily_limit = daily_limit
+        self.reserve = reserve
+        self.path = path
+        self._day = ""
+        self.used = 0
+        self._load()
+
+    @property
+    def remaining(self) -> int:
+        self._roll()
+        return max(0, self.daily_limit - self.reserve - self.used)
+
+    def try_consume(self) -> bool:
+        """Count one request; ``False`` (and nothing counted) once the budget is spent."""
+        if self.remaining <= 0:
+            return False
+        self.used += 1
+        self._save()
+        return True
+
+    def exhaust(self) -> None:
+        """Mark today's budget as spent (the API answered 429)."""
+        self._roll()
+        self.used = max(self.used, self.daily_limit - self.reserve)
+        self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "day": self._day,
+            "used": self.used,
+            "remaining": self.remaining,
+            "daily_limit": self.daily_limit,
+            "reserve": self.reserve,
+        }
+
+    def _roll(self) -> None:
+        today = datetime.utcnow().date().isoformat()
+        if today != self._day:
+            self._day, self.used = today, 0
+
+    def _load(self) -> None:
+        self._day = datetime.utcnow().date().isoformat()
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("day") == self._day:
+                    self.used = int(data.get("used", 0))
+            except Exception as exc:
+                logger.warning("Could not load NewsAPI quota: %s", exc)
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps({"day": self._day, "used": self.used}), encoding="utf-8")
+        except Exception as exc:
+            logger.warning("Could not save NewsAPI quota: %s", exc)
 
 
 class NewsAPIScraper(BaseScraper):
@@ -24,106 +99,190 @@ class NewsAPIScraper(BaseScraper):
 
     name = "newsapi"
 
-    def __init__(self, api_key: str = "", max_age_days: int = 7, min_words: int = 50) -> None:
+    def __init__(
+        self,
+        api_key: str = "",
+        max_age_days: int = 7,
+        min_words: int = 50,
+        cache: ConditionalCache | None = None,
+        http: HttpClient | None = None,
+        response_cache: ResponseCache | None = None,
+        quota: RequestQuota | None = None,
+    ) -> None:
         self.api_key = api_key
         self.max_age = timedelta(days=max_age_days)
         self.min_words = min_words
+        self.cache = cache
+        self.http = http
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
+        self.quota = quota if quota is not None else RequestQuota()
 
     async def fetch(self, max_articles: int = 20, **kwargs: Any) -> List[ScrapingResult]:
+        return [a async for a in self.stream(max_articles=max_articles)]
+
+    async def search(self, query: str, max_articles: int = 20) -> List[ScrapingResult]:
+        """Search everything endpoint for a specific query."""
+        return [a async for a in self.stream(max_articles=max_articles, query=query)]
+
+    async def stream(
+        self, max_articles: int = 20, query: str | None = None, **kwargs: Any
+    ) -> AsyncIterator[ScrapingResult]:
+        """Yield articles page by page, up to a budget of ``max_articles`` raw items.
+
+        ``query`` switches from ``top-headlines`` to the ``everything`` search.
+        The first page tells us ``totalResults``; the remaining pages are
+        requested concurrently.
+        """
         if not self.api_key:
             logger.warning("NewsAPI key not set — skipping")
-            return []
+            return
+
+        page_size = min(max_articles, MAX_PAGE_SIZE)
+        if query:
+            path = "/everything"
+            params = {"q": query, "language": "en", "pageSize": str(page_size), "sortBy": "relevancy"}
+        else:
+            path = "/top-headlines"
+            params = {"language": "en", "pageSize": str(page_size), "sortBy": "publishedAt"}
 
-        articles: List[ScrapingResult] = []
-        timeout = aiohttp.ClientTimeout(total=30)
+        count = 0
+        async with self._session(REQUEST_TIMEOUT) as session:
+            _, first = await self._get_page(session, path, params, 1)
+            if first is None:
+                return
+            for article in await self._parse(first, max_articles, 1):
+                count += 1
+                yield article
 
+            try:
+                total = min(int(first.get("totalResults", 0)), max_articles)
+            except (TypeError, ValueError):
+                total = 0
+            tasks = [
+                asyncio.create_task(self._get_page(session, path, params, page))
+                for page in range(2, math.ceil(total / page_size) + 1)
+            ]
+            try:
+                # ``_get_page`` and ``_parse`` log and swallow their own
+                # errors, so a failed page never ends the stream
+                for next_done in asyncio.as_completed(tasks):
+                    page, data = await next_done
+                    if data is None:
+                        continue
+                    # Only the first ``max_articles`` raw items count
+                    limit = max_articles - (page - 1) * page_size
+                    for article in await self._parse(data, limit, page):
+                        count += 1
+                        yield article
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        logger.info("NewsAPI %s returned %d articles", path, count)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"quota": self.quota.stats(), "response_cache": self.response_cache.stats()}
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    async def _parse(self, data: Dict[str, Any], limit: int, page: int) -> List[ScrapingResult]:
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                params = {
-                    "apiKey": self.api_key,
-                    "language": "en",
-                    "pageSize": str(max_articles),
-                    "sortBy": "publishedAt",
-                }
-                async with session.get(f"{NEWSAPI_BASE}/top-headlines", params=params) as resp:
-                    if resp.status != 200:
-                        logger.error("NewsAPI returned %s", resp.status)
-                        return []
-                    data = await resp.json()
-
-            for item in data.get("articles", []):
-                article = self._parse_item(item)
-                if article:
-                    articles.append(article)
-
-            logger.info("NewsAPI returned %d articles", len(articles))
+            return await self.run_cpu(
+                parse_items, data.get("articles", [])[:limit], datetime.utcnow() - self.max_age, self.min_words
+            )
         except Exception as exc:
-            logger.error("NewsAPI error: %s", exc)
+            logger.error("NewsAPI page %d could not be parsed: %s", page, exc)
+            return []
 
-        return articles
+    async def _get_page(
+        self, session: aiohttp.ClientSession, path: str, params: Dict[str, str], page: int
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """GET one page: response cache → quota check → conditional GET.
 
-    async def search(self, query: str, max_articles: int = 20) -> List[ScrapingResult]:
-        """Search everything endpoint for a specific query."""
-        if not self.api_key:
-            return []
+        Returns ``(page, body)``; body is ``None`` on error, exhausted quota,
+        or a 304 with no cached body.  Errors are logged here so one bad
+        page does not end the stream.
+        """
+        url = f"{NEWSAPI_BASE}{path}"
+        page_params = {**params, "page": str(page)}
+        key = ConditionalCache.key(url, page_params)
 
-        articles: List[ScrapingResult] = []
-        timeout = aiohttp.ClientTimeout(total=30)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return page, cached
+        if not self.quota.try_consume():
+            logger.warning("NewsAPI daily quota reached — skipping %s page %d", path, page)
+            return page, None
 
+        headers = self.cache.request_headers(key) if self.cache else {}
+        request_params = {**page_params, "apiKey": self.api_key}
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                params = {
-                    "apiKey": self.api_key,
-                    "q": query,
-                    "language": "en",
-                    "pageSize": str(max_articles),
-                    "sortBy": "relevancy",
-                }
-                async with session.get(f"{NEWSAPI_BASE}/everything", params=params) as resp:
-                    if resp.status != 200:
-                        return []
-                    data = await resp.json()
-
-            for item in data.get("articles", []):
-                article = self._parse_item(item)
-                if article:
-                    articles.append(article)
+            async with session.get(url, params=request_params, headers=headers, timeout=REQUEST_TIMEOUT) as resp:
+                if resp.status == 304 and self.cache:
+                    self.cache.record_not_modified()
+                    logger.info("NewsAPI %s page %d not modified", path, page)
+                    return page, self.response_cache.get_stale(key)
+                if resp.status == 429:
+                    logger.error("NewsAPI rate limit hit — pausing until tomorrow (UTC)")
+                    self.quota.exhaust()
+                    return page, None
+                if resp.status != 200:
+                    logger.error("NewsAPI %s page %d returned %s", path, page, resp.status)
+                    return page, None
+                data = await resp.json()
+        except asyncio.TimeoutError:
+            logger.error("NewsAPI %s page %d timed out", path, page)
+            return page, None
         except Exception as exc:
-            logger.error("NewsAPI search error: %s", exc)
+            logger.error("NewsAPI %s page %d error: %s", path, page, exc)
+            return page, None
+        if not isinstance(data, dict):
+            logger.error("NewsAPI %s page %d returned %s, not an object", path, page, type(data).__name__)
+            return page, None
 
-        return articles
+        if self.cache:
+            self.cache.record_response(key, resp.headers)
+            self.cache.save()
+        self.response_cache.put(key, data)
+        return page, data
 
-    # ── internal ─────────────────────────────────────────────────────
 
-    def _parse_item(self, item: Dict[str, Any]) -> Optional[ScrapingResult]:
-        content = item.get("content", "")
-        if not content or content == "[Removed]":
-            return None
+# ── Parsing (runs in the parse pool — keep module-level & picklable) ─
 
-        content = clean_html(content)
-        if len(content.split()) < self.min_words:
-            return None
+def parse_items(items: List[Dict[str, Any]], cutoff: datetime, min_words: int) -> List[ScrapingResult]:
+    """Convert raw NewsAPI article dicts, dropping short or stale items."""
+    return [a for a in (_parse_item(item, cutoff, min_words) for item in items) if a]
 
-        pub_str = item.get("publishedAt", "")
-        pub_date: Optional[datetime] = None
-        if pub_str:
-            try:
-                pub_date = datetime.fromisoformat(pub_str.replace("Z", "+00:00")).replace(tzinfo=None)
-            except Exception:
-                pub_date = datetime.utcnow()
-
-        if pub_date and pub_date < datetime.utcnow() - self.max_age:
-            return None
-
-        return ScrapingResult(
-            title=item.get("title", "Untitled"),
-            content=content,
-            source_url=item.get("url", ""),
-            source_name=item.get("source", {}).get("name", "NewsAPI"),
-            source_type="newsapi",
-            author=item.get("author", "Unknown") or "Unknown",
-            published_at=pub_date or datetime.utcnow(),
-            image_url=item.get("urlToImage", "") or "",
-            excerpt=item.get("description", "")[:200] if item.get("description") else "",
-            meta_data={"source_type": "newsapi", "api_version": "v2"},
-        )
+
+def _parse_item(item: Dict[str, Any], cutoff: datetime, min_words: int) -> Optional[ScrapingResult]:
+    content = item.get("content", "")
+    if not content or content == "[Removed]":
+        return None
+
+    content = clean_html(content)
+    if len(content.split()) < min_words:
+        return None
+
+    pub_str = item.get("publishedAt", "")
+    pub_date: Optional[datetime] = None
+    if pub_str:
+        try:
+            pub_date = datetime.fromisoformat(pub_str.replace("Z", "+00:00")).replace(tzinfo=None)
+        except Exception:
+            pub_date = datetime.utcnow()
+
+    if pub_date and pub_date < cutoff:
+        return None
+
+    return ScrapingResult(
+        title=item.get("title", "Untitled"),
+        content=content,
+        source_url=item.get("url", ""),
+        source_name=item.get("source", {}).get("name", "NewsAPI"),
+        source_type="newsapi",
+        author=item.get("author", "Unknown") or "Unknown",
+        published_at=pub_date or datetime.utcnow(),
+        image_url=item.get("urlToImage", "") or "",
+        excerpt=item.get("description", "")[:200] if item.get("description") else "",
+        meta_data={"source_type": "newsapi", "api_version": "v2"},
+    )
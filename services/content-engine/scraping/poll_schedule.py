@@ -0,0 +1,144 @@
+# services/content-engine/scraping/poll_schedule.py
+"""Adaptive per-feed polling intervals.
+
+Each feed's publish interval is learned from its entry timestamps as an
+EWMA of the median gap between entries.  A feed's poll interval is that
+estimate clamped to ``[min_minutes, max_minutes]``.  So a wire feed that
+posts every few minutes is polled at the floor, and a blog that posts twice
+a day backs off to the ceiling.
+
+If a feed has nothing new (304 or no unseen entries), the time since its
+newest entry is blended in, and the estimate drifts up while the feed is
+quiet.  ``RSSScraper`` skips feeds that are not due yet.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_PATH = Path(__file__).resolve().parent.parent / "data" / "poll_schedule.json"
+
+# Use at most this many entry timestamps per feed for one rate sample
+RATE_SAMPLE_ENTRIES = 30
+
+
+class PollSchedule:
+    """File-backed ``{feed_url: {interval_s, next_due, …}}`` store."""
+
+    def __init__(
+        self,
+        min_minutes: float = 5,
+        max_minutes: float = 240,
+        default_minutes: float = 30,
+        alpha: float = 0.3,
+        path: Path = SCHEDULE_PATH,
+    ) -> None:
+        self.min_s = min_minutes * 60
+        self.max_s = max(max_minutes * 60, self.min_s)
+        self.default_s = default_minutes * 60
+        self.alpha = alpha
+        # A scheduler tick lands a little before ``next_due`` of a feed polled
+        # on the previous tick; count such feeds as due.
+        self.grace = timedelta(seconds=self.min_s / 2)
+        self.path = path
+        self._feeds: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def is_due(self, feed_url: str, now: Optional[datetime] = None) -> bool:
+        state = self._feeds.get(feed_url)
+        if not state or not state.get("next_due"):
+            return True
+        now = now or datetime.utcnow()
+        return now + self.grace >= datetime.fromisoformat(state["next_due"])
+
+    def observe(
+        self,
+        feed_url: str,
+        published: Iterable[datetime],
+        newest: Optional[datetime] = None,
+        now: Optional[datetime] = None,
+    ) -> None:
+        """Update a feed's estimate after a poll.
+
+        ``published`` are the entry timestamps seen in the feed this time
+        (empty on 304).  ``newest`` is the newest entry time known before
+        this poll; it tells us how long a quiet feed has been silent.
+        """
+        now = now or datetime.utcnow()
+        state = self._feeds.setdefault(feed_url, {"publish_interval_s": None})
+        estimate = state.get("publish_interval_s")
+
+        stamps = sorted({p for p in published if p})[-RATE_SAMPLE_ENTRIES:]
+        latest = max([newest] + stamps[-1:], key=lambda d: d or datetime.min)
+        has_new = bool(stamps) and (newest is None or stamps[-1] > newest)
+
+        sample: Optional[float] = None
+        if has_new and len(stamps) >= 2:
+            sample = median((b - a).total_seconds() for a, b in zip(stamps, stamps[1:]))
+        elif not has_new and latest and estimate:
+            sample = max(estimate, (now - latest).total_seconds())
+
+        if sample is not None:
+            sample = max(sample, 1.0)
+            estimate = sample if estimate is None else self.alpha * sample + (1 - self.alpha) * estimate
+            state["publish_interval_s"] = round(estimate, 1)
+
+        self._schedule(state, now)
+
+    def polled(self, feed_url: str, now: Optional[datetime] = None) -> None:
+        """Record a poll that told us nothing (error / timeout) — keep the estimate."""
+        self._schedule(self._feeds.setdefault(feed_url, {"publish_interval_s": None}), now or datetime.utcnow())
+
+    def describe(self, feed_url: str) -> Dict[str, Any]:
+        state = self._feeds.get(feed_url, {})
+        return {
+            "publish_interval_minutes": _minutes(state.get("publish_interval_s")),
+            "poll_interval_minutes": _minutes(state.get("interval_s")) or self.default_s / 60,
+            "last_polled": state.get("last_polled"),
+            "next_due": state.get("next_due"),
+            "due": self.is_due(feed_url),
+        }
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._feeds), encoding="utf-8")
+            self._dirty = False
+            logger.debug("Saved poll schedule for %d feeds", len(self._feeds))
+        except Exception as exc:
+            logger.warning("Could not save poll schedule: %s", exc)
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _schedule(self, state: Dict[str, Any], now: datetime) -> None:
+        estimate = state.get("publish_interval_s")
+        interval = self.default_s if estimate is None else estimate
+        interval = min(max(interval, self.min_s), self.max_s)
+        state["interval_s"] = round(interval, 1)
+        state["last_polled"] = now.isoformat()
+        state["next_due"] = (now + timedelta(seconds=interval)).isoformat()
+        self._dirty = True
+
+    def _load(self) -> None:
+        if self.path.exists():
+            try:
+                self._feeds = json.loads(self.path.read_text(encoding="utf-8"))
+                logger.info("Loaded poll schedule for %d feeds", len(self._feeds))
+            except Exception as exc:
+                logger.warning("Could not load poll schedule: %s", exc)
+
+
+def _minutes(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds / 60, 1) if seconds else None
@@ -2,8 +2,20 @@
 """RSS feed scraper — fetches articles from configurable RSS sources.
 
 Ported from ``scraper-ai/scraping/fetch_news.py`` (RSS portion) with:
-  - async aiohttp fetching
-  - configurable source list
+  - concurrent aiohttp fetching (global + per-host caps), streamed per feed
+  - per-source latency / status report
+  - conditional GET (ETag / Last-Modified) via ``ConditionalCache``
+  - per-feed watermarks so already-seen entries skip HTML work; a feed's
+    watermark and validators are recorded only once the consumer has taken
+    all of its articles
+  - adaptive per-feed poll intervals (feeds that are not due are skipped)
+  - per-feed circuit breaker and p95-based request timeouts
+  - streamed, byte-capped body reads with incremental charset decoding;
+    non-feed Content-Types are rejected before the body is read
+  - WebSub hub discovery; feeds pushed by their hub are not polled
+  - feed parsing / HTML cleaning in the shared parse process pool, with
+    feedparser or the lighter streaming parser (``feed_parser.stream_feed``)
+  - configurable source list or a persistent, sharded ``SourceRegistry``
   - image extraction from media:content / media:thumbnail / inline HTML
   - 7-day freshness filter
   - minimum word-count filter
@@ -11,18 +23,41 @@ Ported from ``scraper-ai/scraping/fetch_news.py`` (RSS portion) with:
 
 from __future__ import annotations
 
+import asyncio
+import codecs
 import logging
+import re
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
 
 import aiohttp
-import feedparser
-from bs4 import BeautifulSoup, Tag
 
-from .base import BaseScraper, ScrapingResult, clean_html
+from utils.http_client import HttpClient
+
+from .base import BaseScraper, ScrapingResult, SourceReport
+from .feed_parser import FeedDocument, FeedFormatError, feedparser_document, stream_feed
+from .html_text import html_to_text
+from .http_cache import ConditionalCache
+from .poll_schedule import RATE_SAMPLE_ENTRIES, PollSchedule
+from .source_health import SourceHealth
+from .source_registry import SourceRegistry
+from .watermark import EMPTY_SNAPSHOT, FeedWatermarks, Snapshot
+from .websub import WebSubSubscriber
 
 logger = logging.getLogger(__name__)
 
+FEED_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Entries taken from one WebSub content delivery
+PUSH_MAX_ENTRIES = 20
+
+READ_CHUNK = 64 * 1024
+_XML_ENCODING = re.compile(rb"""^[^<]*<\?xml[^>]*encoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
+
 # Default RSS sources
 DEFAULT_RSS_SOURCES: List[Dict[str, str]] = [
     {"name": "BBC News", "url": "http://feeds.bbci.co.uk/news/rss.xml"},
@@ -48,94 +83,484 @@ class RSSScraper(BaseScraper):
         sources: List[Dict[str, str]] | None = None,
         max_age_days: int = 7,
         min_words: int = 50,
+        concurrency: int = 8,
+        per_host_limit: int = 2,
+        cache: ConditionalCache | None = None,
+        watermarks: FeedWatermarks | None = None,
+        http: HttpClient | None = None,
+        schedule: PollSchedule | None = None,
+        keep_short: bool = False,
+        health: SourceHealth | None = None,
+        registry: SourceRegistry | None = None,
+        websub: WebSubSubscriber | None = None,
+        parser: str = "feedparser",
+        max_bytes: int = 2 * 1024 * 1024,
     ) -> None:
         self.sources = sources or DEFAULT_RSS_SOURCES
         self.max_age = timedelta(days=max_age_days)
         self.min_words = min_words
+        self.concurrency = max(1, concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.cache = cache
+        self.watermarks = watermarks
+        self.http = http
+        self.schedule = schedule
+        # Keep entries under ``min_words`` (flagged ``short_content``) for a
+        # later full-text stage instead of dropping them here
+        self.keep_short = keep_short
+        self.health = health
+        # When set, the feed list is re-read from the registry on every fetch
+        self.registry = registry
+        self.websub = websub
+        # "feedparser" or "stream" (falls back to feedparser on malformed XML)
+        self.parser = parser
+        self.parser_fallbacks = 0
+        # Bodies are read up to ``max_bytes``; the rest is dropped
+        self.max_bytes = max_bytes
+        self._counters = {"bytes": 0, "truncated": 0, "rejected": 0}
+        self.last_report: List[SourceReport] = []
 
     async def fetch(self, max_per_source: int = 10, **kwargs: Any) -> List[ScrapingResult]:
+        """Fetch all sources concurrently and return every article at once."""
+        return [a async for a in self.stream(max_per_source=max_per_source)]
+
+    async def stream(
+        self, max_per_source: int = 10, force: bool = False, **kwargs: Any
+    ) -> AsyncIterator[ScrapingResult]:
+        """Yield articles feed by feed, in the order the feeds finish.
+
+        At most ``concurrency`` feeds are in flight at once, and at most
+        ``per_host_limit`` against any single host.  ``concurrency=1`` gives
+        the old sequential behaviour.  With a ``schedule``, feeds that are
+        not due yet are skipped (reported as ``not_due``) unless ``force``.
+        With ``health``, feeds whose circuit is open are skipped
+        (``circuit_open``) even when forced.  With ``websub``, feeds with an
+        active push subscription are skipped (``push``) unless ``force``.
+        Per-source
+        outcomes are kept in ``last_report`` once the stream is exhausted
+        (or closed early).
+
+        A feed's watermark and conditional-GET validators are recorded when
+        the consumer asks for the item after its last article.  Feeds whose
+        articles were not all taken before the stream was closed are fetched
+        in full again next time.
+        """
+        global_sem = asyncio.Semaphore(self.concurrency)
+        host_sems: Dict[str, asyncio.Semaphore] = {}
+        sources = self.registry.for_shard() if self.registry else self.sources
+        reports = [SourceReport(name=src["name"], url=src["url"]) for src in sources]
+        due = []
+        for src, report in zip(sources, reports):
+            if self.websub and not force and self.websub.is_active(src["url"]):
+                report.status = "push"
+            elif self.schedule and not force and not self.schedule.is_due(src["url"]):
+                report.status = "not_due"
+            elif self.health and not self.health.allow(src["url"]):
+                report.status = "circuit_open"
+            else:
+                due.append((src, report))
+        started = time.perf_counter()
+        count = 0
+
+        async with self._session(FEED_TIMEOUT) as session:
+            tasks = [
+                asyncio.create_task(
+                    self._fetch_source(session, src, report, max_per_source, global_sem, host_sems)
+                )
+                for src, report in due
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    articles, commit = await next_done
+                    for article in articles:
+                        count += 1
+                        yield article
+                    commit()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                self.last_report = reports
+                if self.cache:
+                    self.cache.save()
+                if self.watermarks:
+                    self.watermarks.save()
+                if self.schedule:
+                    self.schedule.save()
+                if self.health:
+                    self.health.save()
+                if self.websub:
+                    self.websub.save()
+
+        logger.info(
+            "RSS scraper collected %d articles from %d/%d due feeds in %.0f ms",
+            count,
+            len(due),
+            len(sources),
+            (time.perf_counter() - started) * 1000,
+        )
+
+    async def _fetch_source(
+        self,
+        session: aiohttp.ClientSession,
+        src: Dict[str, str],
+        report: SourceReport,
+        max_per_source: int,
+        global_sem: asyncio.Semaphore,
+        host_sems: Dict[str, asyncio.Semaphore],
+    ) -> Tuple[List[ScrapingResult], Callable[[], None]]:
+        """Fetch and parse one feed.
+
+        Returns its articles and a callback that records the feed as read
+        (validators, watermark), for ``stream`` to call once they are consumed.
+        """
+        host = urlparse(src["url"]).hostname or src["url"]
+        host_sem = host_sems.setdefault(host, asyncio.Semaphore(self.per_host_limit))
         articles: List[ScrapingResult] = []
-        timeout = aiohttp.ClientTimeout(total=30)
-
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            for src in self.sources:
-                try:
-                    logger.info("Fetching RSS from %s", src["name"])
-                    async with session.get(src["url"]) as resp:
-                        if resp.status != 200:
-                            logger.warning("%s returned %s", src["name"], resp.status)
-                            continue
-                        raw = await resp.text()
-
-                    feed = feedparser.parse(raw)
-                    for entry in feed.entries[:max_per_source]:
-                        article = self._parse_entry(entry, src)
-                        if article:
-                            articles.append(article)
-
-                except Exception as exc:
-                    logger.error("Error fetching %s: %s", src["name"], exc)
-
-        logger.info("RSS scraper collected %d articles from %d feeds", len(articles), len(self.sources))
-        return articles
+        commit: Callable[[], None] = _nothing
+
+        # Host slot first: a feed queued behind a busy host must not hold a
+        # global slot that feeds on other hosts could use
+        async with host_sem, global_sem:
+            started = time.perf_counter()
+            network_ms = 0.0  # download only, without parsing (drives adaptive timeouts)
+            try:
+                logger.info("Fetching RSS from %s", src["name"])
+                headers = self.cache.request_headers(src["url"]) if self.cache else {}
+                timeout = (
+                    aiohttp.ClientTimeout(total=self.health.timeout_for(src["url"]))
+                    if self.health
+                    else FEED_TIMEOUT
+                )
+                async with session.get(src["url"], headers=headers, timeout=timeout) as resp:
+                    report.http_status = resp.status
+                    network_ms = (time.perf_counter() - started) * 1000
+                    if resp.status == 304 and self.cache:
+                        self.cache.record_not_modified()
+                        report.status = "not_modified"
+                        if self.schedule:
+                            self.schedule.observe(src["url"], (), self._newest(src["url"]))
+                        return articles, commit
+                    if resp.status != 200:
+                        logger.warning("%s returned %s", src["name"], resp.status)
+                        report.status = "http_error"
+                        report.error = f"HTTP {resp.status}"
+                        return articles, commit
+                    ctype = resp.headers.get("Content-Type", "")
+                    if not _is_feed_type(ctype):
+                        logger.warning("%s served %s — not a feed, body not read", src["name"], ctype)
+                        self._counters["rejected"] += 1
+                        report.status = "bad_content_type"
+                        report.error = ctype[:100]
+                        return articles, commit
+                    raw, report.bytes, report.truncated = await self._read_body(resp)
+                    self._counters["bytes"] += report.bytes
+                    if report.truncated:
+                        self._counters["truncated"] += 1
+                        logger.warning(
+                            "%s body exceeds %d KiB — parsing the first part only",
+                            src["name"], self.max_bytes // 1024,
+                        )
+                    network_ms = (time.perf_counter() - started) * 1000
+                    validators = resp.headers
+                    header_hub = str(resp.links.get("hub", {}).get("url", ""))
+
+                parsed = await self._parse_feed(raw, src, max_per_source, report, header_hub)
+                articles = parsed.articles
+                commit = partial(self._commit, src["url"], parsed, validators)
+                report.status = "ok"
+                report.items = len(articles)
+
+            except asyncio.TimeoutError:
+                logger.error("Timed out fetching %s", src["name"])
+                report.status = "timeout"
+                report.error = "timeout"
+            except Exception as exc:
+                logger.error("Error fetching %s: %s", src["name"], exc)
+                report.status = "error"
+                report.error = str(exc)
+            finally:
+                report.latency_ms = round((time.perf_counter() - started) * 1000, 1)
+                failed = report.status in ("http_error", "bad_content_type", "timeout", "error")
+                if self.schedule and failed:
+                    self.schedule.polled(src["url"])
+                if self.health:
+                    if failed:
+                        self.health.record_failure(src["url"], report.error or report.status)
+                    elif report.status in ("ok", "not_modified"):
+                        self.health.record_success(src["url"], network_ms)
+                    if report.truncated:
+                        self.health.record_body_event(src["url"], "truncated")
+                    elif report.status == "bad_content_type":
+                        self.health.record_body_event(src["url"], "rejected")
+
+        return articles, commit
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "parser": self.parser,
+            "parser_fallbacks": self.parser_fallbacks,
+            "max_kb": self.max_bytes // 1024,
+            **self._counters,
+        }
+
+    async def parse_pushed(
+        self, raw: bytes, source: Dict[str, str], charset: Optional[str] = None
+    ) -> List[ScrapingResult]:
+        """Articles from a WebSub content delivery (same filters and watermark as a poll).
+
+        The body is decoded like a polled one: declared ``charset``, else a
+        BOM / the XML declaration, else UTF-8.
+        """
+        report = SourceReport(name=source["name"], url=source["url"])
+        text = raw[: self.max_bytes].decode(_charset(charset, raw[:READ_CHUNK]), errors="replace")
+        parsed = await self._parse_feed(text, source, PUSH_MAX_ENTRIES, report)
+        self._commit(source["url"], parsed)
+        return parsed.articles
 
     # ── internal ─────────────────────────────────────────────────────
 
-    def _parse_entry(self, entry: Any, source: Dict[str, str]) -> ScrapingResult | None:
-        # Published date
-        pub_date = self._parse_date(entry)
-        if pub_date and pub_date < datetime.utcnow() - self.max_age:
-            return None
-
-        # Content
-        content = ""
-        if hasattr(entry, "content") and entry.content:
-            content = entry.content[0].value
-        elif hasattr(entry, "summary"):
-            content = entry.summary
-        elif hasattr(entry, "description"):
-            content = entry.description
-        content = clean_html(content)
-
-        if len(content.split()) < self.min_words:
-            return None
-
-        return ScrapingResult(
-            title=entry.get("title", "Untitled"),
-            content=content,
-            source_url=entry.get("link", ""),
-            source_name=source["name"],
-            source_type="rss",
-            author=getattr(entry, "author", "Unknown"),
-            published_at=pub_date or datetime.utcnow(),
-            image_url=self._extract_image(entry),
-            meta_data={"source_type": "rss", "feed_url": source["url"]},
+    async def _parse_feed(
+        self,
+        raw: str,
+        source: Dict[str, str],
+        max_per_source: int,
+        report: SourceReport,
+        header_hub: str = "",
+    ) -> ParsedFeed:
+        """Parse a feed in the parse pool (the watermark is advanced by ``_commit``)."""
+        known = self.watermarks.snapshot(source["url"]) if self.watermarks else EMPTY_SNAPSHOT
+        parsed = await self.run_cpu(
+            parse_feed,
+            raw,
+            source,
+            max_per_source,
+            datetime.utcnow() - self.max_age,
+            self.min_words,
+            known,
+            self.keep_short,
+            self.parser,
         )
+        if parsed.parser != self.parser:
+            self.parser_fallbacks += 1
+            logger.debug("%s is not well-formed XML — parsed with feedparser", source["name"])
+        report.skipped += parsed.skipped
+        hub = header_hub or parsed.hub
+        if self.websub and hub:
+            self.websub.discovered(source["url"], hub, parsed.topic or source["url"])
+        return parsed
+
+    def _commit(
+        self, feed_url: str, parsed: ParsedFeed, validators: Optional[Mapping[str, str]] = None
+    ) -> None:
+        """Record a parsed feed as read: new conditional-GET validators, publish rate, watermark."""
+        if self.cache and validators is not None:
+            self.cache.record_response(feed_url, validators)
+        if self.schedule:
+            # before ``advance``: the estimate needs the newest entry known before this poll
+            self.schedule.observe(feed_url, parsed.published, self._newest(feed_url))
+        if self.watermarks:
+            self.watermarks.advance(feed_url, parsed.examined, parsed.newest)
+
+    async def _read_body(self, resp: aiohttp.ClientResponse) -> Tuple[str, int, bool]:
+        """Stream at most ``max_bytes`` of the body, decoding chunk by chunk.
+
+        Returns ``(text, bytes_read, truncated)``.  The charset comes from
+        the Content-Type header, else a BOM / the XML declaration, else UTF-8.
+        """
+        decoder: Optional[codecs.IncrementalDecoder] = None
+        parts: List[str] = []
+        size = 0
+        truncated = False
+        async for chunk in resp.content.iter_chunked(READ_CHUNK):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(_charset(resp.charset, chunk))(errors="replace")
+            if size + len(chunk) > self.max_bytes:
+                chunk = chunk[: self.max_bytes - size]
+                truncated = True
+            size += len(chunk)
+            parts.append(decoder.decode(chunk))
+            if truncated:
+                break
+        if decoder is not None:
+            parts.append(decoder.decode(b"", final=True))
+        return "".join(parts), size, truncated
+
+    def _newest(self, feed_url: str) -> Optional[datetime]:
+        return self.watermarks.newest(feed_url) if self.watermarks else None
+
 
-    @staticmethod
-    def _parse_date(entry: Any) -> datetime | None:
-        for attr in ("published_parsed", "updated_parsed"):
-            parsed = getattr(entry, attr, None)
-            if parsed:
-                try:
-                    return datetime(*parsed[:6])
-                except Exception:
-                    pass
+def _nothing() -> None:
+    pass
+
+
+def _is_feed_type(content_type: str) -> bool:
+    """False for bodies that cannot be a feed (images, video, PDFs, JSON …)."""
+    mime = content_type.split(";", 1)[0].strip().lower()
+    return not mime or mime.startswith("text/") or "xml" in mime or "rss" in mime or "atom" in mime
+
+
+def _charset(declared: Optional[str], head: bytes) -> str:
+    for candidate in (declared, _bom_charset(head), _xml_charset(head)):
+        if candidate:
+            try:
+                return codecs.lookup(candidate).name
+            except LookupError:
+                continue
+    return "utf-8"
+
+
+def _bom_charset(head: bytes) -> Optional[str]:
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    return None
+
+
+def _xml_charset(head: bytes) -> Optional[str]:
+    match = _XML_ENCODING.match(head[:512])
+    return match.group(1).decode("ascii") if match else None
+
+
+# ── Parsing (runs in the parse pool — keep module-level & picklable) ─
+
+@dataclass
+class ParsedFeed:
+    articles: List[ScrapingResult] = field(default_factory=list)
+    examined: List[str] = field(default_factory=list)
+    newest: Optional[datetime] = None
+    skipped: int = 0
+    published: List[datetime] = field(default_factory=list)  # first entries' dates (publish-rate sample)
+    hub: str = ""    # WebSub hub advertised by the feed (rel="hub")
+    topic: str = ""  # the feed's canonical URL (rel="self"), the WebSub topic
+    parser: str = "feedparser"  # backend that produced the result
+
+
+def parse_feed(
+    raw: str,
+    source: Dict[str, str],
+    max_per_source: int,
+    cutoff: datetime,
+    min_words: int,
+    known: Snapshot = EMPTY_SNAPSHOT,
+    keep_short: bool = False,
+    parser: str = "feedparser",
+) -> ParsedFeed:
+    """Parse up to ``max_per_source`` entries of one feed not covered by ``known``.
+
+    ``parser="stream"`` stops reading the document once enough entries are
+    taken; malformed XML is re-parsed with feedparser.
+    """
+    args = (source, max_per_source, cutoff, min_words, known, keep_short)
+    if parser == "stream":
+        try:
+            return _collect(stream_feed(raw), *args, parser="stream")
+        except FeedFormatError:
+            pass
+    return _collect(feedparser_document(raw), *args)
+
+
+def _collect(
+    doc: FeedDocument,
+    source: Dict[str, str],
+    max_per_source: int,
+    cutoff: datetime,
+    min_words: int,
+    known: Snapshot,
+    keep_short: bool,
+    parser: str = "feedparser",
+) -> ParsedFeed:
+    out = ParsedFeed(parser=parser)
+    for i, entry in enumerate(doc.entries):
+        pub_date = _parse_date(entry)
+        if pub_date and i < RATE_SAMPLE_ENTRIES:
+            out.published.append(pub_date)
+        if len(out.examined) >= max_per_source:
+            if i >= RATE_SAMPLE_ENTRIES:
+                break
+            continue
+        entry_id = FeedWatermarks.entry_id(entry)
+        if FeedWatermarks.is_seen(entry_id, pub_date, known):
+            out.skipped += 1
+            continue
+
+        out.examined.append(entry_id)
+        if pub_date and (out.newest is None or pub_date > out.newest):
+            out.newest = pub_date
+        article = _parse_entry(entry, source, pub_date, cutoff, min_words, keep_short)
+        if article:
+            out.articles.append(article)
+
+    for link in doc.links:
+        rel, href = link.get("rel"), link.get("href", "")
+        if rel == "hub" and not out.hub:
+            out.hub = href
+        elif rel == "self" and not out.topic:
+            out.topic = href
+    return out
+
+
+def _parse_entry(
+    entry: Any,
+    source: Dict[str, str],
+    pub_date: datetime | None,
+    cutoff: datetime,
+    min_words: int,
+    keep_short: bool = False,
+) -> ScrapingResult | None:
+    if pub_date and pub_date < cutoff:
         return None
 
-    @staticmethod
-    def _extract_image(entry: Any) -> str:
-        if hasattr(entry, "media_content") and entry.media_content:
-            return entry.media_content[0].get("url", "")
-        if hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
-            return entry.media_thumbnail[0].get("url", "")
-        if hasattr(entry, "links"):
-            for link in entry.links:
-                if link.get("type", "").startswith("image/"):
-                    return link.get("href", "")
-        if hasattr(entry, "content") and entry.content:
-            soup = BeautifulSoup(entry.content[0].value, "html.parser")
-            img = soup.find("img")
-            if img and isinstance(img, Tag) and img.get("src"):
-                return str(img["src"])
-        return ""
+    # Content
+    content = ""
+    if hasattr(entry, "content") and entry.content:
+        content = entry.content[0].value
+    elif hasattr(entry, "summary"):
+        content = entry.summary
+    elif hasattr(entry, "description"):
+        content = entry.description
+    content, inline_image = html_to_text(content)
+
+    short = len(content.split()) < min_words
+    if short and not keep_short:
+        return None
+    meta_data = {"source_type": "rss", "feed_url": source["url"]}
+    if short:
+        meta_data["short_content"] = True
+
+    return ScrapingResult(
+        title=entry.get("title", "Untitled"),
+        content=content,
+        # feedburner feeds link a redirect; origLink is the article itself
+        source_url=entry.get("feedburner_origlink") or entry.get("link", ""),
+        source_name=source["name"],
+        source_type="rss",
+        author=getattr(entry, "author", "Unknown"),
+        published_at=pub_date or datetime.utcnow(),
+        image_url=_extract_image(entry) or inline_image,
+        meta_data=meta_data,
+    )
+
+
+def _parse_date(entry: Any) -> datetime | None:
+    for attr in ("published_parsed", "updated_parsed"):
+        parsed = getattr(entry, attr, None)
+        if parsed:
+            try:
+                return datetime(*parsed[:6])
+            except Exception:
+                pass
+    return None
+
+
+def _extract_image(entry: Any) -> str:
+    if hasattr(entry, "media_content") and entry.media_content:
+        return entry.media_content[0].get("url", "")
+    if hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
+        return entry.media_thumbnail[0].get("url", "")
+    if hasattr(entry, "links"):
+        for link in entry.links:
+            if link.get("type", "").startswith("image/"):
+                return link.get("href", "")
+    # Inline <img> is picked up by html_to_text while cleaning the content
+    return ""
@@ -0,0 +1,186 @@
+# services/content-engine/scraping/source_health.py
+"""Per-source circuit breaker and adaptive request timeouts.
+
+Every feed has a small state machine:
+
+  closed     requests go through; ``failure_threshold`` consecutive
+             failures open the breaker
+  open       the source is skipped until its cooldown ends; the cooldown
+             doubles on every trip, up to ``max_cooldown``
+  half_open  after the cooldown, one probe request goes through and the
+             rest are refused until it reports back (or its lease of
+             ``PROBE_LEASE`` runs out); success closes the breaker,
+             failure opens it again with a longer cooldown
+
+The request timeout of a healthy source follows its observed p95 latency
+(``TIMEOUT_P95_FACTOR`` × p95, clamped to ``[floor, cap]``).  A dead host
+then costs a few seconds instead of the full 30 s ``ClientTimeout``.
+
+Oversized (truncated) and non-feed (rejected) response bodies are counted
+per source as well, so a misbehaving feed shows up in ``/scraping/sources``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+HEALTH_PATH = Path(__file__).resolve().parent.parent / "data" / "source_health.json"
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+# Latency samples kept per source, and how many are needed before timeouts adapt
+LATENCY_WINDOW = 20
+MIN_LATENCY_SAMPLES = 5
+TIMEOUT_P95_FACTOR = 3.0
+# A half-open probe that never reports back (cancelled run) is replaced after this
+PROBE_LEASE = timedelta(minutes=5)
+
+
+class SourceHealth:
+    """File-backed breaker state + latency history keyed by source URL."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown_minutes: float = 5,
+        max_cooldown_minutes: float = 360,
+        timeout_floor_s: float = 5,
+        timeout_cap_s: float = 30,
+        path: Path = HEALTH_PATH,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = timedelta(minutes=cooldown_minutes)
+        self.max_cooldown = timedelta(minutes=max(max_cooldown_minutes, cooldown_minutes))
+        self.timeout_floor_s = timeout_floor_s
+        self.timeout_cap_s = max(timeout_cap_s, timeout_floor_s)
+        self.path = path
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def allow(self, url: str, now: Optional[datetime] = None) -> bool:
+        """True if a request may go out.
+
+        An expired ``open`` moves to ``half_open`` and lets a single probe
+        through; ``half_open`` refuses requests while that probe is out.
+        """
+        state = self._sources.get(url)
+        if not state or state["state"] == CLOSED:
+            return True
+        now = now or datetime.utcnow()
+        if state["state"] == OPEN:
+            if now < datetime.fromisoformat(state["open_until"]):
+                return False
+            state["state"] = HALF_OPEN
+            logger.info("Circuit half-open for %s — sending probe", url)
+        elif state.get("probe_until") and now < datetime.fromisoformat(state["probe_until"]):
+            return False
+        else:
+            logger.info("Probe for %s never reported back — sending another", url)
+        state["probe_until"] = (now + PROBE_LEASE).isoformat()
+        self._dirty = True
+        return True
+
+    def timeout_for(self, url: str) -> float:
+        """Request timeout (seconds) adapted to the source's p95 latency."""
+        p95 = self._p95_ms(url)
+        if p95 is None:
+            return self.timeout_cap_s
+        return min(max(p95 / 1000 * TIMEOUT_P95_FACTOR, self.timeout_floor_s), self.timeout_cap_s)
+
+    def record_success(self, url: str, latency_ms: float) -> None:
+        state = self._state(url)
+        if state["state"] != CLOSED:
+            logger.info("Circuit closed for %s", url)
+        state.update(state=CLOSED, failures=0, trips=0, open_until=None, probe_until=None)
+        state["latencies"] = (state["latencies"] + [round(latency_ms, 1)])[-LATENCY_WINDOW:]
+        state["last_success"] = datetime.utcnow().isoformat()
+        self._dirty = True
+
+    def record_failure(self, url: str, error: str, now: Optional[datetime] = None) -> None:
+        now = now or datetime.utcnow()
+        state = self._state(url)
+        state["failures"] += 1
+        state["last_error"] = error[:200]
+        state["last_failure"] = now.isoformat()
+        state["probe_until"] = None
+        if state["state"] == HALF_OPEN or state["failures"] >= self.failure_threshold:
+            state["trips"] += 1
+            cooldown = min(self.cooldown * 2 ** (state["trips"] - 1), self.max_cooldown)
+            state["state"] = OPEN
+            state["open_until"] = (now + cooldown).isoformat()
+            logger.warning(
+                "Circuit open for %s after %d failure(s) — cooling down %.0f min (%s)",
+                url, state["failures"], cooldown.total_seconds() / 60, error[:80],
+            )
+        self._dirty = True
+
+    def record_body_event(self, url: str, kind: str) -> None:
+        """Count a ``truncated`` or ``rejected`` response body for the source."""
+        events = self._state(url).setdefault("body_events", {})
+        events[kind] = events.get(kind, 0) + 1
+        self._dirty = True
+
+    def is_open(self, url: str) -> bool:
+        """True while the source is being skipped (open and still cooling down)."""
+        state = self._sources.get(url, {})
+        return state.get("state") == OPEN and datetime.utcnow() < datetime.fromisoformat(state["open_until"])
+
+    def open_urls(self) -> List[str]:
+        """Sources currently being skipped (see ``is_open``)."""
+        return [url for url in self._sources if self.is_open(url)]
+
+    def describe(self, url: str) -> Dict[str, Any]:
+        state = self._sources.get(url, {})
+        p95 = self._p95_ms(url)
+        return {
+            "state": state.get("state", CLOSED),
+            "consecutive_failures": state.get("failures", 0),
+            "open_until": state.get("open_until"),
+            "timeout_s": round(self.timeout_for(url), 1),
+            "p95_latency_ms": round(p95, 1) if p95 is not None else None,
+            "last_success": state.get("last_success"),
+            "last_error": state.get("last_error", ""),
+            "truncated_bodies": state.get("body_events", {}).get("truncated", 0),
+            "rejected_bodies": state.get("body_events", {}).get("rejected", 0),
+        }
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._sources), encoding="utf-8")
+            self._dirty = False
+            logger.debug("Saved health for %d sources", len(self._sources))
+        except Exception as exc:
+            logger.warning("Could not save source health: %s", exc)
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _state(self, url: str) -> Dict[str, Any]:
+        return self._sources.setdefault(
+            url, {"state": CLOSED, "failures": 0, "trips": 0, "open_until": None, "latencies": []}
+        )
+
+    def _p95_ms(self, url: str) -> Optional[float]:
+        samples: List[float] = sorted(self._sources.get(url, {}).get("latencies", []))
+        if len(samples) < MIN_LATENCY_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))]
+
+    def _load(self) -> None:
+        if self.path.exists():
+            try:
+                self._sources = json.loads(self.path.read_text(encoding="utf-8"))
+                logger.info("Loaded health for %d sources", len(self._sources))
+            except Exception as exc:
+                logger.warning("Could not load source health: %s", exc)
@@ -0,0 +1,155 @@
+# services/content-engine/scraping/source_registry.py
+"""Persistent RSS source registry with hash sharding.
+
+Feeds live in a small SQLite database (``data/sources.db``) instead of the
+hard-coded ``DEFAULT_RSS_SOURCES`` list, which only seeds an empty
+registry.  Feeds can be added or removed at runtime through
+``/scraping/sources``.  ``RSSScraper`` reads the registry at the start of
+every fetch, so no restart is needed.
+
+For scale-out, run one engine per shard with ``SHARD_INDEX`` /
+``SHARD_COUNT``.  A feed belongs to shard ``crc32(url) % SHARD_COUNT``, so
+every shard polls a stable, disjoint subset of roughly equal size.  The
+database runs in WAL mode and can be shared by all shards.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import zlib
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_PATH = Path(__file__).resolve().parent.parent / "data" / "sources.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feeds (
+    url        TEXT PRIMARY KEY,
+    name       TEXT NOT NULL,
+    enabled    INTEGER NOT NULL DEFAULT 1,
+    shard_key  INTEGER NOT NULL,
+    added_at   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS feeds_shard ON feeds (enabled, shard_key);
+CREATE INDEX IF NOT EXISTS feeds_name ON feeds (name, url);
+"""
+
+
+def shard_key(url: str) -> int:
+    """Stable 32-bit hash of a feed URL (same on every process / platform)."""
+    return zlib.crc32(url.encode("utf-8"))
+
+
+class SourceRegistry:
+    """SQLite-backed feed list; ``for_shard()`` returns this engine's subset."""
+
+    def __init__(
+        self,
+        path: Path = REGISTRY_PATH,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        seed: Iterable[Dict[str, str]] = (),
+    ) -> None:
+        if shard_count < 1 or not 0 <= shard_index < shard_count:
+            raise ValueError(f"Invalid shard {shard_index}/{shard_count}")
+        self.path = path
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as db, db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+            if db.execute("SELECT COUNT(*) FROM feeds").fetchone()[0] == 0:
+                self._insert(db, seed)
+        logger.info(
+            "Source registry: %d feeds, shard %d/%d owns %d",
+            self.count(), shard_index, shard_count, len(self.for_shard()),
+        )
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def for_shard(self) -> List[Dict[str, str]]:
+        """Enabled feeds owned by this shard."""
+        with closing(self._connect()) as db:
+            rows = db.execute(
+                "SELECT name, url FROM feeds WHERE enabled = 1 AND shard_key % ? = ? ORDER BY name",
+                (self.shard_count, self.shard_index),
+            ).fetchall()
+        return [{"name": r["name"], "url": r["url"]} for r in rows]
+
+    def all(self, limit: int = -1, offset: int = 0) -> List[Dict[str, Any]]:
+        """Feeds (with their shard) ordered by name, one page at a time for listing."""
+        with closing(self._connect()) as db:
+            rows = db.execute(
+                "SELECT * FROM feeds ORDER BY name, url LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+        return [self._row(r) for r in rows]
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with closing(self._connect()) as db:
+            row = db.execute("SELECT * FROM feeds WHERE url = ?", (url,)).fetchone()
+        return self._row(row) if row else None
+
+    def add(self, name: str, url: str, enabled: bool = True) -> Dict[str, Any]:
+        """Insert or update a feed; returns the stored record."""
+        with closing(self._connect()) as db, db:
+            db.execute(
+                "INSERT INTO feeds (url, name, enabled, shard_key, added_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET name = excluded.name, enabled = excluded.enabled",
+                (url, name, int(enabled), shard_key(url), datetime.utcnow().isoformat()),
+            )
+        logger.info("Registered feed %s (%s) on shard %d", name, url, self.shard_of(url))
+        return self.get(url)  # type: ignore[return-value]
+
+    def remove(self, url: str) -> bool:
+        with closing(self._connect()) as db, db:
+            removed = db.execute("DELETE FROM feeds WHERE url = ?", (url,)).rowcount
+        return bool(removed)
+
+    def shard_of(self, url: str) -> int:
+        return shard_key(url) % self.shard_count
+
+    def count(self, enabled_only: bool = False) -> int:
+        query = "SELECT COUNT(*) FROM feeds" + (" WHERE enabled = 1" if enabled_only else "")
+        with closing(self._connect()) as db:
+            return db.execute(query).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with closing(self._connect()) as db:
+            total, enabled = db.execute("SELECT COUNT(*), SUM(enabled) FROM feeds").fetchone()
+        return {
+            "feeds": total,
+            "enabled": enabled or 0,
+            "shard_index": self.shard_index,
+            "shard_count": self.shard_count,
+            "shard_feeds": len(self.for_shard()),
+        }
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, timeout=10)
+        db.row_factory = sqlite3.Row
+        return db
+
+    @staticmethod
+    def _insert(db: sqlite3.Connection, feeds: Iterable[Dict[str, str]]) -> None:
+        now = datetime.utcnow().isoformat()
+        db.executemany(
+            "INSERT OR IGNORE INTO feeds (url, name, enabled, shard_key, added_at) VALUES (?, ?, 1, ?, ?)",
+            [(f["url"], f["name"], shard_key(f["url"]), now) for f in feeds],
+        )
+
+    def _row(self, row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "name": row["name"],
+            "url": row["url"],
+            "enabled": bool(row["enabled"]),
+            "shard": row["shard_key"] % self.shard_count,
+            "added_at": row["added_at"],
+        }
@@ -5,23 +5,50 @@ Ported from ``scraper-ai/scraping/tradingview_indices.py`` with:
   - async wrapper around synchronous requests (TradingView blocks aiohttp)
   - result expressed as ``MarketIndex`` models
   - integrated into the unified scraper interface
+  - lxml table parsing with a header-driven column map resolved once per page
+  - region pages from ``TradingViewConfig`` fetched concurrently (one worker
+    thread each, jittered retries) and merged by symbol
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import re
+import threading
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup, Tag
+from lxml.html import HtmlElement
+
+from models.market import TradingViewConfig
+from scraping.base import SourceReport
 
 logger = logging.getLogger(__name__)
 
-INDEX_URL = "https://in.tradingview.com/markets/indices/quotes-all/"
+BASE_URL = "https://in.tradingview.com/markets/indices"
+INDEX_URL = f"{BASE_URL}/quotes-all/"
+
+# Region name → indices overview page
+REGION_PAGES: Dict[str, str] = {
+    "all": INDEX_URL,
+    "major": f"{BASE_URL}/quotes-major/",
+    "americas": f"{BASE_URL}/quotes-americas/",
+    "europe": f"{BASE_URL}/quotes-europe/",
+    "asia": f"{BASE_URL}/quotes-asia/",
+}
+
+REGION_ALIASES: Dict[str, str] = {
+    "us": "americas", "usa": "americas", "america": "americas", "ca": "americas",
+    "eu": "europe", "uk": "europe", "gb": "europe",
+    "in": "asia", "india": "asia", "apac": "asia", "jp": "asia", "cn": "asia",
+    "global": "all", "world": "all",
+}
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -35,6 +62,23 @@ CURRENCY_PREFIX_MAP: Dict[str, str] = {
     "₽": "RUB", "₨": "INR", "₪": "ILS", "₡": "CRC",
 }
 
+# Header / data-label aliases per field (lower-case)
+COLUMN_LABELS: Dict[str, List[str]] = {
+    "last": ["last", "price", "last price"],
+    "change_percent": ["change %", "chg %", "change percent"],
+    "change": ["change", "chg"],
+    "high": ["high", "day high"],
+    "low": ["low", "day low"],
+    "currency": ["currency", "curr"],
+    "exchange": ["exchange", "exch"],
+    "country": ["country", "region"],
+}
+
+# Column positions used when no header / label matches
+DEFAULT_COLUMNS: Dict[str, int] = {"last": 1, "change_percent": 2, "change": 3, "high": 4, "low": 5}
+
+_TABLE_TAG_RE = re.compile(r"<(/?)table\b[^>]*>", re.I)
+
 
 @dataclass
 class IndexQuote:
@@ -62,17 +106,55 @@ class TradingViewScraper:
     Wrapped in ``asyncio.to_thread`` for non-blocking calls from FastAPI.
     """
 
-    def __init__(self, limit: int | None = None) -> None:
+    def __init__(self, limit: int | None = None, config: TradingViewConfig | None = None) -> None:
         self.limit = limit
-        self._session = requests.Session()
-        self._session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"})
+        self.config = config or TradingViewConfig(regions=["all"])
+        self.pages = self.region_pages(self.config.regions)
+        self.last_report: List[SourceReport] = []
+        self._local = threading.local()
+
+    @staticmethod
+    def region_pages(regions: Iterable[str]) -> Dict[str, str]:
+        """Resolve region names / aliases (or full URLs) to unique page URLs."""
+        pages: Dict[str, str] = {}
+        for raw in regions:
+            region = raw.strip().lower()
+            if not region:
+                continue
+            if region.startswith("http"):
+                url = raw.strip()
+            else:
+                region = REGION_ALIASES.get(region, region)
+                url = REGION_PAGES.get(region, "")
+                if not url:
+                    logger.warning("Unknown TradingView region '%s' — ignored", raw)
+                    continue
+            if url not in pages.values():
+                pages[region] = url
+        return pages or {"all": INDEX_URL}
 
     # ── public async API ─────────────────────────────────────────────
 
     async def fetch(self, limit: int | None = None) -> List[IndexQuote]:
-        """Fetch index quotes (runs the synchronous I/O in a thread)."""
+        """Fetch all region pages concurrently (one worker thread each) and merge by symbol."""
         effective_limit = limit or self.limit
-        return await asyncio.to_thread(self._fetch_sync, effective_limit)
+        reports = [SourceReport(name=f"tradingview:{region}", url=url) for region, url in self.pages.items()]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._fetch_region, r, effective_limit) for r in reports)
+        )
+        self.last_report = reports
+
+        if all(r.status != "ok" for r in reports):
+            raise RuntimeError(
+                "TradingView fetch failed for all regions: "
+                + "; ".join(f"{r.name}: {r.error}" for r in reports)
+            )
+
+        quotes = self._merge(results)
+        if self.config.indices:
+            wanted = {s.upper() for s in self.config.indices}
+            quotes = [q for q in quotes if q.symbol.upper() in wanted]
+        return quotes[:effective_limit] if effective_limit else quotes
 
     async def fetch_and_format(self, limit: int | None = None) -> List[dict]:
         """Fetch and convert to serialisable dicts for API delivery."""
@@ -81,49 +163,106 @@ class TradingViewScraper:
 
     # ── synchronous core ─────────────────────────────────────────────
 
-    def _fetch_sync(self, limit: int | None = None) -> List[IndexQuote]:
-        html = self._session.get(INDEX_URL, timeout=15).text
-        return list(self._parse_rows(html, limit))
+    def _fetch_region(self, report: SourceReport, limit: int | None = None) -> List[IndexQuote]:
+        """Fetch + parse one region page with jittered exponential backoff (worker thread)."""
+        attempts = self.config.retry_count + 1
+        timeout = self.config.timeout_ms / 1000
+        for attempt in range(1, attempts + 1):
+            t0 = time.perf_counter()
+            try:
+                resp = self._session.get(report.url, timeout=timeout)
+                report.http_status = resp.status_code
+                resp.raise_for_status()
+                quotes = list(self._parse_rows(resp.text, limit))
+                report.latency_ms = round((time.perf_counter() - t0) * 1000, 1)
+                report.status, report.items, report.error = "ok", len(quotes), ""
+                return quotes
+            except requests.Timeout as exc:
+                report.status, report.error = "timeout", str(exc)
+            except requests.HTTPError as exc:
+                report.status, report.error = "http_error", str(exc)
+            except Exception as exc:
+                report.status, report.error = "error", str(exc)
+            report.latency_ms = round((time.perf_counter() - t0) * 1000, 1)
+
+            if attempt < attempts:
+                delay = self.config.retry_delay_s * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+                logger.warning(
+                    "TradingView %s attempt %d/%d failed (%s) — retrying in %.1fs",
+                    report.name, attempt, attempts, report.error, delay,
+                )
+                time.sleep(delay)
+
+        logger.error("TradingView %s failed after %d attempts: %s", report.name, attempts, report.error)
+        return []
+
+    @property
+    def _session(self) -> requests.Session:
+        """One ``requests.Session`` per worker thread (sessions are not thread-safe)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"})
+        return session
+
+    @staticmethod
+    def _merge(results: Iterable[List[IndexQuote]]) -> List[IndexQuote]:
+        """Merge region results by symbol; later pages only fill fields still missing."""
+        merged: Dict[str, IndexQuote] = {}
+        for quotes in results:
+            for q in quotes:
+                seen = merged.get(q.symbol)
+                if seen is None:
+                    merged[q.symbol] = q
+                    continue
+                for field, value in asdict(q).items():
+                    if value is not None and getattr(seen, field) is None:
+                        setattr(seen, field, value)
+        return list(merged.values())
 
     def _parse_rows(self, html: str, limit: int | None = None) -> Iterable[IndexQuote]:
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.find("table")
+        table = self._find_table(html)
         if table is None:
             raise RuntimeError("TradingView indices table not found")
 
-        body = table.find("tbody") or table
-        rows = body.find_all("tr", recursive=False)
+        body = table.find("tbody")
+        rows = (body if body is not None else table).findall("tr")
+        columns = self._column_map(table, rows)
         count = 0
 
         for row in rows:
             if limit is not None and count >= limit:
                 break
-            quote = self._parse_row(row)
+            quote = self._parse_row(row, columns)
             if quote:
                 count += 1
                 yield quote
 
-    def _parse_row(self, row: Tag) -> Optional[IndexQuote]:
-        cells = row.find_all("td", recursive=False)
+    def _parse_row(self, row: HtmlElement, columns: Dict[str, int]) -> Optional[IndexQuote]:
+        cells = row.findall("td")
         if len(cells) < 4:
             return None
 
-        symbol = (self._attr(row.get("data-symbol")) or self._extract_symbol(cells[0])).upper()
+        symbol = (row.get("data-symbol") or self._extract_symbol(cells[0])).upper()
         name = self._extract_name(cells[0]) or symbol
         if name.upper().startswith(symbol.upper()):
             trimmed = name[len(symbol):].strip(" -:\u2013\u2014")
             if trimmed:
                 name = trimmed
 
-        lm = self._label_map(cells)
+        def col(field: str) -> Optional[str]:
+            idx = columns.get(field)
+            if idx is None or idx >= len(cells):
+                return None
+            return self._text(cells[idx]) or None
 
-        price_text = self._by_labels(lm, ["last", "price", "last price"]) or self._cell(cells, 1)
-        chg_pct_text = self._by_labels(lm, ["change %", "chg %", "change percent"], strip_pct=True) or self._cell(cells, 2)
-        chg_text = self._by_labels(lm, ["change", "chg"]) or self._cell(cells, 3)
-        high_text = self._by_labels(lm, ["high", "day high"]) or self._cell(cells, 4)
-        low_text = self._by_labels(lm, ["low", "day low"]) or self._cell(cells, 5)
+        price_text = col("last")
+        chg_pct_text = col("change_percent")
+        chg_text = col("change")
+        high_text = col("high")
+        low_text = col("low")
 
-        currency = self._by_labels(lm, ["currency", "curr"], numeric=False)
+        currency = col("currency")
         if currency:
             currency = currency.strip().upper()
         if not currency:
@@ -138,59 +277,81 @@ class TradingViewScraper:
             high=self._float(high_text),
             low=self._float(low_text),
             currency=currency,
-            exchange=self._by_labels(lm, ["exchange", "exch"], numeric=False),
-            country=self._by_labels(lm, ["country", "region"], numeric=False),
+            exchange=col("exchange"),
+            country=col("country"),
         )
 
     # ── HTML helpers ─────────────────────────────────────────────────
 
     @staticmethod
-    def _extract_symbol(cell: Tag) -> str:
-        a = cell.find("a")
-        if a and a.text:
-            return a.text.strip().split()[0]
-        return cell.get_text(" ", strip=True).split(" ")[0]
+    def _find_table(html: str) -> Optional[HtmlElement]:
+        """Parse only the first top-level ``<table>`` slice of the page with lxml.
+
+        Opening and closing tags are counted so a table nested in a cell
+        does not end the slice early.
+        """
+        start, depth, end = -1, 0, len(html)
+        for m in _TABLE_TAG_RE.finditer(html):
+            if not m.group(1):
+                if start < 0:
+                    start = m.start()
+                depth += 1
+            elif start >= 0:
+                depth -= 1
+                if depth == 0:
+                    end = m.end()
+                    break
+        if start < 0:
+            return None
+        try:
+            return lxml.html.fragment_fromstring(html[start:end])
+        except Exception:
+            return lxml.html.fromstring(html).find(".//table")
+
+    @classmethod
+    def _column_map(cls, table: HtmlElement, rows: List[HtmlElement]) -> Dict[str, int]:
+        """Resolve field → column index once per table.
+
+        Header ``<th>`` labels win, then the ``data-label`` attributes of the
+        first data row; anything unresolved falls back to TradingView's
+        default column order.
+        """
+        labels: List[str] = [cls._text(th).lower() for th in table.iterfind("./thead//th")]
+        if not labels:
+            first = next((r for r in rows if r.find("td") is not None), None)
+            if first is not None:
+                labels = [(td.get("data-label") or "").strip().lower() for td in first.findall("td")]
+
+        columns: Dict[str, int] = {}
+        for field, aliases in COLUMN_LABELS.items():
+            for alias in aliases:
+                if alias in labels:
+                    columns[field] = labels.index(alias)
+                    break
+        for field, idx in DEFAULT_COLUMNS.items():
+            columns.setdefault(field, idx)
+        return columns
 
     @staticmethod
-    def _extract_name(cell: Tag) -> Optional[str]:
-        span = cell.find("span")
-        if span and span.text:
-            return span.text.strip()
-        parts = cell.get_text(" ", strip=True).split(" ", 1)
+    def _text(el: HtmlElement) -> str:
+        return " ".join(el.text_content().split())
+
+    @classmethod
+    def _extract_symbol(cls, cell: HtmlElement) -> str:
+        a = cell.find(".//a")
+        if a is not None and cls._text(a):
+            return cls._text(a).split()[0]
+        text = cls._text(cell)
+        return text.split(" ")[0] if text else ""
+
+    @classmethod
+    def _extract_name(cls, cell: HtmlElement) -> Optional[str]:
+        span = cell.find(".//span")
+        if span is not None and cls._text(span):
+            return cls._text(span)
+        parts = cls._text(cell).split(" ", 1)
         return parts[1].strip() if len(parts) == 2 else None
 
-    @staticmethod
-    def _label_map(cells: List[Tag]) -> Dict[str, str]:
-        m: Dict[str, str] = {}
-        for c in cells:
-            raw = c.get("data-label")
-            if raw is None:
-                continue
-            key = (raw[0] if isinstance(raw, list) else str(raw)).strip().lower()
-            if key:
-                m[key] = c.get_text(" ", strip=True)
-        return m
-
-    @staticmethod
-    def _by_labels(
-        m: Dict[str, str],
-        labels: Sequence[str],
-        *,
-        numeric: bool = True,
-        strip_pct: bool = False,
-    ) -> Optional[str]:
-        for label in labels:
-            text = m.get(label.lower())
-            if text:
-                if strip_pct:
-                    text = text.replace("%", "")
-                return text.strip() or None
-        return None
-
-    @staticmethod
-    def _cell(cells: List[Tag], idx: int) -> Optional[str]:
-        return cells[idx].get_text(" ", strip=True) if idx < len(cells) else None
-
     @staticmethod
     def _float(val: Optional[str]) -> Optional[float]:
         if not val:
@@ -204,14 +365,6 @@ class TradingViewScraper:
         except ValueError:
             return None
 
-    @staticmethod
-    def _attr(value: Any) -> Optional[str]:
-        if value is None:
-            return None
-        if isinstance(value, (list, tuple)):
-            return value[0] if value else None
-        return str(value)
-
     @staticmethod
     def _guess_currency(*vals: Optional[str]) -> Optional[str]:
         for raw in vals:
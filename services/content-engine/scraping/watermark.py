@@ -0,0 +1,96 @@
+# services/content-engine/scraping/watermark.py
+"""Per-feed incremental watermarks.
+
+For every feed we remember the GUIDs/links of recently seen entries and the
+newest ``published`` timestamp.  ``RSSScraper`` consults the watermark before
+any HTML cleaning, so steady-state runs only pay for new entries instead of
+re-parsing the whole feed and letting ``Deduplicator`` throw it away.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_PATH = Path(__file__).resolve().parent.parent / "data" / "feed_watermarks.json"
+
+Snapshot = Tuple[FrozenSet[str], Optional[datetime]]
+EMPTY_SNAPSHOT: Snapshot = (frozenset(), None)
+
+# Remember at most this many entry ids per feed (feeds rarely carry more)
+MAX_IDS_PER_FEED = 500
+
+
+class FeedWatermarks:
+    """File-backed store of ``{feed_url: {ids, newest}}``."""
+
+    def __init__(self, path: Path = WATERMARK_PATH) -> None:
+        self.path = path
+        self._feeds: Dict[str, Dict[str, Any]] = {}
+        self._ids: Dict[str, set[str]] = {}
+        self._dirty = False
+        self._load()
+
+    # ── public ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def entry_id(entry: Any) -> str:
+        return entry.get("id") or entry.get("link") or entry.get("title", "")
+
+    def snapshot(self, feed_url: str) -> Snapshot:
+        """Known entry ids and newest timestamp of a feed (picklable for the parse pool)."""
+        return frozenset(self._ids.get(feed_url, ())), self.newest(feed_url)
+
+    @staticmethod
+    def is_seen(entry_id: str, published: Optional[datetime], known: Snapshot) -> bool:
+        """True if the entry is known or older than the feed's newest seen item."""
+        ids, newest = known
+        if entry_id and entry_id in ids:
+            return True
+        return bool(published and newest and published < newest)
+
+    def newest(self, feed_url: str) -> Optional[datetime]:
+        raw = self._feeds.get(feed_url, {}).get("newest")
+        return datetime.fromisoformat(raw) if raw else None
+
+    def advance(self, feed_url: str, entry_ids: Iterable[str], newest: Optional[datetime]) -> None:
+        """Record entries examined in this run and move the timestamp forward."""
+        new_ids = [i for i in entry_ids if i and i not in self._ids.get(feed_url, ())]
+        current = self.newest(feed_url)
+        if not new_ids and (newest is None or (current and newest <= current)):
+            return
+
+        state = self._feeds.setdefault(feed_url, {"ids": [], "newest": None})
+        ids: List[str] = (state["ids"] + new_ids)[-MAX_IDS_PER_FEED:]
+        state["ids"] = ids
+        self._ids[feed_url] = set(ids)
+        if newest and (current is None or newest > current):
+            state["newest"] = newest.isoformat()
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._feeds), encoding="utf-8")
+            self._dirty = False
+            logger.debug("Saved watermarks for %d feeds", len(self._feeds))
+        except Exception as exc:
+            logger.warning("Could not save feed watermarks: %s", exc)
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        if self.path.exists():
+            try:
+                self._feeds = json.loads(self.path.read_text(encoding="utf-8"))
+                self._ids = {url: set(state.get("ids", [])) for url, state in self._feeds.items()}
+                logger.info("Loaded watermarks for %d feeds", len(self._feeds))
+            except Exception as exc:
+                logger.warning("Could not load feed watermarks: %s", exc)
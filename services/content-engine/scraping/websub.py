@@ -0,0 +1,283 @@
+# services/content-engine/scraping/websub.py
+"""WebSub (PubSubHubbub) push subscriptions for hub-enabled feeds.
+
+Publishers that advertise a hub (``<atom:link rel="hub">`` in the feed or a
+``Link: <…>; rel="hub"`` response header) are found during normal polling.
+``WebSubSubscriber.sync()`` subscribes to them.  Each subscription has its
+own callback token and HMAC secret:
+
+  discovered  hub link seen while polling; subscribe on the next sync
+  pending     subscription request accepted (202); waiting for the hub's
+              verification GET on ``/api/v1/websub/callback/<token>``
+  active      verified; the hub POSTs new content to the callback, and
+              ``RSSScraper`` stops polling the feed until the lease expires
+  denied /    hub refused or the request failed; polling continues and the
+  failed      subscription is retried after ``RETRY_AFTER``
+  unsubscribing  the feed left the registry; kept until the hub verifies
+              the unsubscribe (or ``PENDING_TIMEOUT`` passes)
+
+Leases are renewed ``RENEW_MARGIN`` before they expire.  If a renewal
+fails, the lease runs out and the feed falls back to polling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import aiohttp
+
+from utils.http_client import HttpClient
+
+logger = logging.getLogger(__name__)
+
+WEBSUB_PATH = Path(__file__).resolve().parent.parent / "data" / "websub.json"
+CALLBACK_PATH = "/api/v1/websub/callback"
+
+HUB_TIMEOUT = aiohttp.ClientTimeout(total=15)
+# Renew a lease this long before it expires
+RENEW_MARGIN = timedelta(hours=1)
+# Resend a subscription the hub never verified, or retry a denied / failed one
+PENDING_TIMEOUT = timedelta(hours=1)
+RETRY_AFTER = timedelta(hours=6)
+
+DISCOVERED, PENDING, ACTIVE, DENIED, FAILED = "discovered", "pending", "active", "denied", "failed"
+UNSUBSCRIBING = "unsubscribing"
+
+_SIGNATURE_METHODS = {
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha384": hashlib.sha384,
+    "sha512": hashlib.sha512,
+}
+
+
+class WebSubSubscriber:
+    """File-backed ``{feed_url: subscription}`` store + hub client (on the shared ``HttpClient``)."""
+
+    def __init__(
+        self,
+        callback_base_url: str,
+        http: HttpClient,
+        lease_seconds: int = 86400,
+        path: Path = WEBSUB_PATH,
+    ) -> None:
+        self.callback_base_url = callback_base_url.rstrip("/")
+        self.lease_seconds = lease_seconds
+        self.http = http
+        self.path = path
+        self._subs: Dict[str, Dict[str, Any]] = {}
+        self._tokens: Dict[str, str] = {}
+        self._dirty = False
+        self._counters = {"pushes": 0, "bad_signature": 0, "verified": 0, "subscribe_errors": 0}
+        self._load()
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def discovered(self, feed_url: str, hub: str, topic: str) -> None:
+        """Note a feed's hub link (seen while polling)."""
+        sub = self._subs.get(feed_url)
+        if sub and sub["hub"] == hub and sub["topic"] == topic:
+            return
+        if sub:
+            self._tokens.pop(sub["token"], None)
+        token = secrets.token_urlsafe(16)
+        self._subs[feed_url] = {
+            "hub": hub,
+            "topic": topic,
+            "token": token,
+            "secret": secrets.token_hex(32),
+            "state": DISCOVERED,
+            "lease_expires": None,
+            "requested_at": None,
+            "last_push": None,
+            "pushes": 0,
+            "error": "",
+        }
+        self._tokens[token] = feed_url
+        self._dirty = True
+        logger.info("WebSub hub found for %s: %s", feed_url, hub)
+
+    def is_active(self, feed_url: str, now: Optional[datetime] = None) -> bool:
+        """True while the hub pushes this feed (verified, lease not expired)."""
+        sub = self._subs.get(feed_url)
+        if not sub or sub["state"] != ACTIVE or not sub["lease_expires"]:
+            return False
+        return (now or datetime.utcnow()) < datetime.fromisoformat(sub["lease_expires"])
+
+    async def sync(self, feed_urls: Iterable[str]) -> Dict[str, int]:
+        """Subscribe / renew due subscriptions; drop those of unregistered feeds."""
+        wanted = set(feed_urls)
+        now = datetime.utcnow()
+        gone = [url for url, sub in self._subs.items() if url not in wanted and sub["state"] != UNSUBSCRIBING]
+        unsubscribe = [url for url in gone if self._subs[url]["state"] in (PENDING, ACTIVE)]
+        expired = [
+            url for url, sub in self._subs.items()
+            if url not in wanted
+            and sub["state"] == UNSUBSCRIBING
+            and now - datetime.fromisoformat(sub["requested_at"]) >= PENDING_TIMEOUT
+        ]
+        for url in set(gone) - set(unsubscribe) | set(expired):
+            self._drop(url)
+        due = [url for url in self._subs if url in wanted and self._needs_request(self._subs[url], now)]
+        results = await asyncio.gather(
+            *(self._request(url, "unsubscribe") for url in unsubscribe),
+            *(self._request(url, "subscribe") for url in due),
+        )
+        self.save()
+        return {
+            "subscribed": sum(results[len(unsubscribe):]),
+            "requested": len(due),
+            "unsubscribed": len(unsubscribe),
+        }
+
+    def verify(
+        self, token: str, mode: str, topic: str, challenge: str, lease_seconds: Optional[int] = None
+    ) -> Optional[str]:
+        """Answer a hub's verification GET: the challenge to echo, or None (→ 404)."""
+        feed_url = self._tokens.get(token)
+        sub = self._subs.get(feed_url) if feed_url else None
+        if not sub or topic != sub["topic"]:
+            return None
+        now = datetime.utcnow()
+        if mode == "subscribe" and sub["state"] in (PENDING, ACTIVE):
+            lease = lease_seconds or self.lease_seconds
+            sub.update(state=ACTIVE, lease_expires=(now + timedelta(seconds=lease)).isoformat(), error="")
+            self._counters["verified"] += 1
+            logger.info("WebSub subscription active for %s (lease %ds)", feed_url, lease)
+        elif mode == "unsubscribe" and sub["state"] == UNSUBSCRIBING:
+            self._drop(feed_url)
+            logger.info("WebSub subscription removed for %s", feed_url)
+        elif mode == "denied":
+            sub.update(state=DENIED, lease_expires=None, requested_at=now.isoformat(), error="denied by hub")
+            logger.warning("WebSub hub denied subscription for %s", feed_url)
+        else:
+            return None
+        self._dirty = True
+        self.save()
+        return challenge
+
+    def authenticate(self, token: str, body: bytes, signature: Optional[str]) -> Optional[str]:
+        """Feed URL of a content delivery if ``signature`` matches, else None."""
+        feed_url = self._tokens.get(token)
+        sub = self._subs.get(feed_url) if feed_url else None
+        if not sub:
+            return None
+        method, _, digest = (signature or "").partition("=")
+        hash_fn = _SIGNATURE_METHODS.get(method.lower())
+        expected = hmac.new(sub["secret"].encode(), body, hash_fn).hexdigest() if hash_fn else ""
+        if not expected or not hmac.compare_digest(expected, digest.lower()):
+            self._counters["bad_signature"] += 1
+            logger.warning("WebSub delivery for %s rejected: bad or missing signature", feed_url)
+            return None
+        self._counters["pushes"] += 1
+        sub["pushes"] += 1
+        sub["last_push"] = datetime.utcnow().isoformat()
+        self._dirty = True
+        return feed_url
+
+    def knows(self, token: str) -> bool:
+        return token in self._tokens
+
+    def describe(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        sub = self._subs.get(feed_url)
+        if not sub:
+            return None
+        return {
+            "hub": sub["hub"],
+            "topic": sub["topic"],
+            "state": sub["state"],
+            "push_active": self.is_active(feed_url),
+            "lease_expires": sub["lease_expires"],
+            "last_push": sub["last_push"],
+            "pushes": sub["pushes"],
+            "error": sub["error"],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        states: Dict[str, int] = {}
+        for sub in self._subs.values():
+            states[sub["state"]] = states.get(sub["state"], 0) + 1
+        return {
+            "feeds_with_hub": len(self._subs),
+            "push_active": sum(1 for url in self._subs if self.is_active(url)),
+            "states": states,
+            **self._counters,
+        }
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._subs), encoding="utf-8")
+            self._dirty = False
+            logger.debug("Saved %d WebSub subscriptions", len(self._subs))
+        except Exception as exc:
+            logger.warning("Could not save WebSub subscriptions: %s", exc)
+
+    # ── internal ─────────────────────────────────────────────────────
+
+    def _needs_request(self, sub: Dict[str, Any], now: datetime) -> bool:
+        state = sub["state"]
+        if state in (DISCOVERED, UNSUBSCRIBING):  # unsubscribing: feed was re-added
+            return True
+        if state == ACTIVE:
+            return now + RENEW_MARGIN >= datetime.fromisoformat(sub["lease_expires"])
+        requested = datetime.fromisoformat(sub["requested_at"]) if sub["requested_at"] else datetime.min
+        return now - requested >= (PENDING_TIMEOUT if state == PENDING else RETRY_AFTER)
+
+    async def _request(self, feed_url: str, mode: str) -> bool:
+        """POST a (un)subscription request to the feed's hub."""
+        sub = self._subs[feed_url]
+        form = {
+            "hub.mode": mode,
+            "hub.topic": sub["topic"],
+            "hub.callback": f"{self.callback_base_url}{CALLBACK_PATH}/{sub['token']}",
+        }
+        if mode == "subscribe":
+            form["hub.secret"] = sub["secret"]
+            form["hub.lease_seconds"] = str(self.lease_seconds)
+        # set before the POST: hubs may verify before they answer it
+        if mode == "unsubscribe":
+            sub.update(state=UNSUBSCRIBING, lease_expires=None)
+        elif sub["state"] != ACTIVE:
+            sub["state"] = PENDING
+        sub["requested_at"] = datetime.utcnow().isoformat()
+        self._dirty = True
+        try:
+            session = await self.http.session()
+            async with session.post(sub["hub"], data=form, timeout=HUB_TIMEOUT) as resp:
+                if resp.status not in (202, 204):
+                    raise RuntimeError(f"HTTP {resp.status}: {(await resp.text())[:120]}")
+        except Exception as exc:
+            logger.warning("WebSub %s for %s failed: %s", mode, feed_url, exc)
+            if mode == "subscribe":
+                self._counters["subscribe_errors"] += 1
+                # an active lease stays usable until it runs out
+                if sub["state"] != ACTIVE:
+                    sub["state"] = FAILED
+                sub["error"] = str(exc)[:200]
+            return False
+        logger.info("WebSub %s requested for %s at %s", mode, feed_url, sub["hub"])
+        return True
+
+    def _drop(self, feed_url: str) -> None:
+        self._tokens.pop(self._subs.pop(feed_url)["token"], None)
+        self._dirty = True
+
+    def _load(self) -> None:
+        if self.path.exists():
+            try:
+                self._subs = json.loads(self.path.read_text(encoding="utf-8"))
+                self._tokens = {sub["token"]: url for url, sub in self._subs.items()}
+                logger.info("Loaded %d WebSub subscriptions", len(self._subs))
+            except Exception as exc:
+                logger.warning("Could not load WebSub subscriptions: %s", exc)
@@ -0,0 +1,95 @@
+# services/content-engine/scripts/bench_clean_html.py
+"""Benchmark ``clean_html`` (single-pass engine) against the old BeautifulSoup version.
+
+Usage:
+    python scripts/feed_corpus.py        # once, to record the corpus
+    python scripts/bench_clean_html.py [--corpus DIR] [--repeat N]
+
+Extracts every entry's content/summary HTML from the recorded feeds, then
+times text + first-image extraction with both implementations and reports
+how closely their word counts agree.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import feedparser
+from bs4 import BeautifulSoup, Tag
+
+from feed_corpus import CORPUS_DIR, load_feeds
+from scraping.html_text import html_to_text
+
+
+def legacy_clean(raw: str) -> Tuple[str, str]:
+    """The pre-engine implementation: clean_html + RSSScraper image fallback."""
+    if not raw:
+        return "", ""
+    soup = BeautifulSoup(raw, "html.parser")
+    text = re.sub(r"\s+", " ", soup.get_text()).strip()
+    for phrase in [
+        "Click here to read more",
+        "Continue reading",
+        "Read the full article",
+        "Subscribe to our newsletter",
+    ]:
+        text = text.replace(phrase, "")
+    # _extract_image parsed the same HTML a second time
+    img = BeautifulSoup(raw, "html.parser").find("img")
+    src = str(img["src"]) if isinstance(img, Tag) and img.get("src") else ""
+    return text.strip(), src
+
+
+def fragments(corpus_dir: Path) -> List[str]:
+    out: List[str] = []
+    for raw in load_feeds(corpus_dir).values():
+        for entry in feedparser.parse(raw).entries:
+            if entry.get("content"):
+                out.append(entry.content[0].value)
+            elif entry.get("summary"):
+                out.append(entry.summary)
+    return out
+
+
+def bench(fn, docs: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            fn(doc)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    docs = fragments(args.corpus)
+    total_kb = sum(len(d) for d in docs) / 1024 * args.repeat
+    print(f"{len(docs)} fragments, {total_kb:,.0f} KiB processed per implementation\n")
+
+    t_old = bench(legacy_clean, docs, args.repeat)
+    t_new = bench(html_to_text, docs, args.repeat)
+    n = len(docs) * args.repeat
+    print(f"{'beautifulsoup':<14} {t_old * 1000:9.1f} ms  {n / t_old:10,.0f} docs/s")
+    print(f"{'single-pass':<14} {t_new * 1000:9.1f} ms  {n / t_new:10,.0f} docs/s")
+    print(f"speed-up       {t_old / t_new:9.1f}x\n")
+
+    same_img = word_diff = 0
+    for doc in docs:
+        old_text, old_img = legacy_clean(doc)
+        new_text, new_img = html_to_text(doc)
+        same_img += old_img == new_img
+        word_diff += abs(len(old_text.split()) - len(new_text.split()))
+    words = sum(len(legacy_clean(d)[0].split()) for d in docs) or 1
+    print(f"first <img> identical: {same_img}/{len(docs)}")
+    print(f"word-count drift:      {word_diff / words:.2%} (block tags now separate words)")
+
+
+if __name__ == "__main__":
+    main()
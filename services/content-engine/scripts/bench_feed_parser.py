@@ -0,0 +1,92 @@
+# services/content-engine/scripts/bench_feed_parser.py
+"""Benchmark the streaming feed parser against feedparser on recorded feeds.
+
+Usage:
+    python scripts/feed_corpus.py        # once, to record the corpus
+    python scripts/bench_feed_parser.py [--corpus DIR] [--repeat N] [--max-per-source N]
+
+Runs ``parse_feed`` (the same function the parse pool runs) with both
+backends.  Reports time per feed and peak traced memory, for whole
+documents and for the pipeline's ``max_per_source``, and checks that both
+backends return the same articles.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from feed_corpus import CORPUS_DIR, load_feeds
+from scraping.feed_parser import BACKENDS
+from scraping.rss_scraper import parse_feed
+
+SOURCE = {"name": "bench", "url": "http://bench.invalid/feed"}
+
+
+def run(docs: Dict[str, str], parser: str, limit: int, repeat: int) -> Tuple[List[float], List[int]]:
+    """Best-of-``repeat`` ms and peak bytes per feed."""
+    cutoff = datetime.utcnow() - timedelta(days=36500)
+    timings: List[float] = []
+    peaks: List[int] = []
+    for raw in docs.values():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parse_feed(raw, SOURCE, limit, cutoff, 0, parser=parser)
+            best = min(best, time.perf_counter() - start)
+        timings.append(best * 1000)
+        tracemalloc.start()
+        parse_feed(raw, SOURCE, limit, cutoff, 0, parser=parser)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return timings, peaks
+
+
+def same_articles(docs: Dict[str, str], limit: int) -> int:
+    """Feeds where both backends return different articles."""
+    cutoff = datetime.utcnow() - timedelta(days=36500)
+    differ = 0
+    for raw in docs.values():
+        a, b = (parse_feed(raw, SOURCE, limit, cutoff, 0, parser=p) for p in BACKENDS)
+        key = lambda r: (r.title, r.content, r.source_url, r.image_url, r.author)  # noqa: E731
+        if [key(r) for r in a.articles] != [key(r) for r in b.articles]:
+            differ += 1
+    return differ
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-per-source", type=int, default=5, help="as the news pipeline")
+    args = parser.parse_args()
+
+    docs = {name: raw.decode("utf-8", errors="replace") for name, raw in load_feeds(args.corpus).items()}
+    total_kb = sum(len(d) for d in docs.values()) / 1024
+    print(f"{len(docs)} feeds, {total_kb:,.0f} KiB\n")
+
+    fallbacks = sum(
+        1 for raw in docs.values()
+        if parse_feed(raw, SOURCE, 1, datetime.min, 0, parser="stream").parser != "stream"
+    )
+    for limit, label in ((10_000, "whole feed"), (args.max_per_source, f"max_per_source={args.max_per_source}")):
+        print(f"{label}:")
+        base = None
+        for backend in BACKENDS:
+            timings, peaks = run(docs, backend, limit, args.repeat)
+            total = sum(timings)
+            base = base or total
+            print(f"  {backend:<10}  median {statistics.median(timings):7.2f} ms/feed  "
+                  f"total {total:8.1f} ms  ({base / total:4.1f}x)  "
+                  f"peak mem median {statistics.median(peaks) / 1024:7.0f} KiB  max {max(peaks) / 1024:7.0f} KiB")
+        print(f"  feeds with different articles: {same_articles(docs, limit)}/{len(docs)}\n")
+    print(f"malformed feeds (stream → feedparser fallback): {fallbacks}/{len(docs)}")
+
+
+if __name__ == "__main__":
+    main()
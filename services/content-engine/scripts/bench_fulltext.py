@@ -0,0 +1,62 @@
+# services/content-engine/scripts/bench_fulltext.py
+"""Benchmark ``extract_main_text`` on saved article pages.
+
+Usage:
+    python scripts/feed_corpus.py --pages 5   # once, to record article pages
+    python scripts/bench_fulltext.py [--pages DIR] [--repeat N] [--max-kb N]
+
+Times main-text extraction per page (after the same byte cap the pipeline
+applies) and compares the extracted word count with a whole-page
+``html_to_text`` dump, i.e. how much boilerplate is removed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import List
+
+from feed_corpus import PAGES_DIR, load_pages
+from scraping.fulltext import extract_main_text
+from scraping.html_text import html_to_text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=Path, default=PAGES_DIR)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-kb", type=int, default=1024, help="byte cap, as FULLTEXT_MAX_KB")
+    args = parser.parse_args()
+
+    cap = args.max_kb * 1024
+    pages = [raw[:cap].decode("utf-8", errors="replace") for raw in load_pages(args.pages).values()]
+    total_kb = sum(len(p) for p in pages) / 1024
+    print(f"{len(pages)} pages, {total_kb:,.0f} KiB (capped at {args.max_kb} KiB each)\n")
+
+    timings: List[float] = []
+    for page in pages:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            extract_main_text(page)
+            best = min(best, time.perf_counter() - start)
+        timings.append(best * 1000)
+
+    total_s = sum(timings) / 1000
+    p95 = sorted(timings)[max(0, int(len(timings) * 0.95) - 1)]
+    print(f"extract_main_text  median {statistics.median(timings):6.2f} ms/page  "
+          f"p95 {p95:6.2f} ms  {total_kb / 1024 / total_s:6.1f} MiB/s\n")
+
+    main_words = [len(extract_main_text(p).split()) for p in pages]
+    page_words = [len(html_to_text(p)[0].split()) for p in pages]
+    empty = sum(1 for w in main_words if w == 0)
+    kept = sum(main_words) / (sum(page_words) or 1)
+    print(f"median words: main text {statistics.median(main_words):,.0f} / whole page "
+          f"{statistics.median(page_words):,.0f}  ({kept:.0%} of page text kept)")
+    print(f"pages with no article text found: {empty}/{len(pages)}")
+
+
+if __name__ == "__main__":
+    main()
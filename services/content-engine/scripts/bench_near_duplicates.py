@@ -0,0 +1,78 @@
+# services/content-engine/scripts/bench_near_duplicates.py
+"""Benchmark the MinHash / LSH near-duplicate index as it grows.
+
+Usage:
+    python scripts/bench_near_duplicates.py [--articles N] [--capacity N] [--words N]
+
+Indexes synthetic articles (random words) and, at each checkpoint, times
+queries of fresh articles — the per-query cost should stay flat as the
+index grows.  Finally it reports how often lightly edited copies of indexed
+articles (``--edits`` words replaced) are caught, and how often unrelated
+articles are wrongly flagged.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ENGINE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ENGINE_ROOT))
+
+from core.near_duplicates import NearDuplicateIndex
+
+VOCABULARY = [f"w{i}" for i in range(50_000)]
+
+
+def article(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def edited(rng: random.Random, text: str, edits: int) -> str:
+    words = text.split()
+    for i in rng.sample(range(len(words)), edits):
+        words[i] = "edited"
+    return " ".join(words)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=200_000)
+    parser.add_argument("--capacity", type=int, default=200_000)
+    parser.add_argument("--words", type=int, default=120)
+    parser.add_argument("--edits", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    index = NearDuplicateIndex(threshold=args.threshold, capacity=args.capacity)
+    print(f"bands × rows: {index.bands} × {index.rows}, threshold {args.threshold}\n")
+    checkpoints = {10_000, args.articles} | set(range(50_000, args.articles, 50_000))
+    recent = []
+    start = time.perf_counter()
+    for n in range(1, args.articles + 1):
+        text = article(rng, args.words)
+        index.check_and_add(text)
+        if n > args.articles - 1000:
+            recent.append(text)
+        if n in checkpoints:
+            probes = [index.signature(article(rng, args.words)) for _ in range(1000)]
+            t = time.perf_counter()
+            for sig in probes:
+                index.query(sig)
+            query_us = (time.perf_counter() - t) / len(probes) * 1e6
+            add_us = (time.perf_counter() - start) / n * 1e6
+            print(f"{len(index):>8,} indexed  query {query_us:6.1f} µs  (generate + check_and_add avg {add_us:6.1f} µs)")
+
+    caught = sum(index.query(index.signature(edited(rng, t, args.edits))) >= args.threshold for t in recent)
+    false = sum(index.query(index.signature(article(rng, args.words))) >= args.threshold for _ in range(1000))
+    stats = index.stats()
+    print(f"\nedited copies caught: {caught}/{len(recent)}  unrelated flagged: {false}/1000")
+    print(f"memory: {stats['memory_kb'] / 1024:,.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# services/content-engine/scripts/bench_tradingview.py
+"""Benchmark the lxml TradingView table parser against the old BeautifulSoup one.
+
+Usage:
+    python scripts/feed_corpus.py --tradingview   # once, to save the page
+    python scripts/bench_tradingview.py [--snapshot FILE] [--repeat N]
+
+Reports rows/s for both parsers on the saved page and checks that they
+produce identical quotes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, Tag
+
+from feed_corpus import TRADINGVIEW_SNAPSHOT, load_tradingview
+from scraping.tradingview_scraper import IndexQuote, TradingViewScraper
+
+LABELS = {
+    "last": ["last", "price", "last price"],
+    "change_percent": ["change %", "chg %", "change percent"],
+    "change": ["change", "chg"],
+    "high": ["high", "day high"],
+    "low": ["low", "day low"],
+}
+
+
+def legacy_parse(html: str) -> List[IndexQuote]:
+    """The pre-lxml implementation: full BeautifulSoup parse, label dict per row."""
+    tv = TradingViewScraper
+    table = BeautifulSoup(html, "html.parser").find("table")
+    body = table.find("tbody") or table
+    quotes: List[IndexQuote] = []
+    for row in body.find_all("tr", recursive=False):
+        cells = row.find_all("td", recursive=False)
+        if len(cells) < 4:
+            continue
+        a = cells[0].find("a")
+        symbol = (row.get("data-symbol") or (a.text.strip().split()[0] if a and a.text else
+                  cells[0].get_text(" ", strip=True).split(" ")[0])).upper()
+        span = cells[0].find("span")
+        parts = cells[0].get_text(" ", strip=True).split(" ", 1)
+        name = (span.text.strip() if span and span.text else (parts[1].strip() if len(parts) == 2 else None)) or symbol
+        if name.upper().startswith(symbol):
+            name = name[len(symbol):].strip(" -:–—") or name
+
+        lm: Dict[str, str] = {}
+        for c in cells:
+            if c.get("data-label") is not None:
+                lm[str(c.get("data-label")).strip().lower()] = c.get_text(" ", strip=True)
+
+        def pick(field: str, pos: int) -> Optional[str]:
+            for label in LABELS[field]:
+                if lm.get(label):
+                    return lm[label].strip() or None
+            return cells[pos].get_text(" ", strip=True) if pos < len(cells) else None
+
+        price, pct, chg, high, low = (pick(f, i) for f, i in
+                                      [("last", 1), ("change_percent", 2), ("change", 3), ("high", 4), ("low", 5)])
+        quotes.append(IndexQuote(
+            symbol=symbol, name=name, last=tv._float(price), change=tv._float(chg),
+            change_percent=tv._float(pct), high=tv._float(high), low=tv._float(low),
+            currency=tv._guess_currency(price, high, low),
+        ))
+    return quotes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--snapshot", type=Path, default=TRADINGVIEW_SNAPSHOT)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    html = load_tradingview(args.snapshot)
+    scraper = TradingViewScraper()
+
+    results = {}
+    for label, fn in [
+        ("beautifulsoup", legacy_parse),
+        ("lxml", lambda h: list(scraper._parse_rows(h))),
+    ]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            quotes = fn(html)
+        elapsed = time.perf_counter() - start
+        rows = len(quotes) * args.repeat
+        results[label] = (elapsed, quotes)
+        print(f"{label:<14} {elapsed / args.repeat * 1000:8.2f} ms/page  {rows / elapsed:10,.0f} rows/s")
+
+    (t_old, old), (t_new, new) = results["beautifulsoup"], results["lxml"]
+    print(f"speed-up       {t_old / t_new:8.1f}x")
+    same = sum(1 for a, b in zip(old, new) if a == b)
+    print(f"identical quotes: {same}/{len(old)} (rows parsed: {len(old)} vs {len(new)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# services/content-engine/scripts/feed_corpus.py
+"""Record / load a local feed (and page snapshot) corpus for offline benchmarks.
+
+Usage:
+    python scripts/feed_corpus.py                # record DEFAULT_RSS_SOURCES into data/corpus/feeds
+    python scripts/feed_corpus.py --out DIR      # record into another directory
+    python scripts/feed_corpus.py --tradingview  # save the TradingView indices page snapshot
+    python scripts/feed_corpus.py --pages 5      # save 5 linked article pages per recorded feed
+
+Benchmarks call ``load_feeds()``; the corpus is never committed (third-party
+content) — record it locally before benchmarking.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import re
+import sys
+from pathlib import Path
+from typing import Dict
+
+ENGINE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ENGINE_ROOT))
+
+CORPUS_DIR = ENGINE_ROOT / "data" / "corpus" / "feeds"
+TRADINGVIEW_SNAPSHOT = ENGINE_ROOT / "data" / "corpus" / "tradingview_indices.html"
+PAGES_DIR = ENGINE_ROOT / "data" / "corpus" / "pages"
+
+
+def load_feeds(corpus_dir: Path = CORPUS_DIR) -> Dict[str, bytes]:
+    """Return ``{file_name: raw_bytes}`` for every recorded feed."""
+    files = sorted(corpus_dir.glob("*.xml"))
+    if not files:
+        raise SystemExit(
+            f"No recorded feeds in {corpus_dir} — run `python scripts/feed_corpus.py` first"
+        )
+    return {f.name: f.read_bytes() for f in files}
+
+
+def load_pages(pages_dir: Path = PAGES_DIR) -> Dict[str, bytes]:
+    """Return ``{file_name: raw_bytes}`` for every recorded article page."""
+    files = sorted(pages_dir.glob("*.html"))
+    if not files:
+        raise SystemExit(
+            f"No recorded pages in {pages_dir} — run `python scripts/feed_corpus.py --pages 5` first"
+        )
+    return {f.name: f.read_bytes() for f in files}
+
+
+def load_tradingview(path: Path = TRADINGVIEW_SNAPSHOT) -> str:
+    if not path.exists():
+        raise SystemExit(
+            f"No TradingView snapshot at {path} — run `python scripts/feed_corpus.py --tradingview` first"
+        )
+    return path.read_text(encoding="utf-8")
+
+
+def record_tradingview(path: Path = TRADINGVIEW_SNAPSHOT) -> None:
+    from scraping.tradingview_scraper import INDEX_URL, TradingViewScraper
+
+    html = TradingViewScraper()._session.get(INDEX_URL, timeout=15).text
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(html, encoding="utf-8")
+    print(f"  TradingView: {len(html):,} chars")
+
+
+async def record(out_dir: Path) -> None:
+    import aiohttp
+
+    from scraping.rss_scraper import DEFAULT_RSS_SOURCES
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        for src in DEFAULT_RSS_SOURCES:
+            name = re.sub(r"[^a-z0-9]+", "-", src["name"].lower()).strip("-")
+            try:
+                async with session.get(src["url"]) as resp:
+                    body = await resp.read()
+                if resp.status != 200:
+                    print(f"  skip {src['name']}: HTTP {resp.status}")
+                    continue
+                (out_dir / f"{name}.xml").write_bytes(body)
+                print(f"  {src['name']}: {len(body):,} bytes")
+            except Exception as exc:
+                print(f"  skip {src['name']}: {exc}")
+
+
+async def record_pages(per_feed: int, corpus_dir: Path = CORPUS_DIR, out_dir: Path = PAGES_DIR) -> None:
+    import aiohttp
+    import feedparser
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        for feed_name, raw in load_feeds(corpus_dir).items():
+            links = [e.get("link") for e in feedparser.parse(raw).entries if e.get("link")]
+            for i, link in enumerate(links[:per_feed]):
+                try:
+                    async with session.get(link) as resp:
+                        body = await resp.read()
+                    if resp.status != 200:
+                        print(f"  skip {link}: HTTP {resp.status}")
+                        continue
+                    (out_dir / f"{Path(feed_name).stem}-{i}.html").write_bytes(body)
+                    print(f"  {link}: {len(body):,} bytes")
+                except Exception as exc:
+                    print(f"  skip {link}: {exc}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", type=Path, default=CORPUS_DIR)
+    parser.add_argument("--tradingview", action="store_true", help="record the indices page instead")
+    parser.add_argument("--pages", type=int, default=0, help="record N article pages per recorded feed")
+    args = parser.parse_args()
+    if args.tradingview:
+        record_tradingview()
+    elif args.pages:
+        asyncio.run(record_pages(args.pages))
+    else:
+        asyncio.run(record(args.out))
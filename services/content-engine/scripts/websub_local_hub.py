@@ -0,0 +1,199 @@
+# services/content-engine/scripts/websub_local_hub.py
+"""Local stand-in WebSub hub (with demo topics) for testing push ingestion.
+
+Usage:
+    python scripts/websub_local_hub.py [--port 8090] [--host 127.0.0.1]
+
+Then, with the engine running with ``WEBSUB_CALLBACK_BASE_URL=http://127.0.0.1:8000``:
+
+    # 1. register a demo topic served (and advertised) by this hub
+    curl -X POST localhost:8000/api/v1/scraping/sources -H 'Content-Type: application/json' \\
+         -d '{"name": "Demo", "url": "http://127.0.0.1:8090/topics/demo"}'
+    # 2. one polling run finds the hub link and subscribes
+    curl -X POST localhost:8000/api/v1/pipeline/trigger -H 'Content-Type: application/json' \\
+         -d '{"pipeline_type": "news_only"}'
+    # 3. publish: the item reaches the engine's callback within a second
+    curl -X POST 'localhost:8090/topics/demo/items?title=Hello&words=120'
+
+Hub side of the protocol:
+  POST /               hub.mode=subscribe|unsubscribe → 202, then the
+                       verification GET (challenge) to the callback
+                       hub.mode=publish&hub.url=<topic> → fetch the topic and
+                       deliver it, signed with X-Hub-Signature (sha256)
+  GET  /subscriptions  current subscriptions (JSON)
+Demo publisher:
+  GET  /topics/{name}        RSS feed advertising this hub (rel="hub" / "self")
+  POST /topics/{name}/items  add an item (?title=&words=) and publish the topic
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import logging
+import secrets
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+import aiohttp
+from aiohttp import web
+
+logger = logging.getLogger("websub-hub")
+
+DEFAULT_LEASE_S = 86400
+
+# (topic, callback) → {"secret", "expires"}
+Subscriptions = Dict[Tuple[str, str], Dict[str, Any]]
+
+
+def _topic_feed(base: str, name: str, items: List[Dict[str, str]]) -> str:
+    entries = "".join(
+        f"<item><title>{escape(it['title'])}</title><link>{base}/articles/{name}/{it['id']}</link>"
+        f"<guid>{name}-{it['id']}</guid><pubDate>{it['published']}</pubDate>"
+        f"<description>{escape(it['body'])}</description></item>"
+        for it in reversed(items)
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>'
+        f"<title>{escape(name)}</title><link>{base}/topics/{name}</link>"
+        f'<atom:link rel="hub" href="{base}/"/>'
+        f'<atom:link rel="self" href="{base}/topics/{name}" type="application/rss+xml"/>'
+        f"{entries}</channel></rss>"
+    )
+
+
+class LocalHub:
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+        self.subs: Subscriptions = {}
+        self.topics: Dict[str, List[Dict[str, str]]] = {}
+        self.session: aiohttp.ClientSession | None = None
+        self._tasks: set = set()
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/", self.hub)
+        app.router.add_get("/subscriptions", self.list_subscriptions)
+        app.router.add_get("/topics/{name}", self.topic)
+        app.router.add_post("/topics/{name}/items", self.add_item)
+        app.on_startup.append(self._start)
+        app.on_cleanup.append(self._stop)
+        return app
+
+    # ── hub ──────────────────────────────────────────────────────────
+
+    async def hub(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        mode = form.get("hub.mode", "")
+        if mode == "publish":
+            topic = form.get("hub.url") or form.get("hub.topic")
+            if not topic:
+                return web.Response(status=400, text="hub.url required")
+            self._later(self.distribute(str(topic)))
+            return web.Response(status=204)
+        if mode not in ("subscribe", "unsubscribe"):
+            return web.Response(status=400, text="unsupported hub.mode")
+        topic, callback = form.get("hub.topic"), form.get("hub.callback")
+        if not topic or not callback:
+            return web.Response(status=400, text="hub.topic and hub.callback required")
+        lease = int(form.get("hub.lease_seconds") or DEFAULT_LEASE_S)
+        self._later(self.verify(mode, str(topic), str(callback), lease, str(form.get("hub.secret", ""))))
+        return web.Response(status=202)
+
+    async def verify(self, mode: str, topic: str, callback: str, lease: int, secret: str) -> None:
+        challenge = secrets.token_hex(8)
+        params = {"hub.mode": mode, "hub.topic": topic, "hub.challenge": challenge}
+        if mode == "subscribe":
+            params["hub.lease_seconds"] = str(lease)
+        try:
+            async with self.session.get(callback, params=params) as resp:
+                ok = resp.status // 100 == 2 and (await resp.text()) == challenge
+        except aiohttp.ClientError as exc:
+            logger.warning("Verification of %s failed: %s", callback, exc)
+            return
+        if not ok:
+            logger.warning("%s not confirmed by %s", mode, callback)
+        elif mode == "subscribe":
+            self.subs[(topic, callback)] = {"secret": secret, "expires": time.time() + lease}
+            logger.info("Subscribed %s → %s (lease %ds)", topic, callback, lease)
+        else:
+            self.subs.pop((topic, callback), None)
+            logger.info("Unsubscribed %s → %s", topic, callback)
+
+    async def distribute(self, topic: str) -> None:
+        async with self.session.get(topic) as resp:
+            body = await resp.read()
+            ctype = resp.headers.get("Content-Type", "application/rss+xml")
+        now = time.time()
+        targets = [(cb, s) for (t, cb), s in self.subs.items() if t == topic and s["expires"] > now]
+        for callback, sub in targets:
+            headers = {"Content-Type": ctype, "Link": f'<{self.base_url}/>; rel="hub", <{topic}>; rel="self"'}
+            if sub["secret"]:
+                digest = hmac.new(sub["secret"].encode(), body, hashlib.sha256).hexdigest()
+                headers["X-Hub-Signature"] = f"sha256={digest}"
+            try:
+                async with self.session.post(callback, data=body, headers=headers) as resp:
+                    logger.info("Delivered %s (%d bytes) to %s → %s", topic, len(body), callback, resp.status)
+            except aiohttp.ClientError as exc:
+                logger.warning("Delivery to %s failed: %s", callback, exc)
+
+    async def list_subscriptions(self, request: web.Request) -> web.Response:
+        return web.json_response([
+            {"topic": t, "callback": cb, "expires_in_s": round(s["expires"] - time.time())}
+            for (t, cb), s in self.subs.items()
+        ])
+
+    # ── demo publisher ───────────────────────────────────────────────
+
+    async def topic(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        xml = _topic_feed(self.base_url, name, self.topics.get(name, []))
+        return web.Response(text=xml, content_type="application/rss+xml")
+
+    async def add_item(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        items = self.topics.setdefault(name, [])
+        words = int(request.query.get("words", "120"))
+        item = {
+            "id": str(len(items) + 1),
+            "title": request.query.get("title", f"{name} item {len(items) + 1}"),
+            "body": " ".join(["update"] * words),
+            "published": format_datetime(datetime.now(timezone.utc), usegmt=True),
+        }
+        items.append(item)
+        self._later(self.distribute(f"{self.base_url}/topics/{name}"))
+        return web.json_response(item, status=201)
+
+    # ── plumbing ─────────────────────────────────────────────────────
+
+    def _later(self, coro: Any) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _start(self, app: web.Application) -> None:
+        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15))
+
+    async def _stop(self, app: web.Application) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await self.session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+    hub = LocalHub(f"http://{args.host}:{args.port}")
+    web.run_app(hub.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
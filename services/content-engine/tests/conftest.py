@@ -0,0 +1,67 @@
+# services/content-engine/tests/conftest.py
+"""Shared test setup — engine root on ``sys.path`` and a local feed server."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import datetime
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Dict, List
+
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+ENGINE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ENGINE_ROOT))
+
+
+def rss_feed(name: str, items: int) -> str:
+    """RSS document with ``items`` fresh entries of ~20 words each."""
+    now = format_datetime(datetime.utcnow())
+    entries = "".join(
+        f"<item><title>{name} story {i}</title><link>https://example.com/{name}/{i}</link>"
+        f"<guid>{name}-{i}</guid><pubDate>{now}</pubDate>"
+        f"<description>{' '.join(['word'] * 20)} {name} {i}</description></item>"
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>{name}</title>{entries}</channel></rss>'
+
+
+@pytest_asyncio.fixture
+async def feed_server():
+    """Serves ``/feed/<name>`` from a dict the test fills in: ``{name: (xml, delay_s)}``.
+
+    A third item overrides the Content-Type; ``xml`` may also be bytes, sent
+    as they are.  Each feed has the ETag ``"<name>"`` and answers a matching
+    ``If-None-Match`` with 304.  Yields ``(server, feeds, hits)``; ``hits``
+    lists feed names in request order.
+    """
+    feeds: Dict[str, tuple] = {}
+    hits: List[str] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        hits.append(name)
+        body, delay, *content_type = feeds[name]
+        if delay:
+            await asyncio.sleep(delay)
+        etag = f'"{name}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        if content_type or isinstance(body, bytes):
+            ctype = content_type[0] if content_type else "application/rss+xml"
+            data = body if isinstance(body, bytes) else body.encode("utf-8")
+            return web.Response(body=data, headers={"ETag": etag, "Content-Type": ctype})
+        return web.Response(text=body, content_type="application/rss+xml", headers={"ETag": etag})
+
+    app = web.Application()
+    app.router.add_get("/feed/{name}", handler)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    try:
+        yield server, feeds, hits
+    finally:
+        await server.close()
@@ -0,0 +1,84 @@
+# services/content-engine/tests/test_bloom.py
+"""ScalableBloomFilter: false-positive rate as it grows, no false negatives, save / load."""
+
+from __future__ import annotations
+
+import random
+import struct
+
+import pytest
+
+from core.bloom import GROWTH, MAGIC, TIGHTENING, ScalableBloomFilter
+
+ERROR_RATE = 0.01
+INITIAL = 1000
+
+
+def _keys(seed: int, n: int) -> list:
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(n)]
+
+
+@pytest.fixture(scope="module")
+def absent():
+    return _keys(2, 40_000)
+
+
+def test_false_positive_rate_stays_below_target_at_each_growth_step(absent):
+    bloom = ScalableBloomFilter(initial_capacity=INITIAL, error_rate=ERROR_RATE)
+    added: list = []
+    for step in range(3):
+        batch = _keys(100 + step, INITIAL * GROWTH**step)
+        for fp in batch:
+            bloom.add(fp)
+        added += batch
+
+        assert len(bloom.filters) == step + 1
+        newest = bloom.filters[-1]
+        assert newest.full
+        assert newest.error_rate == pytest.approx(ERROR_RATE * (1 - TIGHTENING) * TIGHTENING**step)
+        assert newest.false_positive_rate() < newest.error_rate * 1.25  # full filter near its design rate
+
+        assert all(fp in bloom for fp in added)  # no false negatives
+        observed = sum(fp in bloom for fp in absent) / len(absent)
+        assert observed <= ERROR_RATE
+        assert bloom.stats()["estimated_fp_rate"] <= ERROR_RATE
+
+
+def test_round_trip_through_bytes():
+    bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.001)
+    keys = _keys(3, 700)  # three filters, the last one partly filled
+    for fp in keys:
+        bloom.add(fp)
+
+    loaded = ScalableBloomFilter.from_bytes(bloom.to_bytes())
+
+    assert loaded.to_bytes() == bloom.to_bytes()
+    assert loaded.stats() == bloom.stats()
+    assert all(fp in loaded for fp in keys)
+    probes = _keys(4, 5000)
+    assert [fp in loaded for fp in probes] == [fp in bloom for fp in probes]
+    loaded.add(1)  # keeps growing where the saved one stopped
+    assert len(loaded.filters) == len(bloom.filters) and len(loaded) == len(keys) + 1
+
+
+def test_empty_filter_round_trip():
+    loaded = ScalableBloomFilter.from_bytes(ScalableBloomFilter(50, 0.01).to_bytes())
+    assert (loaded.initial_capacity, loaded.error_rate, loaded.filters) == (50, 0.01, [])
+
+
+def test_corrupt_bytes_are_rejected():
+    bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+    bloom.add(42)
+    raw = bloom.to_bytes()
+
+    with pytest.raises(ValueError, match="not a Bloom"):
+        ScalableBloomFilter.from_bytes(b"XXXX" + raw[4:])
+    with pytest.raises(ValueError, match="truncated"):
+        ScalableBloomFilter.from_bytes(raw[:-1])
+    # a header whose bit count does not match its capacity / error rate
+    offset = len(MAGIC) + struct.calcsize("<QdI")
+    capacity, rate, count, m, k = struct.unpack_from("<QdQQI", raw, offset)
+    bad = raw[:offset] + struct.pack("<QdQQI", capacity, rate, count, m + 8, k) + raw[offset + struct.calcsize("<QdQQI"):]
+    with pytest.raises(ValueError, match="geometry"):
+        ScalableBloomFilter.from_bytes(bad)
@@ -0,0 +1,28 @@
+# services/content-engine/tests/test_deduplication.py
+"""Deduplicator: one-time import of the legacy ``seen_hashes.json``."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from core.deduplication import Deduplicator
+
+
+def test_legacy_cache_is_imported_once_and_left_in_place(tmp_path):
+    legacy = tmp_path / "seen_hashes.json"
+    titles = ["Fed holds rates", "Oil slips"]
+    legacy.write_text(json.dumps([hashlib.md5(t.lower().encode()).hexdigest() for t in titles]))
+    content = legacy.read_bytes()
+
+    dedup = Deduplicator(path=tmp_path / "seen_hashes.bin", url_path=tmp_path / "seen_urls.bin")
+    assert all(dedup.is_duplicate(t) for t in titles)
+    assert legacy.read_bytes() == content  # tracked in git: never rewritten
+    assert (tmp_path / "seen_hashes.json.imported").read_text() == "2\n"
+
+    # with the imported keys gone, the marker keeps them from being imported again
+    for path in tmp_path.iterdir():
+        if path.name.startswith("seen_hashes.") and not path.name.startswith("seen_hashes.json"):
+            path.unlink()
+    again = Deduplicator(path=tmp_path / "seen_hashes.bin", url_path=tmp_path / "seen_urls.bin")
+    assert not any(again.is_duplicate(t) for t in titles)
@@ -0,0 +1,79 @@
+# services/content-engine/tests/test_feed_body.py
+"""Reading polled feed bodies: byte cap, content-type check, incremental decoding."""
+
+from __future__ import annotations
+
+import pytest
+
+from conftest import rss_feed
+from scraping.rss_scraper import READ_CHUNK, RSSScraper
+from scraping.source_health import SourceHealth
+
+
+async def _poll(server, name: str, **kwargs):
+    source = {"name": name, "url": f"http://127.0.0.1:{server.port}/feed/{name}"}
+    scraper = RSSScraper(sources=[source], min_words=1, **kwargs)
+    articles = [a async for a in scraper.stream(max_per_source=500)]
+    return scraper, scraper.last_report[0], articles
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parser", ["feedparser", "stream"])
+async def test_body_is_cut_at_max_bytes(feed_server, tmp_path, parser):
+    server, feeds, _ = feed_server
+    feeds["big"] = (rss_feed("big", 400), 0)
+    health = SourceHealth(path=tmp_path / "health.json")
+
+    scraper, report, articles = await _poll(server, "big", max_bytes=32 * 1024, parser=parser, health=health)
+
+    assert (report.status, report.bytes, report.truncated) == ("ok", 32 * 1024, True)
+    assert 0 < len(articles) < 400  # the complete entries of the first 32 KiB
+    assert [a.title for a in articles] == [f"big story {i}" for i in range(len(articles))]
+    assert scraper.stats()["truncated"] == 1 and scraper.stats()["bytes"] == 32 * 1024
+
+
+@pytest.mark.asyncio
+async def test_non_feed_content_type_is_not_read(feed_server):
+    server, feeds, _ = feed_server
+    feeds["image"] = (b"\x89PNG" + b"\0" * 1000, 0, "image/png")
+
+    scraper, report, articles = await _poll(server, "image")
+
+    assert (report.status, report.bytes, articles) == ("bad_content_type", 0, [])
+    assert report.error == "image/png" and scraper.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_multibyte_characters_split_across_chunks(feed_server):
+    server, feeds, _ = feed_server
+    # one ASCII byte up front so every chunk boundary falls inside a 2-byte "é"
+    xml = rss_feed("accents", 3).replace("<channel>", "<channel><!--x-->", 1)
+    xml = xml.replace("</description>", " " + "é" * READ_CHUNK + "</description>")
+    feeds["accents"] = (xml, 0, "application/rss+xml; charset=utf-8")
+
+    _, report, articles = await _poll(server, "accents")
+
+    assert report.bytes == len(xml.encode("utf-8")) > 2 * READ_CHUNK
+    assert len(articles) == 3
+    assert all("�" not in a.content and a.content.endswith("é" * READ_CHUNK) for a in articles)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content_type, declaration",
+    [
+        ("application/rss+xml; charset=windows-1252", ""),
+        ("application/rss+xml", ' encoding="windows-1252"'),
+        ("text/xml; charset=windows-1252", ' encoding="utf-8"'),  # the header wins
+    ],
+    ids=["header", "xml-declaration", "header-over-declaration"],
+)
+async def test_charset_from_header_or_declaration(feed_server, content_type, declaration):
+    server, feeds, _ = feed_server
+    xml = rss_feed("cp", 1).replace("cp story 0", "€5 café")
+    xml = xml.replace('<?xml version="1.0"?>', f'<?xml version="1.0"{declaration}?>')
+    feeds["cp"] = (xml.encode("windows-1252"), 0, content_type)
+
+    _, _, articles = await _poll(server, "cp")
+
+    assert [a.title for a in articles] == ["€5 café"]
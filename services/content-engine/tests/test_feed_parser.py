@@ -0,0 +1,104 @@
+# services/content-engine/tests/test_feed_parser.py
+"""Streaming feed parser: same articles as feedparser, origLink, lazy reading, fallback."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import rss_feed
+from scraping.feed_parser import FeedFormatError, stream_feed
+from scraping.rss_scraper import parse_feed
+
+SOURCE = {"name": "test", "url": "https://example.com/feed"}
+WORDS = " ".join(["word"] * 30)
+
+RSS = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:media="http://search.yahoo.com/mrss/"
+     xmlns:feedburner="http://rssnamespace.org/feedburner/ext/1.0" xmlns:atom="http://www.w3.org/2005/Atom">
+<channel><title>Test</title><link>https://example.com/</link>
+<atom:link rel="hub" href="https://hub.example.com/"/>
+<atom:link rel="self" href="https://example.com/feed" type="application/rss+xml"/>
+<item>
+  <title>Rich &amp; full</title><link>https://feeds.feedburner.com/~r/x/1</link>
+  <feedburner:origLink>https://example.com/articles/1</feedburner:origLink>
+  <guid isPermaLink="false">tag:example.com,1</guid><pubDate>Mon, 02 Mar 2026 10:00:00 +0100</pubDate>
+  <dc:creator>Ada</dc:creator><description>short summary</description>
+  <content:encoded><![CDATA[<p>{WORDS}</p><img src="https://img.example.com/inline.jpg">]]></content:encoded>
+  <media:group><media:content url="https://img.example.com/media.jpg" medium="image"/></media:group>
+</item>
+<item>
+  <title>Enclosure only</title><guid>https://example.com/articles/2</guid>
+  <pubDate>Mon, 02 Mar 2026 08:00:00 GMT</pubDate><description>{WORDS}</description>
+  <enclosure url="https://img.example.com/enc.png" type="image/png" length="1"/>
+</item>
+</channel></rss>"""
+
+ATOM = f"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>
+<link rel="self" href="https://example.com/atom"/>
+<entry><title>Atom entry</title><id>urn:uuid:1</id>
+  <link rel="alternate" href="https://example.com/atom/1"/><link rel="enclosure" type="image/jpeg" href="https://img.example.com/a.jpg"/>
+  <updated>2026-03-02T09:30:00Z</updated><author><name>Grace</name></author>
+  <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><p>{WORDS}</p></div></content>
+</entry></feed>"""
+
+
+def _parse(raw: str, parser: str, max_per_source: int = 10):
+    return parse_feed(raw, SOURCE, max_per_source, datetime(2026, 1, 1), 5, parser=parser)
+
+
+def _fields(parsed) -> list:
+    return [
+        (a.title, a.source_url, a.content, a.image_url, a.published_at, a.author)
+        for a in parsed.articles
+    ]
+
+
+@pytest.mark.parametrize("raw", [RSS, ATOM], ids=["rss", "atom"])
+def test_stream_parser_matches_feedparser(raw):
+    streamed, reference = _parse(raw, "stream"), _parse(raw, "feedparser")
+    assert streamed.articles
+    assert streamed.parser == "stream" and reference.parser == "feedparser"
+    assert _fields(streamed) == _fields(reference)
+    assert streamed.examined == reference.examined
+    assert (streamed.hub, streamed.topic) == (reference.hub, reference.topic)
+
+
+def test_rss_fields():
+    parsed = _parse(RSS, "stream")
+    rich, enclosure = parsed.articles
+    assert rich.title == "Rich & full"
+    assert rich.source_url == "https://example.com/articles/1"  # feedburner:origLink
+    assert rich.published_at == datetime(2026, 3, 2, 9, 0)  # to UTC
+    assert (rich.author, rich.image_url) == ("Ada", "https://img.example.com/media.jpg")
+    assert rich.content == WORDS  # content:encoded wins over the description
+    assert enclosure.source_url == "https://example.com/articles/2"  # permalink guid
+    assert enclosure.image_url == "https://img.example.com/enc.png"
+    assert (parsed.hub, parsed.topic) == ("https://hub.example.com/", "https://example.com/feed")
+
+
+def test_malformed_xml_falls_back_to_feedparser():
+    broken = rss_feed("broken", 3).replace("broken story 1", "caf&eacute; story")  # undeclared entity
+    with pytest.raises(FeedFormatError):
+        list(stream_feed(broken).entries)
+    parsed = parse_feed(broken, SOURCE, 10, datetime.utcnow() - timedelta(days=1), 1, parser="stream")
+    assert parsed.parser == "feedparser"
+    assert [a.title for a in parsed.articles] == ["broken story 0", "café story", "broken story 2"]
+
+
+def test_stream_stops_reading_once_enough_entries_are_taken():
+    # 200 entries (~400 KB) and a document that breaks only at the very end
+    long = rss_feed("long", 200).replace("</description>", " " + "x" * 2000 + "</description>")
+    broken = long.replace("</channel></rss>", "<item><title>&oops;")
+
+    entries = stream_feed(broken).entries
+    assert [next(entries).title for _ in range(3)] == ["long story 0", "long story 1", "long story 2"]
+
+    parsed = parse_feed(broken, SOURCE, 5, datetime.utcnow() - timedelta(days=1), 1, parser="stream")
+    assert parsed.parser == "stream"
+    assert len(parsed.articles) == 5
+    with pytest.raises(FeedFormatError):
+        list(stream_feed(broken).entries)
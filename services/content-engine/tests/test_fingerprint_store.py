@@ -0,0 +1,79 @@
+# services/content-engine/tests/test_fingerprint_store.py
+"""FingerprintGenerations: one lookup per generation when adding, daily expiry, reload."""
+
+from __future__ import annotations
+
+import os
+from datetime import date, datetime, timedelta
+
+from core.fingerprint_store import FingerprintGenerations, FingerprintStore
+
+TODAY = date(2026, 10, 17)
+
+
+def test_add_counts_each_new_fingerprint_once(tmp_path):
+    gens = FingerprintGenerations(tmp_path / "seen.bin", bloom_error_rate=0.001)
+    fps = [i * 0x9E3779B97F4A7C15 % 2**64 for i in range(1, 1001)]
+
+    assert all(gens.add(fp, TODAY) for fp in fps)
+    assert not any(gens.add(fp, TODAY) for fp in fps)
+
+    bloom = gens.stats()["bloom"]
+    assert bloom["new_lookups"] == len(fps)
+    # one Bloom check per new fingerprint; the first add creates the day's store
+    store = gens._gens[TODAY].stats()
+    assert store["definitely_new"] + store["false_positives"] == len(fps) - 1
+
+
+def _day(n: int) -> date:
+    return TODAY - timedelta(days=n)
+
+
+def test_days_outside_the_retention_window_expire(tmp_path):
+    path = tmp_path / "seen.bin"
+    gens = FingerprintGenerations(path, retention_days=3, bloom_error_rate=0.01)
+    for n in (4, 3, 2, 1, 0):  # fingerprint 100 + n first seen n days ago
+        assert gens.add(100 + n, _day(n))
+        gens.save(_day(n))
+
+    assert sorted(gens.stats()["generations"]) == [d.isoformat() for d in (_day(2), _day(1), _day(0))]
+    assert gens.stats()["expired"] == 2
+    assert not [f for f in tmp_path.iterdir() if f.name.startswith(("seen.20261013", "seen.20261014"))]
+    assert 102 in gens and 103 not in gens and 104 not in gens
+    assert gens.add(104, TODAY)  # expired → new again
+
+    # finished days were compacted to .bin, today is still a log; both reload
+    gens.save(TODAY)
+    again = FingerprintGenerations(path, retention_days=3, bloom_error_rate=0.01)
+    assert [fp for fp in range(100, 105) if fp in again] == [100, 101, 102, 104]
+    assert len(again) == 4
+
+
+def test_expiry_on_load_after_downtime(tmp_path):
+    path = tmp_path / "seen.bin"
+    gens = FingerprintGenerations(path, retention_days=2)
+    gens.add(1, _day(11))
+    gens.add(2, _day(10))
+    gens.save(_day(10))
+
+    reopened = FingerprintGenerations(path, retention_days=2)
+    assert 1 in reopened and 2 in reopened  # nothing expires until the next save / expire
+    assert reopened.expire(_day(9)) == 1
+    assert reopened.expire(TODAY) == 1
+    assert len(reopened) == 0 and not list(tmp_path.iterdir())
+
+
+def test_undated_single_file_store_is_adopted_as_a_day(tmp_path):
+    path = tmp_path / "seen.bin"
+    legacy = FingerprintStore(path)  # the layout before generations: seen.bin + seen.log
+    legacy.add_new(7)
+    legacy.compact()
+    legacy.add_new(8)
+    legacy.save()
+    stamp = (datetime(2026, 10, 10, 12) - datetime(1970, 1, 1)).total_seconds()
+    os.utime(path, (stamp, stamp))
+
+    gens = FingerprintGenerations(path, retention_days=30)
+    assert list(gens.stats()["generations"]) == ["2026-10-10"]
+    assert 7 in gens and 8 in gens
+    assert not path.exists()
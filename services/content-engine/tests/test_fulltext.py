@@ -0,0 +1,49 @@
+# services/content-engine/tests/test_fulltext.py
+"""FullTextExtractor: per-host slots before global ones, no leftover host state."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from scraping.base import ScrapingResult
+from scraping.fulltext import FullTextExtractor
+from utils.http_client import HttpClient
+
+PAGE = "<html><body><article>" + "<p>The full article text, with commas, goes on for a while.</p>" * 20 + "</article></body></html>"
+
+
+@pytest.mark.asyncio
+async def test_busy_host_does_not_block_other_hosts():
+    async def page(request: web.Request) -> web.Response:
+        if request.match_info["kind"] == "slow":
+            await asyncio.sleep(0.2)
+        return web.Response(text=PAGE, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{kind}/{n}", page)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    http = HttpClient()
+    try:
+        extractor = FullTextExtractor(http, concurrency=2, per_host_limit=1)
+        done = []
+
+        async def enrich(url: str) -> None:
+            art = ScrapingResult(title=url, content="teaser", source_url=url, source_name="t", source_type="rss")
+            await extractor.enrich(art)
+            assert art.meta_data.get("fulltext")
+            done.append(url)
+
+        urls = [f"http://127.0.0.1:{server.port}/slow/{i}" for i in range(5)]
+        urls.append(f"http://localhost:{server.port}/fast/0")
+        await asyncio.gather(*(enrich(u) for u in urls))
+
+        assert done[0].endswith("/fast/0")
+        assert extractor.stats()["hosts_in_flight"] == 0
+    finally:
+        await http.close()
+        await server.close()
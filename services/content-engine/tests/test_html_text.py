@@ -0,0 +1,71 @@
+# services/content-engine/tests/test_html_text.py
+"""html_to_text: same words as the BeautifulSoup cleaner it replaced, spaced at block tags."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scraping.html_text import BOILERPLATE_PHRASES, html_to_text
+
+# Shaped like a WordPress feed description: lazy-loaded figure, comment,
+# script/style, entities, inline and block markup, "Continue reading" link.
+FEED_HTML = """\
+<figure class="wp-block-image"><img loading="lazy" data-src="https://cdn.example.com/lazy.jpg" \
+src="https://cdn.example.com/chart.png" alt="BTC chart"/><figcaption>Bitcoin&#8217;s daily chart</figcaption></figure>
+<!-- ad slot --><script>window.ads=[];</script><style>.x{}</style>
+<p>Bitcoin rose <strong>4%</strong> on Tuesday&nbsp;as <a href="https://example.com/etf">ETF inflows</a> hit a record.</p>\
+<p>Analysts said the move was driven by&hellip; short covering.</p>
+<ul><li>Ether: +2%</li><li>Solana: &minus;1%</li></ul><p><a href="https://example.com/more">Continue reading</a></p>"""
+
+
+def _baseline(raw: str) -> str:
+    """The BeautifulSoup ``clean_html`` this module replaced."""
+    text = re.sub(r"\s+", " ", BeautifulSoup(raw, "html.parser").get_text()).strip()
+    for phrase in BOILERPLATE_PHRASES:
+        text = text.replace(phrase, "")
+    return text.strip()
+
+
+def test_matches_the_beautifulsoup_cleaner_except_at_block_boundaries():
+    text, _ = html_to_text(FEED_HTML)
+    assert text.replace(" ", "") == _baseline(FEED_HTML).replace(" ", "")
+    # the old cleaner glued words across block tags
+    assert "record.Analysts" in _baseline(FEED_HTML)
+    assert "hit a record. Analysts said" in text
+    assert "Ether: +2% Solana: −1%" in text
+    assert "Continue reading" not in text and "window.ads" not in text
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ('<img data-src="/lazy.jpg" src="/real.jpg">', "/real.jpg"),
+        ('<img data-src="/lazy.jpg">', ""),
+        ("<img\nsrc='/single.jpg'>", "/single.jpg"),
+        ("<img alt=x src=/bare.jpg>", "/bare.jpg"),
+        ('<img src="/a.jpg?w=1&amp;h=2"><img src="/b.jpg">', "/a.jpg?w=1&h=2"),
+        ('<script>"<img src=/js.jpg>"</script><img src="/after.jpg">', "/after.jpg"),
+    ],
+)
+def test_first_image_src(raw, expected):
+    assert html_to_text(raw)[1] == expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("", ""),
+        ("plain   text\n", "plain text"),
+        ("<p>one</p><p>two</p>", "one two"),
+        ("a<br/>b<hr>c", "a b c"),
+        ("in<b>line</b> <i>tags</i>", "inline tags"),
+        ("Tom &amp; Jerry &lt;3", "Tom & Jerry <3"),
+        ("news <!-- unclosed comment", "news"),
+        ("Subscribe to our newsletter today", "today"),
+    ],
+)
+def test_text(raw, expected):
+    assert html_to_text(raw)[0] == expected
@@ -0,0 +1,72 @@
+# services/content-engine/tests/test_http_cache.py
+"""ConditionalCache (304 revalidation, persistence) and ResponseCache (TTL, eviction)."""
+
+from __future__ import annotations
+
+import pytest
+
+from conftest import rss_feed
+from scraping import http_cache
+from scraping.http_cache import ConditionalCache, ResponseCache
+from scraping.rss_scraper import RSSScraper
+
+
+@pytest.mark.asyncio
+async def test_second_poll_is_answered_with_304(feed_server, tmp_path):
+    server, feeds, _ = feed_server
+    feeds["news"] = (rss_feed("news", 2), 0)
+    sources = [{"name": "news", "url": f"http://127.0.0.1:{server.port}/feed/news"}]
+    cache = ConditionalCache(path=tmp_path / "validators.json")
+
+    first = RSSScraper(sources=sources, min_words=1, cache=cache)
+    assert len([a async for a in first.stream()]) == 2
+    assert cache.request_headers(sources[0]["url"]) == {"If-None-Match": '"news"'}
+
+    # validators survive a restart
+    reloaded = ConditionalCache(path=tmp_path / "validators.json")
+    second = RSSScraper(sources=sources, min_words=1, cache=reloaded)
+    assert [a async for a in second.stream()] == []
+    assert second.last_report[0].status == "not_modified"
+    assert reloaded.stats()["hits"] == 1
+
+
+def test_response_without_validators_forgets_old_ones(tmp_path):
+    cache = ConditionalCache(path=tmp_path / "validators.json")
+    cache.record_response("https://x/feed", {"ETag": '"v1"', "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"})
+    assert cache.request_headers("https://x/feed") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Sat, 17 Oct 2026 10:00:00 GMT",
+    }
+    cache.record_response("https://x/feed", {})
+    assert cache.request_headers("https://x/feed") == {}
+
+
+def test_key_ignores_secrets_and_param_order():
+    a = ConditionalCache.key("https://newsapi.org/v2/top", {"page": 2, "apiKey": "s3cret", "language": "en"})
+    b = ConditionalCache.key("https://newsapi.org/v2/top", {"language": "en", "page": "2"})
+    assert a == b == "https://newsapi.org/v2/top?language=en&page=2"
+
+
+def test_response_cache_ttl_and_stale_body(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(http_cache.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl_s=60)
+    cache.put("k", {"articles": [1]})
+
+    now[0] += 59
+    assert cache.get("k") == {"articles": [1]}
+    now[0] += 2
+    assert cache.get("k") is None
+    assert cache.get_stale("k") == {"articles": [1]}  # still usable after a 304
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_response_cache_evicts_the_entry_closest_to_expiry(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(http_cache.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl_s=60, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, key)
+        now[0] += 1
+    assert cache.get_stale("a") is None
+    assert cache.get("b") == "b" and cache.get("c") == "c"
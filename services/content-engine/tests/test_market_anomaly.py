@@ -0,0 +1,50 @@
+# services/content-engine/tests/test_market_anomaly.py
+"""AnomalyDetector: flat windows, spread floor, trigger caps."""
+
+from __future__ import annotations
+
+import random
+from typing import Callable
+
+import pytest
+
+from core.market_anomaly import NUMPY_AVAILABLE, AnomalyDetector
+from core.market_store import MarketStore
+
+pytestmark = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+
+SYMBOLS = [f"IDX{i}" for i in range(100)]
+
+
+def store(history: Callable[[int], float], current: Callable[[int], float]) -> MarketStore:
+    """96 snapshots from ``history(i)`` then one from ``current(i)`` for every symbol."""
+    s = MarketStore(capacity=200)
+    for _ in range(96):
+        s.record([{"symbol": sym, "change_percent": history(i)} for i, sym in enumerate(SYMBOLS)])
+    s.record([{"symbol": sym, "change_percent": current(i)} for i, sym in enumerate(SYMBOLS)])
+    return s
+
+
+def test_small_move_after_flat_window_is_not_flagged():
+    flagged = AnomalyDetector().detect(store(lambda i: 0.25, lambda i: 0.30), SYMBOLS)
+    assert flagged == []
+
+
+def test_spread_floor_on_nearly_flat_window():
+    rng = random.Random(0)
+    s = store(lambda i: 0.25 + rng.gauss(0, 0.001), lambda i: 2.0 if i == 7 else 0.30)
+    assert [a.symbol for a in AnomalyDetector().detect(s, SYMBOLS)] == ["IDX7"]
+
+
+def test_market_wide_move_is_capped_per_tick_and_day():
+    rng = random.Random(0)
+    s = store(lambda i: rng.gauss(0, 0.5), lambda i: 5 + i * 0.01)
+    detector = AnomalyDetector(max_per_tick=3, max_per_day=5, cooldown_minutes=0)
+
+    first = [a.symbol for a in detector.detect(s, SYMBOLS)]
+    assert len(first) == 3
+    assert detector.capped == 97
+
+    second = detector.detect(s, SYMBOLS)
+    assert len(second) == 2  # 5 per day
+    assert detector.detect(s, SYMBOLS) == []
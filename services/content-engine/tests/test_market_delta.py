@@ -0,0 +1,82 @@
+# services/content-engine/tests/test_market_delta.py
+"""MarketDeltaTracker: relative epsilon, undelivered selections, periodic full resync."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from core import market_delta
+from core.market_delta import MarketDeltaTracker
+
+
+class Clock(datetime):
+    now = datetime(2026, 3, 2, 9, 0)
+
+    @classmethod
+    def utcnow(cls):
+        return cls.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    Clock.now = datetime(2026, 3, 2, 9, 0)
+    monkeypatch.setattr(market_delta, "datetime", Clock)
+    return Clock
+
+
+def _quote(symbol: str, last: float | None, **fields) -> dict:
+    return {"symbol": symbol, "last": last, "change": 1.0, "high": 110.0, "low": 90.0, **fields}
+
+
+@pytest.fixture
+def tracker(tmp_path, clock):
+    tracker = MarketDeltaTracker(epsilon=1e-3, full_resync_minutes=60, path=tmp_path / "snapshot.json")
+    items, full = tracker.select([_quote("SPX", 100.0), _quote("TINY", 0.5)])
+    assert full and len(items) == 2
+    tracker.commit(items, full)
+    return tracker
+
+
+@pytest.mark.parametrize(
+    "quote, selected",
+    [
+        (_quote("SPX", 100.09), False),  # 0.09 % < 0.1 %
+        (_quote("SPX", 100.11), True),
+        (_quote("SPX", 100.0, high=110.2), True),
+        (_quote("SPX", None), True),
+        (_quote("TINY", 0.5009), False),  # below 1.0 the threshold is absolute
+        (_quote("TINY", 0.5011), True),
+        (_quote("NEW", 1.0), True),
+    ],
+)
+def test_epsilon(tracker, quote, selected):
+    items, full = tracker.select([quote])
+    assert not full
+    assert items == ([quote] if selected else [])
+
+
+def test_undelivered_moves_are_selected_again(tracker):
+    moved = [_quote("SPX", 101.0)]
+    assert tracker.select(moved)[0] == moved  # delivery fails, no commit
+    assert tracker.select(moved)[0] == moved
+    tracker.commit(moved, False)
+    assert tracker.select(moved)[0] == []
+
+
+def test_full_resync_after_the_interval_and_across_restarts(tracker, clock):
+    unchanged = [_quote("SPX", 100.0), _quote("TINY", 0.5)]
+    clock.now += timedelta(minutes=59)
+    assert tracker.select(unchanged) == ([], False)
+
+    restarted = MarketDeltaTracker(epsilon=1e-3, full_resync_minutes=60, path=tracker.path)
+    assert restarted.select(unchanged) == ([], False)
+
+    clock.now += timedelta(minutes=1)
+    assert restarted.select(unchanged) == (unchanged, True)
+    # a resync that was never delivered is retried on the next run
+    clock.now += timedelta(minutes=5)
+    assert restarted.select(unchanged) == (unchanged, True)
+    restarted.commit(unchanged, True)
+    assert restarted.select(unchanged) == ([], False)
@@ -0,0 +1,73 @@
+# services/content-engine/tests/test_market_store.py
+"""MarketStore: OHLC bucket boundaries, session high/low, ring wrap-around."""
+
+from __future__ import annotations
+
+from core.market_store import MarketSeries, MarketStore
+
+DAY = 24 * 60 * 60
+T0 = 1_767_225_600.0  # 2026-01-01T00:00:00Z, a boundary for every interval
+
+
+def _series(samples, capacity: int = 16) -> MarketSeries:
+    series = MarketSeries("SPX", capacity)
+    for ts, last in samples:
+        series.append(ts, {"last": last, "change": last - 100, "high": 500.0, "low": 1.0})
+    return series
+
+
+def test_bars_split_exactly_on_interval_boundaries():
+    series = _series([(T0 + 0, 100), (T0 + 59.999, 103), (T0 + 60, 99), (T0 + 119, 101), (T0 + 180, 98)])
+    bars = series.ohlc("1m")
+    assert [b["ts"] for b in bars] == [T0, T0 + 60, T0 + 180]  # empty minute 2 has no bar
+    assert [(b["open"], b["high"], b["low"], b["close"], b["samples"]) for b in bars] == [
+        (100, 103, 100, 103, 2),
+        (99, 101, 99, 101, 2),
+        (98, 98, 98, 98, 1),
+    ]
+    assert bars[1]["change"] == 1  # change of the closing sample
+
+    [quarter] = series.ohlc("15m")
+    assert (quarter["ts"], quarter["open"], quarter["close"], quarter["samples"]) == (T0, 100, 98, 5)
+    assert [b["ts"] for b in _series([(T0 + 899, 1), (T0 + 900, 2)]).ohlc("15m")] == [T0, T0 + 900]
+    assert [b["ts"] for b in _series([(T0 + DAY - 1, 1), (T0 + DAY, 2)]).ohlc("1d")] == [T0, T0 + DAY]
+
+
+def test_only_daily_bars_use_the_session_high_low():
+    series = _series([(T0 + 10, 100), (T0 + 20, 102)])
+    [hourly] = series.ohlc("1h")
+    assert (hourly["high"], hourly["low"]) == (102, 100)
+    [daily] = series.ohlc("1d")
+    assert (daily["high"], daily["low"]) == (500.0, 1.0)
+
+
+def test_missing_prices_are_skipped_and_window_is_inclusive():
+    series = MarketSeries("SPX", 8)
+    series.append(T0, {"last": 100})
+    series.append(T0 + 30, {"last": None, "change": 1})
+    series.append(T0 + 60, {"last": 101})
+    assert [b["samples"] for b in series.ohlc("1m")] == [1, 1]
+    assert series.rows()[1]["last"] is None
+    assert [b["ts"] for b in series.ohlc("1m", since=T0 + 30, until=T0 + 60)] == [T0 + 60]
+
+
+def test_ring_keeps_the_newest_samples_in_order():
+    series = _series([(T0 + i * 60, 100 + i) for i in range(10)], capacity=4)
+    assert len(series) == 4
+    assert series.column("last") == [106, 107, 108, 109]
+    assert series.column("last", since=T0 + 7 * 60, until=T0 + 8 * 60) == [107, 108]
+    assert series.tail("ts", 2) == [T0 + 480, T0 + 540]
+    assert [b["open"] for b in series.ohlc("1m")] == [106, 107, 108, 109]
+    assert not series.append(T0 + 540, {"last": 1})  # not newer than the latest
+    assert series.latest()["last"] == 109
+
+
+def test_store_records_snapshots_per_symbol():
+    store = MarketStore(capacity=4)
+    quotes = [{"symbol": "SPX", "name": "S&P 500", "last": 100.0}, {"name": "no symbol", "last": 1.0}]
+    assert store.record(quotes, ts=T0) == 1
+    assert store.record(quotes, ts=T0) == 0  # same timestamp again
+    assert store.record([{"symbol": "SPX", "last": 101.0, "currency": "USD"}], ts=T0 + 60) == 1
+    [spx] = store.symbols()
+    assert (spx["name"], spx["currency"], spx["points"], spx["latest"]["last"]) == ("S&P 500", "USD", 2, 101.0)
+    assert store.stats()["samples_recorded"] == 2
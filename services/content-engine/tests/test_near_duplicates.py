@@ -0,0 +1,90 @@
+# services/content-engine/tests/test_near_duplicates.py
+"""NearDuplicateIndex: band layout, recall around the threshold, ring eviction and re-sort."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core import near_duplicates  # noqa: E402
+from core.near_duplicates import NearDuplicateIndex, band_layout  # noqa: E402
+
+WORDS = 200
+
+
+def _text(story: int, replaced: int = 0) -> str:
+    """``WORDS`` distinct words of one story, the first ``replaced`` swapped for new ones.
+
+    With single-word shingles the Jaccard similarity to the original is
+    ``(WORDS - replaced) / (WORDS + replaced)``.
+    """
+    return " ".join(f"s{story}x{i}" if i < replaced else f"s{story}w{i}" for i in range(WORDS))
+
+
+@pytest.fixture
+def small_rebuilds(monkeypatch):
+    monkeypatch.setattr(near_duplicates, "REBUILD_EVERY", 16)
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.7, 0.8, 0.9])
+def test_band_layout_knee_is_below_the_threshold(threshold):
+    bands, rows = band_layout(threshold)
+    assert bands * rows == near_duplicates.NUM_PERM
+    assert (1 / bands) ** (1 / rows) <= threshold - 0.05
+
+
+def test_recall_around_the_threshold(small_rebuilds):
+    index = NearDuplicateIndex(threshold=0.8, capacity=1000, shingle_words=1)
+    stories = range(200)
+    for story in stories:  # indexed partly in the sorted array, partly pending
+        assert index.check_and_add(_text(story)) == 0.0
+
+    def flagged(replaced: int) -> float:
+        hits = 0
+        for story in stories:
+            sig = index.signature(_text(story, replaced))
+            best = float((index._sigs[: len(index)] == sig).mean(axis=1).max())
+            found = index.query(sig)
+            assert found in (0.0, best)  # a candidate is always verified exactly
+            hits += found >= index.threshold
+        return hits / len(stories)
+
+    assert flagged(replaced=10) >= 0.97  # Jaccard 0.90
+    assert flagged(replaced=18) >= 0.75  # Jaccard 0.83, just above
+    assert flagged(replaced=50) <= 0.02  # Jaccard 0.60
+
+
+def test_banding_finds_every_pair_whose_signatures_agree(small_rebuilds):
+    index = NearDuplicateIndex(threshold=0.8, capacity=1000, shingle_words=1)
+    sigs = [index.signature(_text(story)) for story in range(100)]
+    for sig in sigs:
+        index.add(sig)
+    missed = 0
+    for story, sig in enumerate(sigs):
+        variant = index.signature(_text(story, replaced=14))
+        if (variant == sig).mean() >= index.threshold:
+            missed += index.query(variant) < index.threshold
+    assert missed == 0
+
+
+def test_ring_evicts_the_oldest_and_resort_drops_their_keys(small_rebuilds):
+    index = NearDuplicateIndex(threshold=0.8, capacity=32, shingle_words=1)
+    for story in range(96):
+        index.add(index.signature(_text(story)))
+
+    assert len(index) == 32
+    # the rebuild at 96 adds was a full re-sort: only the live ring's keys remain
+    assert index._sorted_at == 96 and not index._pending
+    assert len(index._sorted_keys) == 32 * index.bands
+    assert all(index.query(index.signature(_text(story))) == 0.0 for story in range(64))
+    assert all(index.query(index.signature(_text(story))) == 1.0 for story in range(64, 96))
+
+    # between re-sorts, keys of overwritten slots are still in the array but never match
+    for story in range(96, 120):
+        index.add(index.signature(_text(story)))
+    assert len(index._sorted_keys) > 32 * index.bands
+    assert all(index.query(index.signature(_text(story))) == 0.0 for story in range(88))
+    assert all(index.query(index.signature(_text(story))) == 1.0 for story in range(88, 120))
+    assert index.check_and_add(_text(119, replaced=2)) > 0.8
+    assert index.stats()["near_duplicates"] == 1
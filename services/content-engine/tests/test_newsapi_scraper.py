@@ -0,0 +1,113 @@
+# services/content-engine/tests/test_newsapi_scraper.py
+"""NewsAPIScraper: a failed page does not end the stream; the file-backed daily quota."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from scraping import newsapi_scraper
+from scraping.http_cache import ResponseCache
+from scraping.newsapi_scraper import NewsAPIScraper, RequestQuota
+
+
+def _page(page: int, total: int) -> dict:
+    return {
+        "status": "ok",
+        "totalResults": total,
+        "articles": [
+            {
+                "title": f"page {page} story {i}",
+                "url": f"https://example.com/{page}/{i}",
+                "content": f"{' '.join(['word'] * 20)} {page} {i}",
+                "publishedAt": datetime.utcnow().isoformat() + "Z",
+                "source": {"name": "Example"},
+            }
+            for i in range(10)
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_page_is_skipped(monkeypatch, tmp_path):
+    """Page 2 answers with a broken body and page 3 with a 500; pages 1 and 4 still arrive."""
+
+    async def handler(request: web.Request) -> web.Response:
+        page = int(request.query["page"])
+        if page == 2:
+            return web.Response(text="{not json", content_type="application/json")
+        if page == 3:
+            raise web.HTTPInternalServerError()
+        return web.json_response(_page(page, 400))
+
+    app = web.Application()
+    app.router.add_get("/top-headlines", handler)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    monkeypatch.setattr(newsapi_scraper, "NEWSAPI_BASE", f"http://127.0.0.1:{server.port}")
+    try:
+        scraper = NewsAPIScraper(
+            api_key="k",
+            min_words=1,
+            response_cache=ResponseCache(),
+            quota=RequestQuota(path=tmp_path / "quota.json"),
+        )
+        titles = [a.title async for a in scraper.stream(max_articles=400)]
+    finally:
+        await server.close()
+
+    assert sorted(titles) == sorted(f"page {p} story {i}" for p in (1, 4) for i in range(10))
+    assert scraper.quota.used == 4
+
+
+def test_quota_stops_at_the_reserve_and_survives_a_restart(tmp_path):
+    path = tmp_path / "quota.json"
+    quota = RequestQuota(daily_limit=5, reserve=2, path=path)
+    assert [quota.try_consume() for _ in range(4)] == [True, True, True, False]
+    assert quota.used == 3
+
+    again = RequestQuota(daily_limit=5, reserve=2, path=path)
+    assert again.used == 3
+    assert again.remaining == 0
+    assert not again.try_consume()
+
+
+def test_exhaust_spends_the_rest_of_the_day(tmp_path):
+    path = tmp_path / "quota.json"
+    quota = RequestQuota(daily_limit=100, reserve=5, path=path)
+    quota.try_consume()
+    quota.exhaust()
+    assert quota.remaining == 0
+    assert RequestQuota(daily_limit=100, reserve=5, path=path).remaining == 0
+
+
+def test_quota_resets_on_a_new_utc_day(monkeypatch, tmp_path):
+    class Clock(datetime):
+        today = datetime(2026, 3, 1, 23, 59)
+
+        @classmethod
+        def utcnow(cls):
+            return cls.today
+
+    monkeypatch.setattr(newsapi_scraper, "datetime", Clock)
+    path = tmp_path / "quota.json"
+    quota = RequestQuota(daily_limit=3, reserve=0, path=path)
+    quota.exhaust()
+    assert not quota.try_consume()
+
+    Clock.today = datetime(2026, 3, 2, 0, 1)
+    assert quota.try_consume()
+    assert json.loads(path.read_text()) == {"day": "2026-03-02", "used": 1}
+    # yesterday's count in the file is ignored by a fresh instance too
+    path.write_text(json.dumps({"day": "2026-03-01", "used": 3}))
+    assert RequestQuota(daily_limit=3, reserve=0, path=path).remaining == 3
+
+
+def test_unreadable_quota_file_starts_from_zero(tmp_path):
+    path = tmp_path / "quota.json"
+    path.write_text("{broken")
+    assert RequestQuota(daily_limit=10, reserve=0, path=path).remaining == 10
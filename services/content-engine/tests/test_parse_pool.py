@@ -0,0 +1,68 @@
+# services/content-engine/tests/test_parse_pool.py
+"""Parse pool: inline when disabled, out of process when enabled, inline after a crash."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from conftest import rss_feed
+from scraping import base
+from scraping.base import configure_parse_pool, run_in_parse_pool, shutdown_parse_pool
+from scraping.rss_scraper import RSSScraper
+
+MAIN_PID = os.getpid()
+
+
+def _pid() -> int:
+    return os.getpid()
+
+
+def _crash_in_worker(parent: int) -> str:
+    if os.getpid() != parent:
+        os._exit(1)
+    return "inline"
+
+
+@pytest.fixture
+def parse_pool():
+    configure_parse_pool(1)
+    try:
+        yield
+    finally:
+        configure_parse_pool(0)
+        shutdown_parse_pool()
+
+
+@pytest.mark.asyncio
+async def test_disabled_pool_runs_inline():
+    configure_parse_pool(0)
+    assert await run_in_parse_pool(_pid) == MAIN_PID
+    assert base._parse_pool is None
+
+
+@pytest.mark.asyncio
+async def test_enabled_pool_runs_in_a_worker(parse_pool):
+    assert await run_in_parse_pool(_pid) != MAIN_PID
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_retries_inline_and_is_recreated(parse_pool):
+    assert await run_in_parse_pool(_crash_in_worker, MAIN_PID) == "inline"
+    assert base._parse_pool is None
+    assert await run_in_parse_pool(_pid) != MAIN_PID
+
+
+@pytest.mark.asyncio
+async def test_pool_parses_feeds_like_the_event_loop(feed_server, parse_pool):
+    server, feeds, _ = feed_server
+    feeds["pooled"] = (rss_feed("pooled", 5), 0)
+    sources = [{"name": "pooled", "url": f"http://127.0.0.1:{server.port}/feed/pooled"}]
+
+    pooled = [(a.title, a.content) async for a in RSSScraper(sources=sources, min_words=1).stream()]
+    configure_parse_pool(0)
+    inline = [(a.title, a.content) async for a in RSSScraper(sources=sources, min_words=1).stream()]
+
+    assert pooled == inline
+    assert [title for title, _ in pooled] == [f"pooled story {i}" for i in range(5)]
@@ -0,0 +1,70 @@
+# services/content-engine/tests/test_poll_schedule.py
+"""PollSchedule: EWMA of the publish gap, clamping, quiet feeds backing off."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from scraping.poll_schedule import PollSchedule
+
+FEED = "https://example.com/feed"
+NOW = datetime(2026, 3, 2, 12, 0)
+
+
+def _stamps(gap_minutes: float, count: int, newest: datetime = NOW) -> list:
+    return [newest - timedelta(minutes=gap_minutes * i) for i in range(count)]
+
+
+@pytest.fixture
+def schedule(tmp_path):
+    return PollSchedule(min_minutes=5, max_minutes=240, default_minutes=30, alpha=0.3, path=tmp_path / "s.json")
+
+
+def test_ewma_of_the_median_gap(schedule):
+    schedule.observe(FEED, _stamps(10, 5), now=NOW)
+    assert schedule.describe(FEED)["publish_interval_minutes"] == 10
+
+    later = NOW + timedelta(hours=2)
+    schedule.observe(FEED, _stamps(20, 5, later), newest=NOW, now=later)
+    assert schedule.describe(FEED)["publish_interval_minutes"] == 13  # 0.3 * 20 + 0.7 * 10
+
+    # entries already seen (none newer than ``newest``) are not a new sample
+    schedule.observe(FEED, _stamps(1, 5, later), newest=later, now=later)
+    assert schedule.describe(FEED)["publish_interval_minutes"] == 13
+
+
+@pytest.mark.parametrize(
+    "gap_minutes, poll_minutes",
+    [(1, 5), (10, 10), (600, 240)],
+    ids=["floor", "inside", "ceiling"],
+)
+def test_poll_interval_is_clamped(schedule, gap_minutes, poll_minutes):
+    schedule.observe(FEED, _stamps(gap_minutes, 4), now=NOW)
+    assert schedule.describe(FEED)["poll_interval_minutes"] == poll_minutes
+    assert not schedule.is_due(FEED, NOW + timedelta(minutes=poll_minutes) - schedule.grace - timedelta(seconds=1))
+    assert schedule.is_due(FEED, NOW + timedelta(minutes=poll_minutes) - schedule.grace)
+
+
+def test_quiet_feed_backs_off(schedule):
+    schedule.observe(FEED, _stamps(10, 5), now=NOW)
+    quiet = NOW + timedelta(hours=3)
+    schedule.observe(FEED, (), newest=NOW, now=quiet)  # 304
+    assert schedule.describe(FEED)["publish_interval_minutes"] == 61  # 0.3 * 180 + 0.7 * 10
+
+
+def test_unknown_rate_uses_the_default_and_errors_keep_it(schedule):
+    assert schedule.is_due(FEED)
+    schedule.observe(FEED, [NOW], now=NOW)  # a single entry says nothing about the rate
+    assert schedule.describe(FEED)["poll_interval_minutes"] == 30
+    schedule.observe(FEED, _stamps(10, 5), now=NOW)
+    schedule.polled(FEED, now=NOW)
+    assert schedule.describe(FEED)["publish_interval_minutes"] == 10
+
+
+def test_saved_and_reloaded(schedule):
+    schedule.observe(FEED, _stamps(10, 5), now=NOW)
+    schedule.save()
+    reloaded = PollSchedule(min_minutes=5, max_minutes=240, path=schedule.path)
+    assert reloaded.describe(FEED)["next_due"] == (NOW + timedelta(minutes=10)).isoformat()
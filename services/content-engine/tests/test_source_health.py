@@ -0,0 +1,55 @@
+# services/content-engine/tests/test_source_health.py
+"""SourceHealth circuit breaker: a single half-open probe."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from scraping.source_health import HALF_OPEN, OPEN, PROBE_LEASE, SourceHealth
+
+URL = "https://feeds.example.com/rss"
+
+
+def tripped(tmp_path) -> SourceHealth:
+    health = SourceHealth(failure_threshold=1, cooldown_minutes=5, path=tmp_path / "health.json")
+    health.record_failure(URL, "timeout")
+    return health
+
+
+def test_only_one_probe_after_cooldown(tmp_path):
+    health = tripped(tmp_path)
+    later = datetime.utcnow() + timedelta(minutes=6)
+
+    assert health.allow(URL, now=later)
+    assert health.describe(URL)["state"] == HALF_OPEN
+    assert not health.allow(URL, now=later)
+    assert not health.allow(URL, now=later + timedelta(seconds=30))
+
+
+def test_failed_probe_reopens_with_longer_cooldown(tmp_path):
+    health = tripped(tmp_path)
+    later = datetime.utcnow() + timedelta(minutes=6)
+    assert health.allow(URL, now=later)
+
+    health.record_failure(URL, "timeout", now=later)
+    assert health.describe(URL)["state"] == OPEN
+    assert not health.allow(URL, now=later + timedelta(minutes=6))  # cooldown doubled to 10 min
+    assert health.allow(URL, now=later + timedelta(minutes=11))
+
+
+def test_successful_probe_closes(tmp_path):
+    health = tripped(tmp_path)
+    later = datetime.utcnow() + timedelta(minutes=6)
+    assert health.allow(URL, now=later)
+
+    health.record_success(URL, 120.0)
+    assert health.allow(URL, now=later) and health.allow(URL, now=later)
+
+
+def test_lost_probe_is_replaced_after_its_lease(tmp_path):
+    health = tripped(tmp_path)
+    later = datetime.utcnow() + timedelta(minutes=6)
+    assert health.allow(URL, now=later)
+
+    assert not health.allow(URL, now=later + PROBE_LEASE - timedelta(seconds=1))
+    assert health.allow(URL, now=later + PROBE_LEASE)
@@ -0,0 +1,82 @@
+# services/content-engine/tests/test_sources_api.py
+"""GET /scraping/sources: registry pages, COUNT totals, defaults before startup, auth-only details."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.scraping import router
+from config import get_settings
+from scraping.rss_scraper import DEFAULT_RSS_SOURCES
+from scraping.source_health import SourceHealth
+from scraping.source_registry import SourceRegistry
+
+KEY = {"X-API-Key": "test-key"}
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(get_settings(), "engine_api_key", KEY["X-API-Key"])
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture
+def pipeline(app, tmp_path):
+    seed = [{"name": f"feed {i:04d}", "url": f"https://feeds{i}.example.com/rss"} for i in range(1200)]
+    registry = SourceRegistry(path=tmp_path / "sources.db", seed=seed)
+    registry.add("feed 0003", seed[3]["url"], enabled=False)
+    health = SourceHealth(failure_threshold=1, path=tmp_path / "health.json")
+    health.record_failure(seed[7]["url"], "timeout")
+    app.state.pipeline = SimpleNamespace(registry=registry, source_health=health, poll_schedule=None, websub=None)
+    return app.state.pipeline
+
+
+def _rss(body: dict) -> list:
+    return [s for s in body["sources"] if s["type"] == "rss"]
+
+
+def test_sources_page_and_totals(app, pipeline):
+    pages = []
+    registry_all = pipeline.registry.all
+
+    def spy(limit: int = -1, offset: int = 0):
+        pages.append((limit, offset))
+        return registry_all(limit, offset)
+
+    pipeline.registry.all = spy  # type: ignore[method-assign]
+
+    body = TestClient(app).get("/scraping/sources", params={"limit": 5, "offset": 2}, headers=KEY).json()
+
+    assert pages == [(5, 2)]
+    rss = _rss(body)
+    assert [s["name"] for s in rss] == [f"feed {i:04d}" for i in range(2, 7)]
+    assert all("health" in s for s in rss)
+    others = len(body["sources"]) - len(rss)
+    assert body["total_sources"] == 1200 + others
+    active_others = sum(1 for s in body["sources"] if s["type"] != "rss" and s["active"])
+    assert body["active_sources"] == 1200 - 2 + active_others  # one disabled, one open breaker
+
+
+def test_breaker_and_schedule_details_need_a_key(app, pipeline):
+    client = TestClient(app)
+    anonymous = _rss(client.get("/scraping/sources", params={"limit": 10}).json())
+    assert [s["active"] for s in anonymous].count(False) == 2
+    assert not any({"health", "schedule", "websub", "polled_by"} & s.keys() for s in anonymous)
+
+    wrong = _rss(client.get("/scraping/sources", params={"limit": 10}, headers={"X-API-Key": "nope"}).json())
+    assert wrong == anonymous
+
+    detailed = _rss(client.get("/scraping/sources", params={"limit": 10}, headers=KEY).json())
+    assert detailed[7]["health"]["state"] == "open"
+
+
+def test_configured_defaults_before_the_pipeline_starts(app):
+    body = TestClient(app).get("/scraping/sources").json()
+    assert [(s["name"], s["url"]) for s in _rss(body)] == [(s["name"], s["url"]) for s in DEFAULT_RSS_SOURCES]
+    assert body["total_sources"] == len(body["sources"])
@@ -0,0 +1,106 @@
+# services/content-engine/tests/test_tradingview_scraper.py
+"""TradingViewScraper parsing: table slicing, column maps, merging, region resolution."""
+
+from __future__ import annotations
+
+import pytest
+
+from scraping.tradingview_scraper import (
+    INDEX_URL,
+    REGION_PAGES,
+    IndexQuote,
+    TradingViewScraper,
+)
+
+
+def _row(symbol: str, name: str, *cells: str, extra: str = "") -> str:
+    tds = "".join(f"<td>{c}</td>" for c in cells)
+    return f'<tr data-symbol="{symbol}"><td><a>{symbol}</a><span>{name}</span>{extra}</td>{tds}</tr>'
+
+
+# Header order differs from TradingView's default (change % before last)
+HEADED_PAGE = f"""<html><body><nav><ul><li>Markets</li></ul></nav>
+<table class="quotes">
+<thead><tr><th>Symbol</th><th>Chg %</th><th>Price</th><th>Chg</th><th>High</th><th>Low</th><th>Curr</th></tr></thead>
+<tbody>
+{_row("SPX", "S&amp;P 500", "+0.50%", "5,100.25", "25.10", "5,110.00", "5,080.00", "usd",
+      extra='<table class="tooltip"><tr><td>52w</td><td>4,100</td><td>5,200</td><td>x</td></tr></table>')}
+{_row("NIFTY", "Nifty 50", "−1.20%", "₹22,000.5", "−267.3", "22,300", "21,950", "")}
+</tbody>
+</table>
+<table class="footer"><tr><td>ignored</td></tr></table>
+</body></html>"""
+
+# No header; fields found through data-label attributes on the first row
+LABELLED_PAGE = """<table><tbody>
+<tr><td data-label="Ticker"><a>DAX</a> German 40</td><td data-label="Exchange">XETR</td>
+<td data-label="Last">18,000</td><td data-label="Change %">0.1%</td><td data-label="Country">DE</td></tr>
+</tbody></table>"""
+
+# Neither header nor labels: TradingView's default column order
+BARE_PAGE = "<table><tr><td>UKX FTSE 100</td><td>£7,900</td><td>-0.3%</td><td>-23.7</td><td>7,950</td><td>7,880</td></tr></table>"
+
+
+def test_nested_table_does_not_cut_the_rows_short():
+    table = TradingViewScraper._find_table(HEADED_PAGE)
+    assert table.get("class") == "quotes"
+    quotes = list(TradingViewScraper()._parse_rows(HEADED_PAGE))
+    assert [q.symbol for q in quotes] == ["SPX", "NIFTY"]
+
+
+def test_header_labels_drive_the_column_map():
+    spx, nifty = TradingViewScraper()._parse_rows(HEADED_PAGE)
+    assert (spx.name, spx.last, spx.change_percent, spx.change, spx.high, spx.low, spx.currency) == (
+        "S&P 500", 5100.25, 0.5, 25.1, 5110.0, 5080.0, "USD",
+    )
+    assert (nifty.last, nifty.change, nifty.change_percent) == (22000.5, -267.3, -1.2)
+    assert nifty.currency == "INR"  # empty column → guessed from the price prefix
+
+
+def test_data_labels_when_there_is_no_header():
+    table = TradingViewScraper._find_table(LABELLED_PAGE)
+    columns = TradingViewScraper._column_map(table, table.find("tbody").findall("tr"))
+    assert columns["exchange"] == 1 and columns["last"] == 2
+    assert columns["change_percent"] == 3 and columns["country"] == 4
+    assert columns["high"] == 4  # unresolved → default position
+
+    [dax] = TradingViewScraper()._parse_rows(LABELLED_PAGE)
+    assert (dax.symbol, dax.name, dax.exchange, dax.last, dax.country) == ("DAX", "German 40", "XETR", 18000.0, "DE")
+
+
+def test_default_columns_and_limit():
+    [ukx] = TradingViewScraper()._parse_rows(BARE_PAGE)
+    assert (ukx.symbol, ukx.name, ukx.last, ukx.change_percent, ukx.change, ukx.currency) == (
+        "UKX", "FTSE 100", 7900.0, -0.3, -23.7, "GBP",
+    )
+    assert len(list(TradingViewScraper()._parse_rows(HEADED_PAGE, limit=1))) == 1
+
+
+def test_missing_table_raises():
+    assert TradingViewScraper._find_table("<html><body>maintenance</body></html>") is None
+    with pytest.raises(RuntimeError):
+        list(TradingViewScraper()._parse_rows("<html></html>"))
+
+
+def test_merge_fills_only_missing_fields():
+    first = [IndexQuote("SPX", "S&P 500", last=5100.0), IndexQuote("NDX", "Nasdaq 100", last=18000.0)]
+    second = [IndexQuote("SPX", "S&P", last=1.0, exchange="CBOE"), IndexQuote("DAX", "DAX", last=18100.0)]
+    merged = TradingViewScraper._merge([first, second])
+    assert [q.symbol for q in merged] == ["SPX", "NDX", "DAX"]
+    spx = merged[0]
+    assert (spx.name, spx.last, spx.exchange) == ("S&P 500", 5100.0, "CBOE")
+
+
+@pytest.mark.parametrize(
+    "regions, expected",
+    [
+        (["us"], {"americas": REGION_PAGES["americas"]}),
+        (["US", "usa", "americas"], {"americas": REGION_PAGES["americas"]}),
+        (["uk", " India "], {"europe": REGION_PAGES["europe"], "asia": REGION_PAGES["asia"]}),
+        (["world"], {"all": INDEX_URL}),
+        (["atlantis", ""], {"all": INDEX_URL}),
+        (["https://example.com/indices/"], {"https://example.com/indices/": "https://example.com/indices/"}),
+    ],
+)
+def test_region_pages(regions, expected):
+    assert TradingViewScraper.region_pages(regions) == expected
@@ -0,0 +1,102 @@
+# services/content-engine/tests/test_url_canon.py
+"""canonical_url: each rewrite rule, URLs it must keep apart, non-http input."""
+
+from __future__ import annotations
+
+import pytest
+
+from utils.url_canon import canonical_url, url_fingerprint
+
+BASE = "//example.com/news/story"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/news/story",
+        "http://example.com/news/story",
+        "HTTPS://Example.COM/news/story",
+        "https://www.example.com/news/story",
+        "https://m.example.com/news/story",
+        "https://amp.example.com/news/story",
+        "https://example.com:443/news/story",
+        "http://example.com:80/news/story",
+        "https://example.com/news/story/",
+        "https://example.com//news//story",
+        "https://example.com/news/story/index.html",
+        "https://example.com/news/story#comments",
+        "https://example.com/news/story?utm_source=rss&utm_medium=feed",
+        "https://example.com/news/story?fbclid=abc&gclid=def",
+        "https://example.com/news/story?ref_src=twsrc",
+        "https://example.com/news/story?ref=rss",
+        "https://example.com/news/story?ref=Twitter",
+        "https://example.com/news/story/amp",
+        "https://example.com/news/story.amp",
+        "https://example.com/amp/news/story",
+        "https://example.com/news/story?amp=1",
+        "https://example.com/news/story?outputType=amp",
+        "https://example-com.cdn.ampproject.org/c/s/example.com/news/story",
+        "https://www.google.com/amp/s/www.example.com/news/story",
+        "https://example.com/news/st%6Fry",
+        "https://example.com/%6Eews/story",
+    ],
+)
+def test_variants_collapse(url):
+    assert canonical_url(url) == BASE
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://edition.cnn.com/a", "//cnn.com/a"),
+        ("https://www.bbc.co.uk/a", "//bbc.com/a"),
+        ("https://uk.reuters.com/a", "//reuters.com/a"),
+        ("https://example.com:8080/a", "//example.com:8080/a"),
+        ("https://example.com/a?b=2&a=1", "//example.com/a?a=1&b=2"),
+        ("https://example.com/a?output=json", "//example.com/a?output=json"),
+        ("https://github.com/org/repo?ref=main", "//github.com/org/repo?ref=main"),
+        ("https://shop.example.com/p?ref=B01234", "//shop.example.com/p?ref=B01234"),
+        ("https://example.com/~user/a%7Eb", "//example.com/~user/a~b"),
+        ("https://example.com/a%2fb", "//example.com/a%2Fb"),
+        ("https://example.com/caf%c3%a9", "//example.com/caf%C3%A9"),
+        ("https://example.com/café", "//example.com/caf%C3%A9"),
+        ("https://example.com/a b", "//example.com/a%20b"),
+        ("https://example.com/a?q=%7E", "//example.com/a?q=~"),
+        ("https://example.com/a?q=a%20b", "//example.com/a?q=a+b"),
+        ("https://example.com/a?q=a+b", "//example.com/a?q=a+b"),
+        ("https://co.uk/a", "//co.uk/a"),
+        ("https://www.com/a", "//www.com/a"),
+    ],
+)
+def test_canonical_form(url, expected):
+    assert canonical_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ("https://example.com/a", "https://example.com/b"),
+        ("https://example.com/a", "https://other.com/a"),
+        ("https://example.com/a?id=1", "https://example.com/a?id=2"),
+        ("https://example.com/a/b", "https://example.com/a%2Fb"),
+        ("https://github.com/x?ref=main", "https://github.com/x?ref=dev"),
+        ("https://example.com/a", "https://example.com:8080/a"),
+    ],
+)
+def test_distinct_urls_stay_apart(a, b):
+    assert canonical_url(a) != canonical_url(b)
+    assert url_fingerprint(a) != url_fingerprint(b)
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["", "not a url", "ftp://example.com/a", "mailto:someone@example.com",
+     "javascript:alert(1)", "https://", "https://example.com:99999/a"],
+)
+def test_non_http_input(url):
+    assert canonical_url(url) is None
+    assert url_fingerprint(url) is None
+
+
+def test_fingerprint_matches_for_variants():
+    assert url_fingerprint("https://www.example.com/a/?utm_source=x") == url_fingerprint("http://example.com/a")
@@ -0,0 +1,187 @@
+# services/content-engine/tests/test_websub.py
+"""WebSub against the local hub in ``scripts/``: verification, leases, signed and oversized deliveries."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import sys
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+import pytest_asyncio
+import uvicorn
+from aiohttp.test_utils import TestServer
+from fastapi import FastAPI
+
+from conftest import ENGINE_ROOT, rss_feed
+from api.websub_routes import router
+from scraping.rss_scraper import RSSScraper
+from scraping.websub import CALLBACK_PATH, WebSubSubscriber
+from utils.http_client import HttpClient
+
+sys.path.insert(0, str(ENGINE_ROOT / "scripts"))
+from websub_local_hub import LocalHub  # noqa: E402
+
+MAX_BYTES = 64 * 1024
+
+
+async def _eventually(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.02)
+
+
+@pytest_asyncio.fixture
+async def hub():
+    hub = LocalHub("")
+    server = TestServer(hub.app(), host="127.0.0.1")
+    await server.start_server()
+    hub.base_url = f"http://127.0.0.1:{server.port}"
+    try:
+        yield hub
+    finally:
+        await server.close()
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    """The WebSub routes served by uvicorn, with a pipeline stand-in that records pushes."""
+    http = HttpClient()
+    pushes = []
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, ws="none", log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    await _eventually(lambda: server.started)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    websub = WebSubSubscriber(f"http://127.0.0.1:{port}", http, lease_seconds=600, path=tmp_path / "websub.json")
+    app.state.pipeline = SimpleNamespace(
+        websub=websub,
+        rss=RSSScraper(min_words=1, max_bytes=MAX_BYTES),
+        accept_push=lambda feed_url, body, charset: pushes.append((feed_url, body, charset)) or True,
+    )
+    try:
+        yield SimpleNamespace(websub=websub, pushes=pushes, base=f"http://127.0.0.1:{port}", pipeline=app.state.pipeline)
+    finally:
+        server.should_exit = True
+        await task
+        await http.close()
+
+
+async def _subscribe(hub, engine, name: str = "demo") -> str:
+    topic = f"{hub.base_url}/topics/{name}"
+    engine.websub.discovered(topic, f"{hub.base_url}/", topic)
+    await engine.websub.sync([topic])
+    await _eventually(lambda: engine.websub.is_active(topic))
+    await _eventually(lambda: any(t == topic for t, _ in hub.subs))
+    return topic
+
+
+def _callback(engine, topic: str) -> str:
+    return f"{engine.base}{CALLBACK_PATH}/{engine.websub._subs[topic]['token']}"
+
+
+def _signed(engine, topic: str, body: bytes) -> dict:
+    secret = engine.websub._subs[topic]["secret"].encode()
+    return {"X-Hub-Signature": "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest()}
+
+
+@pytest.mark.asyncio
+async def test_subscribe_is_verified_and_deliveries_arrive_signed(hub, engine):
+    topic = await _subscribe(hub, engine)
+    lease = datetime.fromisoformat(engine.websub.describe(topic)["lease_expires"]) - datetime.utcnow()
+    assert timedelta(seconds=590) < lease <= timedelta(seconds=600)
+
+    async with aiohttp.ClientSession() as session:
+        async with session.post(f"{hub.base_url}/topics/demo/items", params={"title": "Pushed"}) as resp:
+            assert resp.status == 201
+    await _eventually(lambda: engine.pushes)
+    feed_url, body, charset = engine.pushes[0]
+    assert feed_url == topic and b"<title>Pushed</title>" in body
+    assert engine.websub.stats()["pushes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_verification_with_the_wrong_token_or_topic_is_refused(hub, engine):
+    topic = await _subscribe(hub, engine)
+    params = {"hub.mode": "subscribe", "hub.topic": topic, "hub.challenge": "abc"}
+    async with aiohttp.ClientSession() as session:
+        async with session.get(_callback(engine, topic), params=params) as resp:
+            assert (resp.status, await resp.text()) == (200, "abc")
+        async with session.get(f"{engine.base}{CALLBACK_PATH}/not-a-token", params=params) as resp:
+            assert resp.status == 404
+        other = {**params, "hub.topic": f"{hub.base_url}/topics/other"}
+        async with session.get(_callback(engine, topic), params=other) as resp:
+            assert resp.status == 404
+        async with session.post(f"{engine.base}{CALLBACK_PATH}/not-a-token", data=b"x") as resp:
+            assert resp.status == 410
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_falls_back_to_polling(hub, engine):
+    topic = await _subscribe(hub, engine)
+    params = {"hub.mode": "subscribe", "hub.topic": topic, "hub.challenge": "c", "hub.lease_seconds": "60"}
+    async with aiohttp.ClientSession() as session:
+        async with session.get(_callback(engine, topic), params=params) as resp:
+            assert resp.status == 200
+    assert engine.websub.is_active(topic, datetime.utcnow() + timedelta(seconds=59))
+    assert not engine.websub.is_active(topic, datetime.utcnow() + timedelta(seconds=61))
+
+    # the hub stops delivering once its side of the lease has run out
+    for sub in hub.subs.values():
+        sub["expires"] = time.time() - 1
+    await hub.distribute(topic)
+    assert engine.pushes == []
+
+
+@pytest.mark.asyncio
+async def test_bad_signature_is_acknowledged_and_dropped(hub, engine):
+    topic = await _subscribe(hub, engine)
+    body = rss_feed("demo", 1).encode()
+    async with aiohttp.ClientSession() as session:
+        for headers in ({"X-Hub-Signature": "sha256=" + "0" * 64}, {"X-Hub-Signature": "md5=abc"}, {}):
+            async with session.post(_callback(engine, topic), data=body, headers=headers) as resp:
+                assert resp.status == 202
+    assert engine.pushes == []
+    assert engine.websub.stats()["bad_signature"] == 3
+
+
+@pytest.mark.asyncio
+async def test_body_in_a_declared_non_utf8_charset(hub, engine):
+    topic = await _subscribe(hub, engine)
+    body = rss_feed("demo", 1).replace("demo story 0", "Zürich öffnet").encode("iso-8859-1")
+    headers = {"Content-Type": "application/rss+xml; charset=ISO-8859-1", **_signed(engine, topic, body)}
+    async with aiohttp.ClientSession() as session:
+        async with session.post(_callback(engine, topic), data=body, headers=headers) as resp:
+            assert resp.status == 202
+    [(feed_url, raw, charset)] = engine.pushes
+    assert charset == "ISO-8859-1"
+    articles = await engine.pipeline.rss.parse_pushed(raw, {"name": "demo", "url": feed_url}, charset)
+    assert [a.title for a in articles] == ["Zürich öffnet"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunked", [False, True], ids=["content-length", "chunked"])
+async def test_oversized_body_is_refused_before_the_signature_check(hub, engine, chunked):
+    topic = await _subscribe(hub, engine)
+    body = b"x" * (MAX_BYTES + 1)
+
+    async def chunks():
+        for i in range(0, len(body), 8192):
+            yield body[i:i + 8192]
+
+    async with aiohttp.ClientSession() as session:
+        data = chunks() if chunked else body
+        async with session.post(_callback(engine, topic), data=data, headers=_signed(engine, topic, body)) as resp:
+            assert resp.status == 413
+        at_cap = body[:MAX_BYTES]
+        async with session.post(_callback(engine, topic), data=at_cap, headers=_signed(engine, topic, at_cap)) as resp:
+            assert resp.status == 202
+    assert [len(raw) for _, raw, _ in engine.pushes] == [MAX_BYTES]
+    assert engine.websub.stats()["bad_signature"] == 0
@@ -1,7 +1,8 @@
 # services/content-engine/utils/__init__.py
-"""Utility package — HTTP helpers, text processing."""
+"""Utility package — HTTP helpers, text processing, URL canonicalisation."""
 
 from .http_client import HttpClient
 from .text_processing import word_count, reading_time, truncate_words
+from .url_canon import canonical_url, url_fingerprint
 
-__all__ = ["HttpClient", "word_count", "reading_time", "truncate_words"]
+__all__ = ["HttpClient", "word_count", "reading_time", "truncate_words", "canonical_url", "url_fingerprint"]
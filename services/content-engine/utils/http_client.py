@@ -1,5 +1,11 @@
 # services/content-engine/utils/http_client.py
-"""Reusable async HTTP client with retry, timeout, and header defaults."""
+"""Reusable async HTTP client with retry, timeout, and header defaults.
+
+One ``HttpClient`` owns one ``aiohttp.ClientSession`` on a tuned
+``TCPConnector``, so connection pooling, keep-alive, the DNS cache and TLS
+session reuse carry across calls.  The pipeline shares a single instance
+with every scraper.
+"""
 
 from __future__ import annotations
 
@@ -21,20 +27,83 @@ class HttpClient:
         base_url: str = "",
         headers: Dict[str, str] | None = None,
         timeout: aiohttp.ClientTimeout = DEFAULT_TIMEOUT,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        ttl_dns_cache: int = 10,
+        compress: bool = True,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.default_headers = headers or {}
         self.timeout = timeout
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.compress = compress
         self._session: Optional[aiohttp.ClientSession] = None
+        self._counters: Dict[str, int] = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        }
+
+    async def session(self) -> aiohttp.ClientSession:
+        """The pooled session (created lazily; callers must not close it)."""
+        return await self._ensure_session()
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=self.ttl_dns_cache > 0,
+            )
+            headers = dict(self.default_headers)
+            if not self.compress:
+                headers.setdefault("Accept-Encoding", "identity")
             self._session = aiohttp.ClientSession(
                 timeout=self.timeout,
-                headers=self.default_headers,
+                headers=headers,
+                connector=connector,
+                auto_decompress=self.compress,
+                trace_configs=[self._trace_config()],
             )
         return self._session
 
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection-pool utilisation and reuse counters."""
+        connector = self._session.connector if self._session and not self._session.closed else None
+        in_use = len(getattr(connector, "_acquired", ())) if connector else 0
+        idle = sum(len(c) for c in getattr(connector, "_conns", {}).values()) if connector else 0
+        created = self._counters["connections_created"]
+        reused = self._counters["connections_reused"]
+        return {
+            **self._counters,
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "in_use": in_use,
+            "idle": idle,
+            "utilisation": round(in_use / self.limit, 3) if self.limit else 0.0,
+            "reuse_rate": round(reused / (created + reused), 3) if created + reused else 0.0,
+        }
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        def bump(key: str):
+            async def handler(*_: Any) -> None:
+                self._counters[key] += 1
+            return handler
+
+        trace.on_request_start.append(bump("requests"))
+        trace.on_connection_create_end.append(bump("connections_created"))
+        trace.on_connection_reuseconn.append(bump("connections_reused"))
+        trace.on_dns_cache_hit.append(bump("dns_cache_hits"))
+        trace.on_dns_cache_miss.append(bump("dns_cache_misses"))
+        return trace
+
     async def close(self) -> None:
         if self._session and not self._session.closed:
             await self._session.close()
@@ -0,0 +1,140 @@
+# services/content-engine/utils/url_canon.py
+"""URL canonicalisation — one key per article, however it was linked.
+
+The same story reaches the pipeline as ``http://`` and ``https://``, with
+``www.`` / ``m.`` / ``amp.`` hosts, AMP paths, tracking parameters and
+trailing slashes.  ``canonical_url`` folds these into one form:
+  - scheme dropped (``//host/path``), host lowercased, default port and
+    ``www.`` / ``m.`` / ``mobile.`` / ``amp.`` prefixes removed, known
+    aliases mapped (``HOST_ALIASES``)
+  - Google AMP cache / viewer URLs unwrapped to the publisher URL
+  - AMP path variants (``/amp``, ``/amp/…``, ``.amp``, ``?amp=1``) removed
+  - tracking parameters dropped (``utm_*``, click ids, ``ref`` with a
+    referral value such as ``rss`` or ``twitter``, …), remaining
+    parameters sorted; fragment dropped
+  - percent-encoding normalised: escaped unreserved characters decoded
+    (``%7E`` → ``~``), other escapes upper-cased, raw non-ASCII encoded
+  - trailing slash and ``index.html`` / ``index.php`` removed
+
+Feedburner redirect links (``feedproxy.google.com/~r/…``) can only be
+resolved over HTTP; ``parse_feed`` uses the entry's ``feedburner:origLink``
+instead when the feed provides it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit
+
+# Hosts serving the same articles under another name
+HOST_ALIASES = {
+    "edition.cnn.com": "cnn.com",
+    "us.cnn.com": "cnn.com",
+    "bbc.co.uk": "bbc.com",
+    "uk.reuters.com": "reuters.com",
+    "in.reuters.com": "reuters.com",
+}
+
+_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+
+_TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "ref_src", "ref_url", "cmpid", "cmp", "ncid", "ocid", "ito",
+    "spm", "smid", "smtyp", "s_cid", "guccounter", "guce_referrer", "guce_referrer_sig",
+    "amp",
+})
+_TRACKING_PREFIXES = ("utm_", "at_", "pk_", "mtm_", "hsa_", "__hs")
+# dropped only with one of these values: ``?outputType=amp``, ``?ref=rss``
+# (elsewhere ``ref`` can select content, e.g. a branch or a product)
+_VALUE_PARAMS = {
+    "output": frozenset({"amp"}),
+    "outputtype": frozenset({"amp"}),
+    "ref": frozenset({
+        "rss", "feed", "feedly", "flipboard", "newsletter", "email", "mail",
+        "twitter", "twtr", "tw", "facebook", "fb", "linkedin", "reddit", "social", "share",
+        "hp", "homepage", "home", "nav", "menu", "sidebar", "related", "footer",
+        "google", "google_news", "yahoo", "msn", "apple_news", "upday",
+    }),
+}
+
+# /c/s/example.com/path on <domain>.cdn.ampproject.org, /amp/s/example.com/path on google.com
+_AMP_CACHE = re.compile(r"^[\w-]+\.cdn\.ampproject\.org$")
+_AMP_CACHE_PATH = re.compile(r"^/[a-z]/(?:s/)?(.+)$")
+_AMP_VIEWER_PATH = re.compile(r"^/amp/(?:s/)?(.+)$")
+_AMP_PATH = re.compile(r"(?:/amp|\.amp)(?=/?$)|^/amp(?=/)")
+_INDEX_PAGE = re.compile(r"/index\.(?:html?|php|aspx?)$")
+_ESCAPE = re.compile(r"%([0-9A-Fa-f]{2})")
+_UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+# RFC 3986 path characters (plus "%", so existing escapes survive ``quote``)
+_PATH_SAFE = "/:@!$&'()*+,;=-._~%"
+
+
+def canonical_url(url: str) -> Optional[str]:
+    """Canonical form of an http(s) URL, or None if ``url`` is not one."""
+    try:
+        parts = urlsplit(url.strip())
+        host = (parts.hostname or "").rstrip(".")
+        port = parts.port
+    except ValueError:
+        return None
+    if parts.scheme.lower() not in ("http", "https") or not host:
+        return None
+
+    path, query = parts.path, parts.query
+    unwrapped = _unwrap_amp_cache(host, path)
+    if unwrapped:
+        return canonical_url(unwrapped + (f"?{query}" if query else ""))
+
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") > 1:
+            host = host[len(prefix):]
+            break
+    host = HOST_ALIASES.get(host, host)
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    path = _ESCAPE.sub(_normalise_escape, quote(path, safe=_PATH_SAFE))
+    path = re.sub(r"/{2,}", "/", path)
+    path = _AMP_PATH.sub("", path)
+    path = _INDEX_PAGE.sub("/", path)
+    path = path.rstrip("/")
+
+    params = sorted(
+        (k, v) for k, v in parse_qsl(query, keep_blank_values=True)
+        if not _is_tracking(k, v)
+    )
+    return f"//{host}{path}" + (f"?{urlencode(params)}" if params else "")
+
+
+def url_fingerprint(url: str) -> Optional[int]:
+    """64-bit fingerprint of the canonical URL (None for non-http URLs)."""
+    canonical = canonical_url(url)
+    if canonical is None:
+        return None
+    return int.from_bytes(hashlib.blake2b(canonical.encode(), digest_size=8).digest(), "big")
+
+
+# ── internal ─────────────────────────────────────────────────────────
+
+def _is_tracking(key: str, value: str) -> bool:
+    key = key.lower()
+    if key in _VALUE_PARAMS:
+        return value.lower() in _VALUE_PARAMS[key]
+    return key in _TRACKING_PARAMS or key.startswith(_TRACKING_PREFIXES)
+
+
+def _normalise_escape(match: "re.Match[str]") -> str:
+    char = chr(int(match.group(1), 16))
+    return char if char in _UNRESERVED else f"%{match.group(1).upper()}"
+
+
+def _unwrap_amp_cache(host: str, path: str) -> Optional[str]:
+    """Publisher URL inside a Google AMP cache / viewer URL (the scheme is dropped anyway)."""
+    match = None
+    if _AMP_CACHE.match(host):
+        match = _AMP_CACHE_PATH.match(path)
+    elif host in ("google.com", "www.google.com"):
+        match = _AMP_VIEWER_PATH.match(path)
+    return f"https://{match.group(1)}" if match else None